@@ -22,6 +22,7 @@
         'project',
         'calendar',
         'web',
+        'mail',
         'helpdesk',
     ],
     'data': [
@@ -29,9 +30,21 @@
             'static/src/assets.xml',
             'views/zoom_meeting_views.xml',
             'views/zoom_meeting_attendee_views.xml',
+            'views/zoom_meeting_participant_views.xml',
+            'views/zoom_recording_views.xml',
             'views/zoom_dashboard_views.xml',
             'views/zoom_config_views.xml',
+            'views/zoom_host_views.xml',
+            'views/zoom_sync_run_views.xml',
+            'views/zoom_outbox_views.xml',
+            'views/zoom_reminder_views.xml',
+            'views/zoom_scheduled_job_views.xml',
+            'views/zoom_api_metric_views.xml',
+            'views/zoom_profile_views.xml',
+            'views/zoom_meeting_report_views.xml',
+            'views/project_project_views.xml',
             'views/calendar_event_views.xml',
+            'views/helpdesk_ticket_participant_views.xml',
             'views/helpdesk_ticket_views.xml',
             'data/zoom_data.xml',
             'data/email_templates.xml',
@@ -46,6 +59,25 @@
         'tests/test_zoom_dashboard.py',
         'tests/test_integration.py',
         'tests/test_helpdesk_integration.py',
+        'tests/test_zoom_sync.py',
+        'tests/test_zoom_outbox.py',
+        'tests/test_calendar_sync.py',
+        'tests/test_zoom_reminder.py',
+        'tests/test_zoom_scheduled_job.py',
+        'tests/test_zoom_mail_render.py',
+        'tests/test_zoom_meeting_participant.py',
+        'tests/test_helpdesk_ticket_participant.py',
+        'tests/test_zoom_recording.py',
+        'tests/test_zoom_fake_server.py',
+        'tests/test_zoom_benchmark.py',
+        'tests/test_zoom_query_count.py',
+        'tests/test_zoom_api_metric.py',
+        'tests/test_zoom_sync_telemetry.py',
+        'tests/test_zoom_profile.py',
+        'tests/test_zoom_logging.py',
+        'tests/test_zoom_dashboard_cache.py',
+        'tests/test_zoom_meeting_report.py',
+        'tests/test_project_task.py',
     ],
     'installable': True,
     'auto_install': False,
@@ -0,0 +1,4 @@
+# -*- coding: utf-8 -*-
+
+from . import zoom_webhook
+from . import zoom_metrics
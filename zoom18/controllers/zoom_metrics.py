@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+
+import ipaddress
+
+from odoo import http
+from odoo.http import request
+
+from ..models.zoom_logging import get_logger
+
+_logger = get_logger(__name__)
+
+PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+def is_local_address(address):
+    """True si la petición llega desde la propia máquina (127.0.0.1, ::1)"""
+    try:
+        return ipaddress.ip_address(address or '').is_loopback
+    except ValueError:
+        return False
+
+
+class ZoomMetricsController(http.Controller):
+
+    @http.route('/zoom/metrics', type='http', auth='public', methods=['GET'], csrf=False)
+    def zoom_metrics(self, **kwargs):
+        """Métricas de la API de Zoom en formato Prometheus, solo desde la máquina local"""
+        if not is_local_address(request.httprequest.remote_addr):
+            _logger.warning('Métricas de Zoom pedidas desde %s: rechazado', request.httprequest.remote_addr)
+            return request.make_response('Not Found', status=404)
+        body = request.env['zoom.api.metric'].sudo()._prometheus_text()
+        return request.make_response(body, headers=[('Content-Type', PROMETHEUS_CONTENT_TYPE)])
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+
+import hashlib
+import hmac
+import json
+import time
+
+from odoo import http
+from odoo.exceptions import UserError
+from odoo.http import request
+
+from ..models.zoom_logging import get_logger
+
+_logger = get_logger(__name__)
+
+# Antigüedad máxima (segundos) de la marca de tiempo firmada por Zoom
+WEBHOOK_MAX_AGE = 300
+
+MEETING_STATUS_EVENTS = ('meeting.started', 'meeting.ended', 'meeting.cancelled')
+
+
+def sign_webhook(secret, message):
+    return hmac.new(secret.encode(), message.encode(), hashlib.sha256).hexdigest()
+
+
+def verify_webhook_signature(secret, timestamp, body, signature):
+    """Comprobar la cabecera ``x-zm-signature`` (``v0=HMAC(v0:timestamp:body)``)"""
+    if not (secret and timestamp and signature):
+        return False
+    try:
+        if abs(time.time() - int(timestamp)) > WEBHOOK_MAX_AGE:
+            return False
+    except ValueError:
+        return False
+    expected = 'v0=' + sign_webhook(secret, f'v0:{timestamp}:{body}')
+    return hmac.compare_digest(expected, signature)
+
+
+class ZoomWebhookController(http.Controller):
+
+    @http.route('/zoom/webhook', type='http', auth='public', methods=['POST'], csrf=False)
+    def zoom_webhook(self, **kwargs):
+        """Recibir eventos de Zoom (validación de URL, grabaciones y estado de reuniones)"""
+        config = request.env['zoom.config'].sudo().get_active_config()
+        if not config.use_webhooks or not config.webhook_secret:
+            return request.make_json_response({'error': 'disabled'}, status=404)
+
+        body = request.httprequest.get_data(as_text=True)
+        headers = request.httprequest.headers
+        if not verify_webhook_signature(config.webhook_secret, headers.get('x-zm-request-timestamp'),
+                                        body, headers.get('x-zm-signature')):
+            _logger.warning('Webhook de Zoom rechazado: firma no válida')
+            return request.make_json_response({'error': 'invalid signature'}, status=401)
+
+        event = json.loads(body or '{}')
+        event_type = event.get('event')
+        payload = event.get('payload') or {}
+
+        if event_type == 'endpoint.url_validation':
+            plain_token = payload.get('plainToken', '')
+            return request.make_json_response({
+                'plainToken': plain_token,
+                'encryptedToken': sign_webhook(config.webhook_secret, plain_token),
+            })
+
+        zoom_object = payload.get('object') or {}
+        if event_type == 'recording.completed':
+            try:
+                recording = request.env['zoom.recording'].sudo()._ingest(zoom_object)
+            except UserError as e:
+                _logger.warning('Grabación de Zoom no guardada: %s', e)
+                return request.make_json_response({'error': str(e)}, status=400)
+            _logger.info('Grabación recibida por webhook: %s (%s archivos)', recording.uuid, len(recording.file_ids))
+        elif event_type in MEETING_STATUS_EVENTS and zoom_object.get('id'):
+            request.env['zoom.meeting'].sudo().update_meeting_status(zoom_object['id'], event_type)
+        return request.make_json_response({'status': 'ok'})
+
+    @http.route('/zoom/recording/file/<int:file_id>/download', type='http', auth='user')
+    def zoom_recording_download(self, file_id, **kwargs):
+        """Generar el enlace de descarga al momento y redirigir a Zoom"""
+        recording_file = request.env['zoom.recording.file'].browse(file_id).exists()
+        if not recording_file:
+            raise request.not_found()
+        recording_file.check_access('read')
+        return request.redirect(recording_file.sudo()._get_download_url(), local=False)
@@ -3,7 +3,21 @@
 from . import zoom_meeting
 from . import zoom_meeting_attendee
 from . import project_task
+from . import project_project
 from . import zoom_config
 from . import zoom_dashboard
 from . import calendar_event
 from . import helpdesk_ticket
+from . import helpdesk_ticket_participant
+from . import zoom_host
+from . import zoom_sync
+from . import zoom_sync_run
+from . import zoom_outbox
+from . import zoom_reminder
+from . import zoom_scheduled_job
+from . import zoom_mail_render
+from . import zoom_meeting_participant
+from . import zoom_recording
+from . import zoom_api_metric
+from . import zoom_profile
+from . import zoom_meeting_report
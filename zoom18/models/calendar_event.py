@@ -2,10 +2,22 @@
 
 from odoo import models, fields, api, _
 from odoo.exceptions import UserError
-import logging
+from odoo.tools import html2plaintext
+from collections import defaultdict
 from datetime import datetime, timedelta
 
-_logger = logging.getLogger(__name__)
+from .zoom_logging import get_logger
+
+_logger = get_logger(__name__)
+
+# Campos del evento -> campos de la reunión Zoom que dependen de ellos
+CALENDAR_TO_MEETING_FIELDS = {
+    'name': ('name',),
+    'start': ('start_time', 'duration'),
+    'stop': ('duration',),
+    'duration': ('duration',),
+    'description': ('description',),
+}
 
 
 class CalendarEvent(models.Model):
@@ -72,7 +84,7 @@ class CalendarEvent(models.Model):
         meeting_data = {
             'name': self.name,
             'start_time': self.start,
-            'duration': int(self.duration),
+            'duration': self._get_zoom_duration(),
             'description': self.description or '',
             'participants': ','.join([p.email for p in self.partner_ids if p.email]),
         }
@@ -83,23 +95,20 @@ class CalendarEvent(models.Model):
             if not config:
                 raise UserError(_('No hay configuración de Zoom disponible'))
             
-            # Crear reunión en Zoom
-            zoom_result = config.create_zoom_meeting(meeting_data)
-            
             # Crear registro de reunión en Odoo
             meeting = self.env['zoom.meeting'].create({
                 'name': self.name,
-                'meeting_id': zoom_result.get('id'),
                 'start_time': self.start,
-                'duration': int(self.duration),
+                'duration': self._get_zoom_duration(),
                 'description': self.description or '',
                 'participants': ','.join([p.email for p in self.partner_ids if p.email]),
-                'join_url': zoom_result.get('join_url'),
-                'start_url': zoom_result.get('start_url'),
                 'status': 'scheduled',
                 'calendar_event_id': self.id,
             })
             
+            # Crear reunión en Zoom tras el commit (ID y enlaces llegan después)
+            config.create_zoom_meeting(meeting_data, record=meeting)
+            
             # Asociar la reunión con el evento
             self.zoom_meeting_id = meeting.id
             self.is_zoom_meeting = True
@@ -109,60 +118,98 @@ class CalendarEvent(models.Model):
                 'tag': 'display_notification',
                 'params': {
                     'title': _('Reunión Zoom Creada'),
-                    'message': _('Se creó la reunión Zoom y se asoció con este evento.'),
+                    'message': _('La reunión Zoom se está creando y se asoció con este evento.'),
                     'type': 'success',
                 }
             }
             
         except Exception as e:
-            _logger.error(f'Error creando reunión Zoom desde calendario: {str(e)}')
+            _logger.error('Error creando reunión Zoom desde calendario: %s', e)
             raise UserError(_('Error al crear reunión Zoom: %s') % str(e))
     
-    @api.model
-    def create(self, vals):
+    @api.model_create_multi
+    def create(self, vals_list):
         """Override create para detectar eventos de Zoom"""
-        event = super().create(vals)
-        
-        # Si el nombre contiene "Zoom" o "Reunión", marcar como reunión Zoom
-        if event.name and ('zoom' in event.name.lower() or 'reunión' in event.name.lower()):
-            event.is_zoom_meeting = True
-        
-        return event
+        for vals in vals_list:
+            # Si el nombre contiene "Zoom" o "Reunión", marcar como reunión Zoom
+            name = (vals.get('name') or '').lower()
+            if 'zoom' in name or 'reunión' in name:
+                vals.setdefault('is_zoom_meeting', True)
+        return super().create(vals_list)
+    
+    def _get_zoom_duration(self):
+        """Duración del evento en minutos (``duration`` del evento va en horas)"""
+        self.ensure_one()
+        if not (self.start and self.stop):
+            return 0
+        return int(round((self.stop - self.start).total_seconds() / 60))
+
+    def _get_zoom_meeting_vals(self, fnames):
+        """Valores de la reunión Zoom que dependen de los campos del evento modificados"""
+        self.ensure_one()
+        meeting_fnames = {meeting_fname for fname in fnames for meeting_fname in CALENDAR_TO_MEETING_FIELDS.get(fname, ())}
+        vals = {}
+        if 'name' in meeting_fnames:
+            vals['name'] = self.name
+        if 'start_time' in meeting_fnames:
+            vals['start_time'] = self.start
+        if 'duration' in meeting_fnames and self.start and self.stop:
+            vals['duration'] = self._get_zoom_duration()
+        if 'description' in meeting_fnames:
+            vals['description'] = html2plaintext(self.description or '')
+        return vals
     
     def write(self, vals):
-        """Override write para sincronizar con Zoom"""
+        """Override write para sincronizar con Zoom
+
+        La propagación va en un solo sentido: se escriben en la reunión solo
+        los valores que cambian, con ``zoom_skip_calendar_sync`` para que la
+        reunión no vuelva a escribir en el evento.
+        """
         result = super().write(vals)
+        fnames = set(vals) & set(CALENDAR_TO_MEETING_FIELDS)
+        if not fnames or self.env.context.get('zoom_skip_meeting_sync'):
+            return result
         
-        for event in self:
-            if event.zoom_meeting_id and any(field in vals for field in ['name', 'start', 'duration', 'description']):
-                # Sincronizar cambios con Zoom
-                try:
-                    event.zoom_meeting_id.write({
-                        'name': event.name,
-                        'start_time': event.start,
-                        'duration': int(event.duration),
-                        'description': event.description or '',
-                    })
-                except Exception as e:
-                    _logger.error(f'Error sincronizando evento con Zoom: {str(e)}')
+        groups = defaultdict(lambda: self.env['zoom.meeting'])
+        for event in self.filtered('zoom_meeting_id'):
+            meeting = event.zoom_meeting_id
+            changes = {
+                fname: value for fname, value in event._get_zoom_meeting_vals(fnames).items()
+                if meeting[fname] != value
+            }
+            if changes:
+                groups[tuple(sorted(changes.items()))] |= meeting
+        for changes, meetings in groups.items():
+            # Sincronizar cambios con Zoom
+            try:
+                meetings.with_context(zoom_skip_calendar_sync=True).write(dict(changes))
+            except Exception as e:
+                _logger.error('Error sincronizando evento con Zoom: %s', e)
         
         return result
     
     def unlink(self):
-        """Override unlink para eliminar reunión Zoom asociada"""
-        for event in self:
-            if event.zoom_meeting_id:
-                # Cancelar reunión en Zoom si es necesario
-                try:
-                    if event.zoom_meeting_id.status in ['scheduled', 'active']:
-                        event.zoom_meeting_id.action_cancel_meeting()
-                except Exception as e:
-                    _logger.error(f'Error cancelando reunión Zoom: {str(e)}')
-                
-                # Eliminar reunión de Odoo
-                event.zoom_meeting_id.unlink()
+        """Override unlink para eliminar las reuniones Zoom asociadas
+
+        Trabaja por conjuntos: las bajas en Zoom se registran en un solo lote
+        del outbox (se envían en paralelo tras el commit) y las reuniones se
+        eliminan con un único ``unlink``.
+        """
+        meetings = self.env['zoom.meeting']
+        if not self.env.context.get('zoom_skip_meeting_sync'):
+            meetings = self.zoom_meeting_id
+            # Cancelar en Zoom las reuniones que siguen vigentes
+            try:
+                meetings.filtered(lambda m: m.status in ['scheduled', 'active'])._cancel_in_zoom()
+            except Exception as e:
+                _logger.error('Error cancelando reuniones Zoom: %s', e)
+        
+        result = super().unlink()
         
-        return super().unlink()
+        # Eliminar reuniones de Odoo (sus eventos ya se eliminaron aquí)
+        meetings.exists().with_context(zoom_skip_calendar_sync=True).unlink()
+        return result
     
     def _get_base_url(self):
         """Obtener URL base del sistema"""
@@ -1,10 +1,15 @@
 # -*- coding: utf-8 -*-
 
 from odoo import models, fields, api, _
-import logging
-import requests
+from odoo.exceptions import UserError
+from datetime import timedelta
 
-_logger = logging.getLogger(__name__)
+from .zoom_client import ZoomUnavailable
+from .zoom_sync import parse_zoom_datetime
+from .zoom_profile import profiled
+from .zoom_logging import LogBatch, get_logger
+
+_logger = get_logger(__name__)
 
 
 class HelpdeskTicket(models.Model):
@@ -61,10 +66,18 @@ class HelpdeskTicket(models.Model):
         help="Número de asistentes confirmados"
     )
     
+    zoom_participant_ids = fields.One2many(
+        'helpdesk.ticket.zoom.participant',
+        'ticket_id',
+        string='Sesiones de Participantes',
+        readonly=True,
+        help="Entradas y salidas de los participantes según Zoom"
+    )
+    
     attendees_list = fields.Text(
         string='Lista de Asistentes',
-        readonly=True,
-        help="Lista de participantes de la reunión"
+        compute='_compute_attendees_list',
+        help="Lista de participantes de la reunión (calculada a partir de las sesiones)"
     )
     
     host_name = fields.Char(
@@ -152,15 +165,40 @@ class HelpdeskTicket(models.Model):
     
     recording_url = fields.Char(
         string='URL de Grabación',
-        readonly=True,
-        help="Enlace a la grabación si está disponible"
+        compute='_compute_recording_url',
+        help="Enlace a la grabación si está disponible (el enlace de Zoom se genera al abrirlo)"
     )
 
+    @api.depends('zoom_participant_ids.participant_key', 'zoom_participant_ids.name', 'zoom_participant_ids.email')
+    def _compute_attendees_list(self):
+        for ticket in self:
+            people = {}
+            for session in ticket.zoom_participant_ids:
+                people.setdefault(session.participant_key, session)
+            ticket.attendees_list = '\n'.join(
+                f"• {session.name or 'Sin nombre'} ({session.email or 'Sin email'})"
+                for session in people.values()
+            ) or False
+
+    @api.depends('zoom_meeting_id', 'recording_available')
+    def _compute_recording_url(self):
+        files = self.env['zoom.recording.file'].search([
+            ('recording_id.zoom_meeting_id', 'in', [t.zoom_meeting_id for t in self if t.recording_available]),
+            ('download_url', '!=', False),
+        ])
+        url_by_meeting = {}
+        # Preferir el vídeo; si no hay, el primer archivo descargable
+        for file in files.sorted(lambda f: f.file_type != 'MP4'):
+            url_by_meeting.setdefault(file.recording_id.zoom_meeting_id, f'/zoom/recording/file/{file.id}/download')
+        for ticket in self:
+            ticket.recording_url = url_by_meeting.get(ticket.zoom_meeting_id, False)
+
     # ========================================
     # MÉTODOS DE ACTUALIZACIÓN AUTOMÁTICA
     # ========================================
     
     @api.model
+    @profiled
     def create(self, vals):
         """Crear ticket y asociar reunión Zoom automáticamente"""
         ticket = super(HelpdeskTicket, self).create(vals)
@@ -169,7 +207,7 @@ class HelpdeskTicket(models.Model):
         try:
             ticket._create_zoom_meeting()
         except Exception as e:
-            _logger.warning(f'Error creando reunión Zoom para ticket {ticket.id}: {e}')
+            _logger.warning('Error creando reunión Zoom para ticket %s: %s', ticket.id, e)
         
         return ticket
     
@@ -192,16 +230,12 @@ class HelpdeskTicket(models.Model):
         }
         
         try:
-            # Crear reunión en Zoom
-            zoom_result = zoom_config.create_zoom_meeting(meeting_data)
+            # Registrar el alta en zoom.outbox: se envía tras el commit y el
+            # resultado llega en _zoom_outbox_done
+            zoom_config.create_zoom_meeting(meeting_data, record=self)
             
             # Actualizar campos del ticket
             self.write({
-                'zoom_meeting_id': zoom_result.get('id'),
-                'zoom_join_url': zoom_result.get('join_url'),
-                'zoom_start_url': zoom_result.get('start_url'),
-                'zoom_created': True,
-                'created_in_zoom': fields.Datetime.now(),
                 'meeting_status': 'scheduled',
                 'meeting_duration': meeting_data['duration'],
                 'meeting_start_time': meeting_data['start_time'],
@@ -209,37 +243,43 @@ class HelpdeskTicket(models.Model):
                 'host_email': self.env.user.email,
             })
             
-            _logger.info(f'Reunión Zoom creada para ticket {self.id}: {zoom_result.get("id")}')
+            _logger.debug('Reunión Zoom en cola para ticket %s', self.id)
             
         except Exception as e:
-            _logger.error(f'Error creando reunión Zoom: {e}')
+            _logger.error('Error creando reunión Zoom: %s', e)
             raise
     
+    def _zoom_outbox_done(self, operation, result):
+        """Guardar la reunión creada en Zoom (directamente o desde zoom.outbox)"""
+        self.ensure_one()
+        if operation != 'create_meeting' or not result.get('id'):
+            return
+        self.write({
+            'zoom_meeting_id': str(result.get('id')),
+            'zoom_join_url': result.get('join_url'),
+            'zoom_start_url': result.get('start_url'),
+            'zoom_created': True,
+            'created_in_zoom': fields.Datetime.now(),
+        })
+    
     def _sync_zoom_data(self):
-        """Sincronizar datos de Zoom con el ticket"""
+        """Sincronizar datos de Zoom con el ticket
+
+        Devuelve True si los datos se actualizaron correctamente.
+        """
         self.ensure_one()
         
         if not self.zoom_meeting_id:
-            return
+            return False
         
         # Buscar configuración de Zoom
         zoom_config = self.env['zoom.config'].search([], limit=1)
         if not zoom_config:
-            return
+            return False
         
         try:
-            # Obtener información actualizada de la reunión desde Zoom API
-            headers = {
-                'Authorization': f'Bearer {zoom_config.access_token}',
-                'Content-Type': 'application/json'
-            }
-            
-            # Obtener detalles de la reunión
-            response = requests.get(
-                f'{zoom_config.base_url}/meetings/{self.zoom_meeting_id}',
-                headers=headers,
-                timeout=10
-            )
+            # Obtener detalles de la reunión (falla al instante si Zoom está caído)
+            response = zoom_config._zoom_request('GET', f'/meetings/{self.zoom_meeting_id}', timeout=10)
             
             if response.status_code == 200:
                 meeting_data = response.json()
@@ -250,7 +290,7 @@ class HelpdeskTicket(models.Model):
                     'zoom_synced': True,
                     'zoom_meeting_topic': meeting_data.get('topic', ''),
                     'meeting_duration': meeting_data.get('duration', 0),
-                    'meeting_start_time': meeting_data.get('start_time'),
+                    'meeting_start_time': parse_zoom_datetime(meeting_data.get('start_time')),
                     'host_name': meeting_data.get('host_email', ''),
                 }
                 
@@ -265,48 +305,56 @@ class HelpdeskTicket(models.Model):
                 elif zoom_status == 'cancelled':
                     update_vals['meeting_status'] = 'cancelled'
                 
-                # Obtener información de participantes
-                participants_response = requests.get(
-                    f'{zoom_config.base_url}/meetings/{self.zoom_meeting_id}/participants',
-                    headers=headers,
-                    timeout=10
-                )
-                
-                if participants_response.status_code == 200:
-                    participants_data = participants_response.json()
-                    participants = participants_data.get('participants', [])
-                    
+                # Obtener información de participantes (todas las páginas)
+                try:
+                    participants = []
+                    for page, _next_token in zoom_config._zoom_get_pages(
+                            f'/meetings/{self.zoom_meeting_id}/participants', 'participants'):
+                        participants.extend(page)
+                except ZoomUnavailable:
+                    raise
+                except UserError as e:
+                    _logger.warning('Participantes no disponibles para ticket %s: %s', self.id, e)
+                else:
+                    sessions = self.env['helpdesk.ticket.zoom.participant']._upsert_sessions(self, participants)
                     update_vals.update({
-                        'total_attendees': len(participants),
-                        'confirmed_attendees': len([p for p in participants if p.get('status') == 'in_meeting']),
-                        'attendees_list': '\n'.join([f"• {p.get('name', 'Sin nombre')} ({p.get('email', 'Sin email')})" for p in participants])
+                        'total_attendees': len(set(sessions.mapped('participant_key'))),
+                        'confirmed_attendees': len(set(
+                            sessions.filtered(lambda s: s.status == 'in_meeting').mapped('participant_key'))),
                     })
                 
-                # Verificar si hay grabación disponible
-                recording_response = requests.get(
-                    f'{zoom_config.base_url}/meetings/{self.zoom_meeting_id}/recordings',
-                    headers=headers,
-                    timeout=10
-                )
+                # Buscar la grabación solo mientras no se conozca (el webhook
+                # recording.completed la registra sin consultar)
+                if not self.recording_available:
+                    try:
+                        self.env['zoom.recording']._fetch(zoom_config, self.zoom_meeting_id)
+                    except ZoomUnavailable:
+                        raise
+                    except UserError as e:
+                        _logger.warning('Grabación no disponible para ticket %s: %s', self.id, e)
                 
-                if recording_response.status_code == 200:
-                    recording_data = recording_response.json()
-                    recordings = recording_data.get('recording_files', [])
-                    
-                    if recordings:
-                        update_vals.update({
-                            'recording_available': True,
-                            'recording_url': recordings[0].get('download_url', '')
-                        })
-                
-                self.write(update_vals)
-                _logger.info(f'Datos Zoom sincronizados para ticket {self.id}')
+                # Escribir solo lo que ha cambiado (last_sync siempre cambia)
+                self.write(self._zoom_changed_vals(update_vals))
+                _logger.debug('Datos Zoom sincronizados para ticket %s', self.id)
+                return True
                 
             else:
-                _logger.warning(f'Error obteniendo datos de reunión {self.zoom_meeting_id}: {response.status_code}')
+                _logger.warning('Error obteniendo datos de reunión %s: %s', self.zoom_meeting_id, response.status_code)
                 
         except Exception as e:
-            _logger.error(f'Error sincronizando datos Zoom: {e}')
+            _logger.error('Error sincronizando datos Zoom: %s', e)
+        return False
+    
+    def _zoom_changed_vals(self, vals):
+        """Quitar de ``vals`` los valores que coinciden con los actuales"""
+        self.ensure_one()
+        changed = {}
+        for name, value in vals.items():
+            field = self._fields[name]
+            new_value = field.convert_to_record(field.convert_to_cache(value, self), self)
+            if (new_value or False) != (self[name] or False):
+                changed[name] = value
+        return changed
     
     def action_sync_zoom_data(self):
         """Acción manual para sincronizar datos de Zoom"""
@@ -324,15 +372,43 @@ class HelpdeskTicket(models.Model):
         }
     
     @api.model
+    @profiled
     def _cron_sync_zoom_meetings(self):
-        """Cron job para sincronizar todas las reuniones Zoom"""
-        tickets = self.search([
+        """Cron job para sincronizar todas las reuniones Zoom
+
+        Cada llamada sincroniza un lote de ``cron_batch_size`` tickets, empezando
+        por los que llevan más tiempo sin sincronizar; ``ir.cron`` confirma entre
+        lotes y vuelve a llamar mientras queden tickets pendientes.
+        """
+        zoom_config = self.env['zoom.config'].search([], limit=1)
+        if not zoom_config or zoom_config._get_circuit_breaker().is_open():
+            # Zoom caído: no gastar el lote en llamadas que fallarán
+            return
+        
+        # Pendientes: no sincronizados desde la ejecución anterior del cron
+        cutoff = self.env.context.get('lastcall') or fields.Datetime.now() - timedelta(minutes=5)
+        domain = [
             ('zoom_created', '=', True),
-            ('meeting_status', 'in', ['scheduled', 'in_progress'])
-        ])
+            ('meeting_status', 'in', ['scheduled', 'in_progress']),
+            '|', ('last_sync', '=', False), ('last_sync', '<', cutoff),
+        ]
+        batch_size = self.env['zoom.config']._get_cron_batch_size()
+        tickets = self.search(domain, limit=batch_size, order='last_sync asc nulls first, id')
+        
+        failed = self.browse()
+        with LogBatch(_logger, 'Tickets de Helpdesk sincronizados con Zoom') as batch:
+            for ticket in tickets:
+                try:
+                    if ticket._sync_zoom_data():
+                        batch.add()
+                    else:
+                        failed |= ticket
+                except Exception as e:
+                    _logger.error('Error sincronizando ticket %s: %s', ticket.id, e)
+                    failed |= ticket
+        
+        # Los fallidos pasan al final de la cola en lugar de repetirse en cada lote
+        failed.write({'last_sync': fields.Datetime.now(), 'zoom_synced': False})
         
-        for ticket in tickets:
-            try:
-                ticket._sync_zoom_data()
-            except Exception as e:
-                _logger.error(f'Error sincronizando ticket {ticket.id}: {e}')
+        remaining = self.search_count(domain) if len(tickets) == batch_size else 0
+        self.env['ir.cron']._notify_progress(done=len(tickets), remaining=remaining)
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+
+from odoo import models, fields, api
+
+from .zoom_meeting_participant import normalize_email
+from .zoom_sync import parse_zoom_datetime
+
+# Campos que se comparan para decidir si una sesión ya guardada ha cambiado
+SESSION_FIELDS = ('name', 'email', 'leave_time', 'duration', 'status')
+
+
+class HelpdeskTicketZoomParticipant(models.Model):
+    """Sesiones de los participantes en la reunión Zoom de un ticket
+
+    Una fila por participante y entrada (``participant_key``, ``join_time``):
+    la sincronización las actualiza en sitio en lugar de reescribir una lista
+    de texto en el ticket.
+    """
+    _name = 'helpdesk.ticket.zoom.participant'
+    _description = 'Sesión de Participante Zoom del Ticket'
+    _order = 'ticket_id, join_time, id'
+
+    ticket_id = fields.Many2one(
+        'helpdesk.ticket',
+        string='Ticket',
+        required=True,
+        ondelete='cascade',
+        index=True
+    )
+
+    participant_key = fields.Char(
+        string='ID de Participante',
+        required=True,
+        help='Identificador del participante en Zoom (id, user_id o email)'
+    )
+
+    name = fields.Char(string='Nombre')
+    email = fields.Char(string='Email', help='Email normalizado (minúsculas)')
+    join_time = fields.Datetime(string='Entrada')
+    leave_time = fields.Datetime(string='Salida')
+    duration = fields.Integer(string='Duración (s)')
+    status = fields.Char(string='Estado en Zoom', help='Estado devuelto por Zoom (in_meeting, in_waiting_room...)')
+
+    _sql_constraints = [
+        ('ticket_participant_join_unique', 'unique(ticket_id, participant_key, join_time)',
+         'La sesión del participante ya está registrada para este ticket.'),
+    ]
+
+    @api.model
+    def _prepare_session(self, participant):
+        email = normalize_email(participant.get('email') or participant.get('user_email'))
+        return {
+            'participant_key': str(participant.get('id') or participant.get('user_id') or email
+                                   or participant.get('name') or participant.get('user_name') or ''),
+            'name': participant.get('name') or participant.get('user_name') or False,
+            'email': email,
+            'join_time': parse_zoom_datetime(participant.get('join_time')),
+            'leave_time': parse_zoom_datetime(participant.get('leave_time')),
+            'duration': participant.get('duration') or 0,
+            'status': participant.get('status') or False,
+        }
+
+    @api.model
+    def _upsert_sessions(self, ticket, participants):
+        """Guardar las sesiones recibidas de Zoom para un ticket
+
+        Las sesiones se identifican por (participante, entrada): las nuevas se
+        crean en un solo ``create`` y las existentes solo se escriben si algún
+        valor ha cambiado. Devuelve todas las sesiones del ticket.
+        """
+        existing = {
+            (session.participant_key, session.join_time): session
+            for session in self.search_fetch(
+                [('ticket_id', '=', ticket.id)], ('participant_key', 'join_time') + SESSION_FIELDS)
+        }
+        to_create = []
+        for participant in participants:
+            vals = self._prepare_session(participant)
+            if not vals['participant_key']:
+                continue
+            key = (vals['participant_key'], vals['join_time'])
+            session = existing.get(key)
+            if session is None:
+                vals['ticket_id'] = ticket.id
+                to_create.append(vals)
+                # Reservar la clave por si Zoom repite la sesión en otra página
+                existing[key] = self.browse()
+                continue
+            changes = {name: vals[name] for name in SESSION_FIELDS if session and session[name] != vals[name]}
+            if changes:
+                session.write(changes)
+        if to_create:
+            self.create(to_create)
+        return ticket.zoom_participant_ids
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+
+from odoo import models, fields, api, _
+
+
+class ProjectProject(models.Model):
+    _inherit = 'project.project'
+
+    zoom_meeting_count = fields.Integer(
+        string='Reuniones Zoom',
+        compute='_compute_zoom_meeting_stats',
+        help='Reuniones Zoom no canceladas de las tareas del proyecto'
+    )
+
+    zoom_meeting_hours = fields.Float(
+        string='Horas de Reunión',
+        compute='_compute_zoom_meeting_stats',
+        digits=(16, 1),
+        help='Duración real de las reuniones Zoom celebradas en el proyecto'
+    )
+
+    def _compute_zoom_meeting_stats(self):
+        """Totales por proyecto desde el análisis diario, en una consulta para todos
+
+        Se leen de ``zoom.meeting.daily`` (se actualiza al confirmar cada
+        transacción), así que no recorren las reuniones de cada proyecto.
+        """
+        stats = {
+            project: (count, minutes)
+            for project, count, minutes in self.env['zoom.meeting.daily']._read_group(
+                [('project_id', 'in', self._origin.ids), ('status', '!=', 'cancelled')],
+                groupby=['project_id'],
+                aggregates=['meeting_count:sum', 'actual_minutes:sum'],
+            )
+        }
+        for project in self:
+            count, minutes = stats.get(project._origin, (0, 0))
+            project.zoom_meeting_count = count or 0
+            project.zoom_meeting_hours = (minutes or 0) / 60.0
+
+    def action_view_zoom_meetings(self):
+        """Ver las reuniones Zoom del proyecto"""
+        self.ensure_one()
+        return {
+            'type': 'ir.actions.act_window',
+            'name': _('Reuniones Zoom'),
+            'res_model': 'zoom.meeting',
+            'view_mode': 'list,form',
+            'domain': [('project_id', '=', self.id)],
+            'target': 'current',
+        }
+
+    def action_view_zoom_meeting_report(self):
+        """Ver el análisis de reuniones del proyecto"""
+        self.ensure_one()
+        action = self.env['ir.actions.act_window']._for_xml_id('zoom18.action_zoom_meeting_report')
+        action['domain'] = [('project_id', '=', self.id)]
+        return action
@@ -2,10 +2,11 @@
 
 from odoo import models, fields, api, _
 from odoo.exceptions import UserError
-import logging
 from datetime import timedelta
 
-_logger = logging.getLogger(__name__)
+from .zoom_logging import get_logger
+
+_logger = get_logger(__name__)
 
 
 class ProjectTask(models.Model):
@@ -20,31 +21,55 @@ class ProjectTask(models.Model):
     
     zoom_meeting_count = fields.Integer(
         string='Cantidad de Reuniones',
-        compute='_compute_zoom_meeting_count',
+        compute='_compute_zoom_meeting_stats',
         help='Número total de reuniones Zoom asociadas'
     )
     
     active_zoom_meeting = fields.Many2one(
         'zoom.meeting',
         string='Reunión Activa',
-        compute='_compute_active_zoom_meeting',
+        compute='_compute_zoom_meeting_stats',
         help='Reunión Zoom activa o próxima'
     )
 
-    @api.depends('zoom_meeting_ids')
-    def _compute_zoom_meeting_count(self):
-        """Calcular cantidad de reuniones Zoom"""
-        for task in self:
-            task.zoom_meeting_count = len(task.zoom_meeting_ids)
-
     @api.depends('zoom_meeting_ids', 'zoom_meeting_ids.status', 'zoom_meeting_ids.start_time')
-    def _compute_active_zoom_meeting(self):
-        """Calcular reunión activa o próxima"""
-        for task in self:
+    def _compute_zoom_meeting_stats(self):
+        """Calcular cantidad de reuniones y reunión activa o próxima
+
+        Una sola consulta agrupada para todas las tareas guardadas: las listas
+        y el kanban no cargan las reuniones de cada tarea. Las tareas nuevas
+        (formulario sin guardar) se calculan en memoria.
+        """
+        saved = self.filtered('id')
+        stats = {}
+        if saved:
+            self.env['zoom.meeting'].flush_model(['task_id', 'status', 'start_time'])
+            self.env.cr.execute("""
+                SELECT task_id,
+                       COUNT(*),
+                       (ARRAY_AGG(id ORDER BY start_time, id) FILTER (WHERE status IN ('scheduled', 'active')))[1]
+                  FROM zoom_meeting
+                 WHERE task_id = ANY(%s)
+                 GROUP BY task_id
+            """, [saved.ids])
+            stats = {task_id: (count, meeting_id) for task_id, count, meeting_id in self.env.cr.fetchall()}
+        Meeting = self.env['zoom.meeting']
+        for task in saved:
+            count, meeting_id = stats.get(task.id, (0, None))
+            task.zoom_meeting_count = count
+            task.active_zoom_meeting = Meeting.browse(meeting_id)
+        for task in self - saved:
             active_meeting = task.zoom_meeting_ids.filtered(
                 lambda m: m.status in ['scheduled', 'active']
             ).sorted('start_time')
-            task.active_zoom_meeting = active_meeting[0] if active_meeting else False
+            task.zoom_meeting_count = len(task.zoom_meeting_ids)
+            task.active_zoom_meeting = active_meeting[:1]
+
+    def write(self, vals):
+        if 'project_id' in vals:
+            # El proyecto de las reuniones (relacionado y almacenado) cambia sin pasar por su write
+            self.env['zoom.meeting.daily']._mark_dirty(self.zoom_meeting_ids.mapped('start_time'))
+        return super().write(vals)
 
     def action_create_zoom_meeting(self):
         """Crear reunión Zoom programada"""
@@ -59,7 +84,8 @@ class ProjectTask(models.Model):
             'status': 'scheduled',
         })
         
-        # Crear reunión en Zoom
+        # Crear reunión en Zoom tras el commit: el ID y los enlaces llegan en
+        # _zoom_outbox_done (el evento de calendario ya lo creó create)
         try:
             meeting_data = {
                 'name': meeting.name,
@@ -67,11 +93,7 @@ class ProjectTask(models.Model):
                 'duration': meeting.duration,
             }
             
-            zoom_result = meeting.create_zoom_meeting(meeting_data)
-            meeting.write(zoom_result)
-            
-            # Crear evento en calendario
-            meeting._create_calendar_event()
+            meeting.create_zoom_meeting(meeting_data)
             
             return {
                 'type': 'ir.actions.act_window',
@@ -83,7 +105,7 @@ class ProjectTask(models.Model):
             }
             
         except Exception as e:
-            _logger.error(f'Error creando reunión Zoom: {str(e)}')
+            _logger.error('Error creando reunión Zoom: %s', e)
             raise UserError(_('Error al crear reunión en Zoom: %s') % str(e))
 
     def action_start_instant_zoom(self):
@@ -103,7 +125,7 @@ class ProjectTask(models.Model):
         try:
             return meeting.create_instant_meeting()
         except Exception as e:
-            _logger.error(f'Error iniciando reunión instantánea: {str(e)}')
+            _logger.error('Error iniciando reunión instantánea: %s', e)
             raise UserError(_('Error al iniciar reunión instantánea: %s') % str(e))
 
     def action_join_zoom_meeting(self):
@@ -0,0 +1,252 @@
+# -*- coding: utf-8 -*-
+
+from odoo import models, fields, api, _
+import threading
+from collections import defaultdict
+from datetime import timedelta
+
+from .zoom_client import LATENCY_BUCKETS_MS, get_api_metrics
+from .zoom_logging import get_logger
+
+_logger = get_logger(__name__)
+
+# Días que se conservan los agregados horarios
+API_METRIC_RETENTION_DAYS = 90
+
+# Segundos mínimos entre volcados del acumulador en memoria a la tabla
+API_METRIC_FLUSH_INTERVAL = 60
+
+# Contadores que se suman al agregar dos volcados de la misma hora
+API_METRIC_COUNTERS = ('call_count', 'retry_count', 'error_count', 'throttled_count', 'total_time')
+
+# Llamadas por tramo de latencia, en el orden de LATENCY_BUCKETS_MS (el último, sin límite)
+LATENCY_BUCKET_FIELDS = tuple(f'latency_le_{limit}' for limit in LATENCY_BUCKETS_MS) + ('latency_over',)
+
+
+def prometheus_labels(**labels):
+    """``{clave="valor",...}`` con los valores escapados para Prometheus"""
+    escaped = (
+        '%s="%s"' % (key, str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'))
+        for key, value in labels.items()
+    )
+    return '{%s}' % ','.join(escaped)
+
+
+class ZoomApiMetric(models.Model):
+    _name = 'zoom.api.metric'
+    _description = 'Métrica de la API de Zoom'
+    _order = 'period_start desc, endpoint, method, status_code'
+    _rec_name = 'endpoint'
+
+    period_start = fields.Datetime(
+        string='Hora',
+        required=True,
+        readonly=True,
+        index=True,
+        help='Inicio de la hora (UTC) que agrega esta fila'
+    )
+
+    endpoint = fields.Char(
+        string='Endpoint',
+        required=True,
+        readonly=True,
+        help='Ruta de la API sin identificadores, p. ej. /users/{id}/meetings'
+    )
+
+    method = fields.Char(
+        string='Método',
+        required=True,
+        readonly=True
+    )
+
+    status_code = fields.Char(
+        string='Estado',
+        required=True,
+        readonly=True,
+        help='Código HTTP, "error" si no hubo respuesta o "circuit_open" si la llamada no se hizo'
+    )
+
+    # === CONTADORES ===
+    call_count = fields.Integer(string='Llamadas', readonly=True)
+    retry_count = fields.Integer(string='Reintentos', readonly=True)
+    error_count = fields.Integer(string='Errores', readonly=True)
+    throttled_count = fields.Integer(string='Limitadas (429)', readonly=True)
+
+    # === LATENCIA ===
+    total_time = fields.Float(string='Tiempo Total (s)', digits=(16, 3), readonly=True)
+    max_time = fields.Float(string='Tiempo Máximo (s)', digits=(16, 3), readonly=True, aggregator='max')
+    avg_time_ms = fields.Float(
+        string='Latencia Media (ms)',
+        compute='_compute_avg_time_ms',
+        digits=(16, 1)
+    )
+
+    latency_le_100 = fields.Integer(string='≤ 100 ms', readonly=True)
+    latency_le_250 = fields.Integer(string='≤ 250 ms', readonly=True)
+    latency_le_500 = fields.Integer(string='≤ 500 ms', readonly=True)
+    latency_le_1000 = fields.Integer(string='≤ 1 s', readonly=True)
+    latency_le_2500 = fields.Integer(string='≤ 2,5 s', readonly=True)
+    latency_le_5000 = fields.Integer(string='≤ 5 s', readonly=True)
+    latency_le_10000 = fields.Integer(string='≤ 10 s', readonly=True)
+    latency_over = fields.Integer(string='> 10 s', readonly=True)
+
+    _sql_constraints = [
+        ('period_endpoint_uniq', 'unique(period_start, endpoint, method, status_code)',
+         'Solo puede haber una fila por hora, endpoint, método y estado.'),
+    ]
+
+    @api.depends('total_time', *LATENCY_BUCKET_FIELDS)
+    def _compute_avg_time_ms(self):
+        for record in self:
+            observed = sum(record[fname] for fname in LATENCY_BUCKET_FIELDS)
+            record.avg_time_ms = record.total_time * 1000 / observed if observed else 0.0
+
+    # === VOLCADO ===
+    @api.model
+    def _flush_buffer(self, force=False):
+        """Guardar en la tabla lo acumulado en memoria por este proceso
+
+        Sin ``force`` solo vuelca si han pasado ``API_METRIC_FLUSH_INTERVAL``
+        segundos desde el anterior. Usa un cursor propio (salvo en los tests):
+        las métricas se conservan aunque la transacción que hizo las llamadas
+        se deshaga, y varios procesos pueden volcar a la vez (``ON CONFLICT``
+        suma).
+        Devuelve el número de filas volcadas.
+        """
+        metrics = get_api_metrics(self.env.cr.dbname)
+        if not force and not metrics.due(API_METRIC_FLUSH_INTERVAL):
+            return 0
+        data = metrics.drain()
+        if not data:
+            return 0
+        try:
+            if getattr(threading.current_thread(), 'testing', False):
+                # En los tests, dentro de su transacción para que se deshaga con ella
+                with self.env.cr.savepoint():
+                    self._upsert(data)
+            else:
+                with self.env.registry.cursor() as cr:
+                    self.with_env(self.env(cr=cr))._upsert(data)
+        except Exception:
+            metrics.restore(data)
+            _logger.warning('No se pudieron guardar las métricas de la API de Zoom', exc_info=True)
+            return 0
+        self.invalidate_model()
+        return len(data)
+
+    @api.model
+    def _upsert(self, data):
+        """Sumar los contadores de ``data`` (ver ``ZoomApiMetrics``) a sus filas horarias"""
+        columns = ('period_start', 'endpoint', 'method', 'status_code', 'max_time') \
+            + API_METRIC_COUNTERS + LATENCY_BUCKET_FIELDS
+        now = fields.Datetime.now()
+        rows = [
+            (period, endpoint, method, status, values['max_time'],
+             *(values[name] for name in API_METRIC_COUNTERS), *values['buckets'],
+             self.env.uid, now, self.env.uid, now)
+            for (period, endpoint, method, status), values in data.items()
+        ]
+        additions = ', '.join(
+            f'{name} = zoom_api_metric.{name} + EXCLUDED.{name}'
+            for name in API_METRIC_COUNTERS + LATENCY_BUCKET_FIELDS
+        )
+        self.env.cr.execute(f"""
+            INSERT INTO zoom_api_metric ({', '.join(columns)}, create_uid, create_date, write_uid, write_date)
+            VALUES {', '.join(['%s'] * len(rows))}
+            ON CONFLICT (period_start, endpoint, method, status_code) DO UPDATE SET
+                {additions},
+                max_time = GREATEST(zoom_api_metric.max_time, EXCLUDED.max_time),
+                write_uid = EXCLUDED.write_uid,
+                write_date = EXCLUDED.write_date
+        """, rows)
+
+    # === LECTURA ===
+    @api.model
+    def _get_summary(self, hours=24):
+        """Totales de las últimas ``hours`` horas para el dashboard"""
+        self._flush_buffer(force=True)
+        since = fields.Datetime.now() - timedelta(hours=hours)
+        [(calls, errors, throttled, retries, total_time, *buckets)] = self._read_group(
+            [('period_start', '>=', since)],
+            aggregates=['call_count:sum', 'error_count:sum', 'throttled_count:sum', 'retry_count:sum',
+                        'total_time:sum'] + [f'{fname}:sum' for fname in LATENCY_BUCKET_FIELDS],
+        )
+        calls = calls or 0
+        observed = sum(count or 0 for count in buckets)
+        return {
+            'calls': calls,
+            'errors': errors or 0,
+            'throttled': throttled or 0,
+            'retries': retries or 0,
+            'error_rate': round((errors or 0) * 100.0 / calls, 1) if calls else 0.0,
+            'avg_time_ms': round((total_time or 0.0) * 1000 / observed, 1) if observed else 0.0,
+        }
+
+    @api.model
+    def _prometheus_text(self):
+        """Métricas acumuladas en formato de texto de Prometheus
+
+        Contadores de llamadas por endpoint, método y estado; reintentos y 429
+        por endpoint y método, e histograma de latencia. Los totales cubren las
+        filas conservadas (``API_METRIC_RETENTION_DAYS``): al purgar, Prometheus
+        lo trata como un reinicio del contador.
+        """
+        self._flush_buffer(force=True)
+        groups = self._read_group(
+            [],
+            groupby=['endpoint', 'method', 'status_code'],
+            aggregates=['call_count:sum', 'retry_count:sum', 'throttled_count:sum', 'total_time:sum']
+                       + [f'{fname}:sum' for fname in LATENCY_BUCKET_FIELDS],
+        )
+        requests_lines = []
+        by_endpoint = defaultdict(lambda: {'retries': 0, 'throttled': 0, 'total_time': 0.0,
+                                           'buckets': [0] * len(LATENCY_BUCKET_FIELDS)})
+        for endpoint, method, status, calls, retries, throttled, total_time, *buckets in groups:
+            labels = prometheus_labels(endpoint=endpoint, method=method, status=status)
+            requests_lines.append(f'zoom_api_requests_total{labels} {calls or 0}')
+            totals = by_endpoint[endpoint, method]
+            totals['retries'] += retries or 0
+            totals['throttled'] += throttled or 0
+            totals['total_time'] += total_time or 0.0
+            totals['buckets'] = [a + (b or 0) for a, b in zip(totals['buckets'], buckets)]
+
+        lines = [
+            '# HELP zoom_api_requests_total Llamadas a la API de Zoom',
+            '# TYPE zoom_api_requests_total counter',
+            *requests_lines,
+            '# HELP zoom_api_retries_total Llamadas que reintentan una operación fallida',
+            '# TYPE zoom_api_retries_total counter',
+        ]
+        lines += [
+            f'zoom_api_retries_total{prometheus_labels(endpoint=endpoint, method=method)} {totals["retries"]}'
+            for (endpoint, method), totals in by_endpoint.items()
+        ]
+        lines += [
+            '# HELP zoom_api_throttled_total Respuestas 429 (límite de peticiones) de Zoom',
+            '# TYPE zoom_api_throttled_total counter',
+        ]
+        lines += [
+            f'zoom_api_throttled_total{prometheus_labels(endpoint=endpoint, method=method)} {totals["throttled"]}'
+            for (endpoint, method), totals in by_endpoint.items()
+        ]
+        lines += [
+            '# HELP zoom_api_request_duration_seconds Latencia de las llamadas a la API de Zoom',
+            '# TYPE zoom_api_request_duration_seconds histogram',
+        ]
+        for (endpoint, method), totals in by_endpoint.items():
+            cumulative = 0
+            for limit, count in zip(LATENCY_BUCKETS_MS + ('+Inf',), totals['buckets']):
+                cumulative += count
+                le = limit if limit == '+Inf' else f'{limit / 1000:g}'
+                labels = prometheus_labels(endpoint=endpoint, method=method, le=le)
+                lines.append(f'zoom_api_request_duration_seconds_bucket{labels} {cumulative}')
+            labels = prometheus_labels(endpoint=endpoint, method=method)
+            lines.append(f'zoom_api_request_duration_seconds_sum{labels} {totals["total_time"]:.6f}')
+            lines.append(f'zoom_api_request_duration_seconds_count{labels} {cumulative}')
+        return '\n'.join(lines) + '\n'
+
+    @api.autovacuum
+    def _gc_api_metrics(self):
+        """Eliminar agregados horarios antiguos"""
+        limit_date = fields.Datetime.now() - timedelta(days=API_METRIC_RETENTION_DAYS)
+        self.search([('period_start', '<', limit_date)]).unlink()
@@ -0,0 +1,287 @@
+# -*- coding: utf-8 -*-
+
+from odoo import _
+from odoo.exceptions import UserError
+import contextvars
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from urllib.parse import urlparse
+
+import requests
+
+from .zoom_logging import get_logger
+
+_logger = get_logger(__name__)
+
+# Valores por defecto del circuit breaker (ver zoom.config)
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_RESET_TIMEOUT = 60
+
+# Respuestas que indican que Zoom no está respondiendo correctamente
+ZOOM_FAILURE_STATUS = {429, 500, 502, 503, 504}
+
+# Límites de los tramos del histograma de latencia, en milisegundos
+LATENCY_BUCKETS_MS = (100, 250, 500, 1000, 2500, 5000, 10000)
+
+# Estados registrados para llamadas que no obtuvieron respuesta HTTP
+STATUS_ERROR = 'error'
+STATUS_CIRCUIT_OPEN = 'circuit_open'
+
+# Colecciones de la API cuyo siguiente segmento es un identificador
+ZOOM_ID_COLLECTIONS = {'users', 'meetings', 'past_meetings', 'webinars', 'past_webinars'}
+
+CIRCUIT_CLOSED = 'closed'
+CIRCUIT_OPEN = 'open'
+CIRCUIT_HALF_OPEN = 'half_open'
+
+
+class ZoomUnavailable(UserError):
+    """Zoom no está disponible: el circuito está abierto y la llamada no se hizo"""
+
+
+class ZoomCircuitBreaker:
+    """Circuit breaker para las llamadas HTTP a Zoom
+
+    - cerrado: las llamadas pasan; ``failure_threshold`` fallos seguidos lo abren
+    - abierto: las llamadas fallan al instante durante ``reset_timeout`` segundos
+    - semiabierto: se deja pasar una única llamada de prueba; si funciona el
+      circuito se cierra y si falla vuelve a abrirse
+
+    El estado vive en memoria del proceso y es seguro entre hilos, de modo que
+    lo comparten las peticiones web, los crons y las descargas concurrentes.
+    """
+
+    def __init__(self, failure_threshold=DEFAULT_FAILURE_THRESHOLD, reset_timeout=DEFAULT_RESET_TIMEOUT):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self.probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        with self._lock:
+            return self._state()
+
+    def _state(self):
+        if self.opened_at is None:
+            return CIRCUIT_CLOSED
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return CIRCUIT_HALF_OPEN
+        return CIRCUIT_OPEN
+
+    def is_open(self):
+        """True si una llamada fallaría al instante (sin consumir la prueba)"""
+        with self._lock:
+            state = self._state()
+            return state == CIRCUIT_OPEN or (state == CIRCUIT_HALF_OPEN and self.probing)
+
+    def allow_request(self):
+        with self._lock:
+            state = self._state()
+            if state == CIRCUIT_CLOSED:
+                return True
+            if state == CIRCUIT_HALF_OPEN and not self.probing:
+                self.probing = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            if self.opened_at is not None:
+                _logger.info('Circuito Zoom cerrado: la API vuelve a responder')
+            self.failures = 0
+            self.opened_at = None
+            self.probing = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.probing or self.failures >= self.failure_threshold:
+                if self.opened_at is None or self.probing:
+                    _logger.warning('Circuito Zoom abierto tras %s fallos consecutivos', self.failures)
+                self.opened_at = time.monotonic()
+                self.probing = False
+
+    def reset(self):
+        self.record_success()
+
+
+_breakers = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(dbname, config_id, failure_threshold=DEFAULT_FAILURE_THRESHOLD,
+                        reset_timeout=DEFAULT_RESET_TIMEOUT):
+    """Circuit breaker compartido por base de datos y configuración"""
+    key = (dbname, config_id)
+    with _breakers_lock:
+        breaker = _breakers.get(key)
+        if breaker is None:
+            breaker = _breakers[key] = ZoomCircuitBreaker(failure_threshold, reset_timeout)
+        breaker.failure_threshold = failure_threshold
+        breaker.reset_timeout = reset_timeout
+        return breaker
+
+
+def endpoint_template(url):
+    """Endpoint de la API sin identificadores: ``/users/{id}/meetings``
+
+    Agrupa las métricas por endpoint y no por reunión o usuario concreto.
+    """
+    segments = [segment for segment in urlparse(url).path.split('/') if segment]
+    if segments[:1] == ['v2']:
+        segments = segments[1:]
+    template = []
+    for index, segment in enumerate(segments):
+        if index and segments[index - 1] in ZOOM_ID_COLLECTIONS and segment != 'me':
+            segment = '{id}'
+        template.append(segment)
+    return '/' + '/'.join(template)
+
+
+class ZoomApiMetrics:
+    """Contadores en memoria de las llamadas a la API de Zoom
+
+    Acumula por hora, endpoint, método y estado el número de llamadas,
+    reintentos, errores, 429 y el histograma de latencia. Es seguro entre
+    hilos y no toca el ORM; ``zoom.api.metric`` vuelca periódicamente lo
+    acumulado (``drain``) en su tabla de agregados.
+    """
+
+    def __init__(self):
+        self._data = {}
+        self._lock = threading.Lock()
+        self.last_drain = time.monotonic()
+
+    def record(self, method, url, status, elapsed=None, retry=False):
+        """Registrar una llamada; ``elapsed`` en segundos (None si no salió a la red)"""
+        period = datetime.now(timezone.utc).replace(tzinfo=None, minute=0, second=0, microsecond=0)
+        key = (period, endpoint_template(url), method.upper(), str(status))
+        is_error = not isinstance(status, int) or status >= 400
+        with self._lock:
+            values = self._data.get(key)
+            if values is None:
+                values = self._data[key] = {
+                    'call_count': 0,
+                    'retry_count': 0,
+                    'error_count': 0,
+                    'throttled_count': 0,
+                    'total_time': 0.0,
+                    'max_time': 0.0,
+                    'buckets': [0] * (len(LATENCY_BUCKETS_MS) + 1),
+                }
+            values['call_count'] += 1
+            values['retry_count'] += int(bool(retry))
+            values['error_count'] += int(is_error)
+            values['throttled_count'] += int(status == 429)
+            if elapsed is not None:
+                values['total_time'] += elapsed
+                values['max_time'] = max(values['max_time'], elapsed)
+                milliseconds = elapsed * 1000
+                index = next((i for i, limit in enumerate(LATENCY_BUCKETS_MS) if milliseconds <= limit),
+                             len(LATENCY_BUCKETS_MS))
+                values['buckets'][index] += 1
+
+    def due(self, interval):
+        """True si hay datos y han pasado ``interval`` segundos desde el último volcado"""
+        with self._lock:
+            return bool(self._data) and time.monotonic() - self.last_drain >= interval
+
+    def drain(self):
+        """Devolver lo acumulado y empezar de cero"""
+        with self._lock:
+            data, self._data = self._data, {}
+            self.last_drain = time.monotonic()
+            return data
+
+    def restore(self, data):
+        """Devolver al acumulador un volcado que no se pudo guardar"""
+        with self._lock:
+            for key, values in data.items():
+                current = self._data.get(key)
+                if current is None:
+                    self._data[key] = dict(values, buckets=list(values['buckets']))
+                    continue
+                for name in ('call_count', 'retry_count', 'error_count', 'throttled_count', 'total_time'):
+                    current[name] += values[name]
+                current['max_time'] = max(current['max_time'], values['max_time'])
+                current['buckets'] = [a + b for a, b in zip(current['buckets'], values['buckets'])]
+
+
+_api_metrics = {}
+_api_metrics_lock = threading.Lock()
+
+
+def get_api_metrics(dbname):
+    """Acumulador de métricas compartido por todas las llamadas de una base de datos"""
+    with _api_metrics_lock:
+        metrics = _api_metrics.get(dbname)
+        if metrics is None:
+            metrics = _api_metrics[dbname] = ZoomApiMetrics()
+        return metrics
+
+
+# Llamadas del perfil en curso (ver ``trace_http``); se hereda al copiar el contexto a un hilo
+_http_trace = contextvars.ContextVar('zoom_http_trace', default=None)
+
+
+@contextmanager
+def trace_http():
+    """Anotar en una lista ``(método, endpoint, estado, segundos)`` cada llamada a Zoom
+
+    Las llamadas hechas en hilos secundarios solo se anotan si el hilo se lanza
+    con ``contextvars.copy_context().run``.
+    """
+    calls = []
+    token = _http_trace.set(calls)
+    try:
+        yield calls
+    finally:
+        _http_trace.reset(token)
+
+
+def zoom_request(method, url, breaker=None, session=None, metrics=None, retry=False, **kwargs):
+    """Hacer una llamada HTTP a Zoom pasando por el circuit breaker
+
+    Sin ORM, para poder usarse desde hilos secundarios. Lanza
+    ``ZoomUnavailable`` sin tocar la red si el circuito está abierto. Con
+    ``metrics`` (``ZoomApiMetrics``) registra estado y latencia de la llamada;
+    ``retry`` la marca como reintento de una operación anterior. Dentro de
+    ``trace_http`` la llamada también se anota en su lista.
+    """
+    trace = _http_trace.get()
+
+    def record(status, elapsed=None):
+        if metrics:
+            metrics.record(method, url, status, elapsed, retry=retry)
+        if trace is not None:
+            trace.append((method.upper(), endpoint_template(url), str(status), elapsed or 0.0))
+        if _logger.isEnabledFor(logging.DEBUG):
+            _logger.debug('Zoom %s %s → %s (%.0f ms)', method.upper(), endpoint_template(url), status,
+                          (elapsed or 0.0) * 1000)
+
+    if breaker and not breaker.allow_request():
+        record(STATUS_CIRCUIT_OPEN)
+        raise ZoomUnavailable(_('Zoom no está disponible en este momento. Inténtelo de nuevo en unos minutos.'))
+    http = session or requests
+    kwargs.setdefault('timeout', 30)
+    start = time.monotonic()
+    try:
+        response = getattr(http, method.lower())(url, **kwargs)
+    except requests.exceptions.RequestException:
+        record(STATUS_ERROR, time.monotonic() - start)
+        if breaker:
+            breaker.record_failure()
+        raise
+    record(response.status_code, time.monotonic() - start)
+    if breaker:
+        if response.status_code in ZOOM_FAILURE_STATUS:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+    return response
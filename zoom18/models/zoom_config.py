@@ -1,13 +1,61 @@
 # -*- coding: utf-8 -*-
 
-from odoo import models, fields, api, _
+from odoo import models, fields, api, tools, _
 from odoo.exceptions import UserError, ValidationError
 import requests
 import json
-import logging
 from datetime import datetime, timedelta
 
-_logger = logging.getLogger(__name__)
+from .zoom_client import (
+    ZoomUnavailable, DEFAULT_FAILURE_THRESHOLD, DEFAULT_RESET_TIMEOUT, STATUS_CIRCUIT_OPEN,
+    get_api_metrics, get_circuit_breaker, zoom_request,
+)
+from .zoom_profile import profiled
+from .zoom_logging import get_logger
+
+_logger = get_logger(__name__)
+
+# Tamaño máximo de página admitido por los endpoints de listado de Zoom
+ZOOM_PAGE_SIZE = 300
+
+# Endpoint OAuth Server-to-Server de Zoom
+DEFAULT_TOKEN_URL = 'https://zoom.us/oauth/token'
+
+# Elementos por lote de los crons (ver cron_batch_size)
+DEFAULT_CRON_BATCH_SIZE = 100
+
+# Campos cuyo cambio invalida la caché de _get_profiling_settings
+PROFILING_FIELDS = {'profiling_enabled', 'profiling_sample_rate', 'profiling_min_duration', 'profiling_python'}
+
+# Segundos a partir de los cuales una sincronización se considera lenta (ver sync_slow_threshold)
+DEFAULT_SYNC_SLOW_THRESHOLD = 600
+
+# Antelación de los recordatorios automáticos, en minutos (ver reminder_offsets)
+DEFAULT_REMINDER_OFFSETS = '60'
+
+
+def iter_zoom_pages(base_url, headers, path, items_key, params=None, page_token=None, session=None, breaker=None,
+                    metrics=None):
+    """Recorrer un endpoint paginado de Zoom sin tocar el ORM
+
+    Puede ejecutarse desde hilos secundarios (descarga concurrente por
+    anfitrión), por eso solo recibe valores planos y no el entorno.
+    """
+    params = dict(params or {})
+    params.setdefault('page_size', ZOOM_PAGE_SIZE)
+    while True:
+        if page_token:
+            params['next_page_token'] = page_token
+        response = zoom_request('GET', f'{base_url}{path}', breaker=breaker, session=session, metrics=metrics,
+                                headers=headers, params=params)
+        if response.status_code != 200:
+            _logger.error('Error obteniendo %s: %s - %s', path, response.status_code, response.text)
+            raise UserError(_('Error obteniendo datos de Zoom: %s') % response.text)
+        data = response.json()
+        page_token = data.get('next_page_token') or None
+        yield data.get(items_key, []), page_token
+        if not page_token:
+            break
 
 
 class ZoomConfig(models.Model):
@@ -52,6 +100,13 @@ class ZoomConfig(models.Model):
         help='URL base de la API de Zoom'
     )
     
+    token_url = fields.Char(
+        string='URL de Token OAuth',
+        default=DEFAULT_TOKEN_URL,
+        required=True,
+        help='Endpoint OAuth Server-to-Server de Zoom (cambiar solo para apuntar a un servidor de pruebas)'
+    )
+    
     
     auto_record = fields.Boolean(
         string='Grabación Automática',
@@ -95,6 +150,7 @@ class ZoomConfig(models.Model):
     is_configured = fields.Boolean(
         string='Configurado',
         compute='_compute_is_configured',
+        search='_search_is_configured',
         help='Indica si la configuración está completa'
     )
     
@@ -104,6 +160,115 @@ class ZoomConfig(models.Model):
         help='Estado actual de la configuración'
     )
     
+    # === CIRCUIT BREAKER ===
+    circuit_failure_threshold = fields.Integer(
+        string='Fallos para Abrir el Circuito',
+        default=DEFAULT_FAILURE_THRESHOLD,
+        help='Fallos consecutivos de Zoom tras los cuales las llamadas fallan al instante'
+    )
+
+    circuit_reset_timeout = fields.Integer(
+        string='Espera del Circuito (s)',
+        default=DEFAULT_RESET_TIMEOUT,
+        help='Segundos con el circuito abierto antes de probar de nuevo con una llamada'
+    )
+
+    circuit_state = fields.Selection([
+        ('closed', 'Disponible'),
+        ('open', 'No Disponible'),
+        ('half_open', 'Probando'),
+    ], string='Estado de Zoom', compute='_compute_circuit_state',
+        help='Estado del circuit breaker en este proceso')
+
+    # === SINCRONIZACIÓN DE LA CUENTA ===
+    sync_scope = fields.Selection([
+        ('me', 'Solo el usuario de la aplicación'),
+        ('account', 'Todos los anfitriones de la cuenta'),
+    ], string='Alcance de Sincronización', default='me', required=True,
+        help='Sincronizar solo /users/me o las reuniones de todos los anfitriones con licencia')
+
+    sync_max_workers = fields.Integer(
+        string='Descargas Paralelas',
+        default=4,
+        help='Número máximo de anfitriones descargados en paralelo'
+    )
+
+    sync_partitions = fields.Integer(
+        string='Particiones de Cron',
+        default=1,
+        help='Número de crons que se reparten los anfitriones (host.id % particiones)'
+    )
+
+    cron_batch_size = fields.Integer(
+        string='Lote por Ejecución de Cron',
+        default=DEFAULT_CRON_BATCH_SIZE,
+        help='Elementos que procesa cada lote de los crons (reuniones, anfitriones, '
+             'recordatorios o tickets). Entre lotes se confirma la transacción y se liberan los bloqueos.'
+    )
+
+    reminder_offsets = fields.Char(
+        string='Recordatorios (min antes)',
+        default=DEFAULT_REMINDER_OFFSETS,
+        help='Minutos de antelación de los recordatorios automáticos, separados por comas. '
+             'Por ejemplo "1440,60" envía uno el día anterior y otro una hora antes.'
+    )
+
+    sync_slow_threshold = fields.Integer(
+        string='Alerta de Sincronización Lenta (s)',
+        default=DEFAULT_SYNC_SLOW_THRESHOLD,
+        help='Las ejecuciones que tarden más se marcan como lentas y se avisa en el log '
+             'y por email; 0 desactiva la alerta'
+    )
+
+    sync_alert_email = fields.Char(
+        string='Email de Alertas',
+        help='Destinatario de los avisos de sincronización lenta'
+    )
+
+    # === PERFILADO ===
+    profiling_enabled = fields.Boolean(
+        string='Perfilado de Rendimiento',
+        default=False,
+        help='Perfila la sincronización, la creación de tickets y de reuniones instantáneas y los crons: '
+             'tiempo total, consultas SQL y llamadas a Zoom. Añade coste a cada acción perfilada.'
+    )
+
+    profiling_sample_rate = fields.Integer(
+        string='Muestreo de Perfilado (%)',
+        default=100,
+        help='Porcentaje de ejecuciones que se perfilan'
+    )
+
+    profiling_min_duration = fields.Integer(
+        string='Duración Mínima del Perfil (ms)',
+        default=0,
+        help='Solo se guardan los perfiles de las acciones que tardan al menos esto'
+    )
+
+    profiling_python = fields.Boolean(
+        string='Perfil de Python (cProfile)',
+        default=False,
+        help='Guarda además las funciones de Python más costosas; ralentiza bastante la acción perfilada'
+    )
+
+    profile_count = fields.Integer(
+        string='Perfiles',
+        compute='_compute_profile_count'
+    )
+
+    sync_cycle = fields.Integer(
+        string='Ciclo de Sincronización',
+        default=0,
+        readonly=True,
+        help='Ciclo actual de sincronización de la cuenta; los anfitriones con un ciclo menor están pendientes'
+    )
+
+    host_ids = fields.One2many(
+        'zoom.host',
+        'config_id',
+        string='Anfitriones'
+    )
+
     connection_status = fields.Selection([
         ('not_configured', 'No Configurado'),
         ('configured', 'Configurado'),
@@ -111,6 +276,19 @@ class ZoomConfig(models.Model):
         ('error', 'Error de Conexión'),
     ], string='Estado de Conexión', default='not_configured', help='Estado actual de la conexión con Zoom')
 
+    def _search_is_configured(self, operator, value):
+        if operator not in ('=', '!='):
+            raise UserError(_('Operador no soportado para "Configurado": %s') % operator)
+        domain = [
+            ('client_id', '!=', False),
+            ('client_secret', '!=', False),
+            ('account_id', '!=', False),
+            ('connection_status', '=', 'connected'),
+        ]
+        if (operator == '=') == bool(value):
+            return domain
+        return ['!'] + ['&'] * (len(domain) - 1) + domain
+
     @api.depends('client_id', 'client_secret', 'account_id', 'connection_status')
     def _compute_is_configured(self):
         """Calcular si la configuración está completa"""
@@ -128,6 +306,10 @@ class ZoomConfig(models.Model):
             if not has_credentials and record.connection_status != 'not_configured':
                 record.connection_status = 'not_configured'
     
+    def _compute_circuit_state(self):
+        for record in self:
+            record.circuit_state = record._get_circuit_breaker().state if record.id else 'closed'
+
     @api.depends('is_configured', 'connection_status', 'access_token', 'token_expires')
     def _compute_config_status(self):
         """Calcular el estado de configuración"""
@@ -183,6 +365,87 @@ class ZoomConfig(models.Model):
             config = self.create({})
         return config
     
+    @api.model
+    def _get_cron_batch_size(self):
+        """Tamaño de lote de los crons, sin crear configuración si no existe"""
+        config = self.search([('is_configured', '=', True)], limit=1)
+        return max(1, config.cron_batch_size or DEFAULT_CRON_BATCH_SIZE)
+
+    @api.model
+    def _get_reminder_offsets(self):
+        """Antelaciones de los recordatorios en minutos, de mayor a menor"""
+        config = self.search([('is_configured', '=', True)], limit=1)
+        return self._parse_reminder_offsets(config.reminder_offsets or DEFAULT_REMINDER_OFFSETS)
+
+    @api.model
+    def _parse_reminder_offsets(self, value):
+        offsets = set()
+        for part in (value or '').split(','):
+            part = part.strip()
+            if not part:
+                continue
+            if not part.isdigit() or not int(part):
+                raise ValidationError(_('Antelación de recordatorio no válida: "%s". Use minutos enteros separados por comas.') % part)
+            offsets.add(int(part))
+        return sorted(offsets, reverse=True)
+
+    @api.constrains('reminder_offsets')
+    def _check_reminder_offsets(self):
+        for config in self:
+            config._parse_reminder_offsets(config.reminder_offsets)
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        configs = super().create(vals_list)
+        self.env['zoom.dashboard']._invalidate_cache()
+        if any(vals.get('profiling_enabled') for vals in vals_list):
+            self.env.registry.clear_cache()
+        return configs
+
+    def write(self, vals):
+        result = super().write(vals)
+        self.env['zoom.dashboard']._invalidate_cache()
+        if 'reminder_offsets' in vals:
+            # Las nuevas antelaciones se aplican a las reuniones ya programadas
+            self.env['zoom.scheduled.job'].sudo()._reschedule_all()
+        if PROFILING_FIELDS.intersection(vals):
+            self.env.registry.clear_cache()
+        return result
+
+    def unlink(self):
+        profiling = any(self.mapped('profiling_enabled'))
+        result = super().unlink()
+        self.env['zoom.dashboard']._invalidate_cache()
+        if profiling:
+            self.env.registry.clear_cache()
+        return result
+
+    def _compute_profile_count(self):
+        counts = dict(self.env['zoom.profile'].sudo()._read_group(
+            [('config_id', 'in', self.ids)], groupby=['config_id'], aggregates=['__count']))
+        for config in self:
+            config.profile_count = counts.get(config, 0)
+
+    @api.model
+    @tools.ormcache()
+    def _get_profiling_settings(self):
+        """``(config_id, muestreo %, duración mínima ms, cProfile)`` o None si no se perfila
+
+        En caché: las acciones perfiladas lo consultan en cada llamada. Se
+        invalida al cambiar los campos de perfilado.
+        """
+        config = self.sudo().search([('profiling_enabled', '=', True)], limit=1)
+        if not config:
+            return None
+        return (config.id, config.profiling_sample_rate, config.profiling_min_duration, config.profiling_python)
+
+    def action_view_profiles(self):
+        """Ver los perfiles de rendimiento guardados"""
+        self.ensure_one()
+        action = self.env['ir.actions.act_window']._for_xml_id('zoom18.action_zoom_profile')
+        action['domain'] = [('config_id', '=', self.id)]
+        return action
+
     @api.model
     def get_active_config(self):
         """Obtener configuración activa de Zoom"""
@@ -282,6 +545,7 @@ class ZoomConfig(models.Model):
                 'account_id': '',  # Debe ser configurado por el usuario
                 'webhook_secret': '',  # Opcional
                 'base_url': 'https://api.zoom.us/v2',
+                'token_url': DEFAULT_TOKEN_URL,
                 'auto_record': False,
                 'waiting_room': True,
                 'join_before_host': False,
@@ -303,22 +567,15 @@ class ZoomConfig(models.Model):
                 self._compute_is_configured()
                 self._compute_config_status()
             
+            # Una prueba explícita siempre llega a Zoom aunque el circuito esté abierto
+            self._get_circuit_breaker().reset()
+            
             # Si no hay token, obtener uno
             if not self.access_token or (self.token_expires and self.token_expires <= fields.Datetime.now()):
                 self._get_access_token()
             
-            # Probar conexión con API usando JWT
-            headers = {
-                'Authorization': f'Bearer {self.access_token}',
-                'Content-Type': 'application/json'
-            }
-            
             # Usar endpoint de lista de usuarios ya que no tenemos user:read:user:admin
-            response = requests.get(
-                f'{self.base_url}/users',
-                headers=headers,
-                timeout=10
-            )
+            response = self._zoom_request('GET', '/users', timeout=10)
             
             if response.status_code == 200:
                 self.connection_status = 'connected'
@@ -328,7 +585,7 @@ class ZoomConfig(models.Model):
                 try:
                     self._auto_sync_after_config()
                 except Exception as sync_error:
-                    _logger.warning(f'Error en sincronización automática: {sync_error}')
+                    _logger.warning('Error en sincronización automática: %s', sync_error)
                 
                 # Forzar actualización de la vista y recargar
                 self.env.invalidate_all()
@@ -360,65 +617,13 @@ class ZoomConfig(models.Model):
 
     def _auto_sync_after_config(self):
         """Sincronización automática después de configuración exitosa"""
+        self.ensure_one()
         try:
             _logger.info('Iniciando sincronización automática después de configuración...')
-            
-            # Obtener token de acceso
-            self._get_access_token()
-            
-            # Sincronizar reuniones desde Zoom
-            import requests
-            headers = {
-                'Authorization': f'Bearer {self.access_token}',
-                'Content-Type': 'application/json'
-            }
-        
-            # Obtener reuniones del usuario
-            meetings_url = f"{self.base_url}/users/me/meetings"
-            response = requests.get(meetings_url, headers=headers, timeout=30)
-            
-            if response.status_code == 200:
-                meetings_data = response.json()
-                meetings = meetings_data.get('meetings', [])
-                
-                synced_count = 0
-                # Actualizar reuniones en Odoo
-                for meeting_data in meetings:
-                    meeting_id = meeting_data.get('id')
-                    existing_meeting = self.env['zoom.meeting'].search([('zoom_meeting_id', '=', meeting_id)], limit=1)
-                    
-                    if not existing_meeting:
-                        # Convertir fecha de Zoom a formato Odoo
-                        start_time_str = meeting_data.get('start_time')
-                        if start_time_str:
-                            from datetime import datetime
-                            try:
-                                # Zoom devuelve fechas en formato ISO
-                                start_time = datetime.fromisoformat(start_time_str.replace('Z', '+00:00'))
-                                duration = meeting_data.get('duration', 60)
-                                
-                                # Crear reunión en Odoo
-                                self.env['zoom.meeting'].create({
-                                    'name': meeting_data.get('topic', 'Reunión Zoom'),
-                                    'zoom_meeting_id': meeting_id,
-                                    'start_time': start_time,
-                                    'duration': duration,
-                                    'join_url': meeting_data.get('join_url', ''),
-                                    'password': meeting_data.get('password', ''),
-                                    'status': 'scheduled',
-                                    'participants_count': meeting_data.get('participants_count', 0),
-                                })
-                                synced_count += 1
-                            except Exception as e:
-                                _logger.warning(f'Error creando reunión {meeting_id}: {e}')
-                
-                _logger.info(f'Sincronización automática completada: {synced_count} reuniones sincronizadas')
-                
-            else:
-                _logger.warning(f'Error obteniendo reuniones: {response.status_code} - {response.text}')
-                
+            stats = self.env['zoom.sync.pipeline'].run_sync(self, trigger='config')
+            _logger.info('Sincronización automática completada: %s reuniones sincronizadas', stats['created'])
         except Exception as e:
-            _logger.error(f'Error en sincronización automática: {e}')
+            _logger.error('Error en sincronización automática: %s', e)
             raise
 
     def _get_access_token(self):
@@ -444,11 +649,9 @@ class ZoomConfig(models.Model):
                 'account_id': self.account_id
             }
             
-            # URL del endpoint de token de Zoom para Server-to-Server OAuth
-            token_url = "https://zoom.us/oauth/token"
-            
-            # Hacer la petición
-            response = requests.post(token_url, headers=headers, data=data, timeout=30)
+            # Hacer la petición al endpoint de token Server-to-Server OAuth
+            response = zoom_request('POST', self.token_url or DEFAULT_TOKEN_URL, breaker=self._get_circuit_breaker(),
+                                    metrics=self._get_api_metrics(), headers=headers, data=data)
             
             if response.status_code == 200:
                 token_data = response.json()
@@ -463,262 +666,157 @@ class ZoomConfig(models.Model):
                 })
                 _logger.info('Token Server-to-Server OAuth obtenido exitosamente para Zoom')
             else:
-                _logger.error(f'Error obteniendo token Server-to-Server OAuth: {response.status_code} - {response.text}')
+                _logger.error('Error obteniendo token Server-to-Server OAuth: %s - %s', response.status_code, response.text)
                 raise UserError(_('Error obteniendo token Server-to-Server OAuth: %s') % response.text)
                 
+        except ZoomUnavailable:
+            raise
         except Exception as e:
-            _logger.error(f'Error obteniendo token Server-to-Server OAuth: {str(e)}')
+            _logger.error('Error obteniendo token Server-to-Server OAuth: %s', e)
             raise UserError(_('Error obteniendo token Server-to-Server OAuth: %s') % str(e))
 
+    def _ensure_access_token(self):
+        """Obtener un token nuevo solo si no existe o está expirado"""
+        self.ensure_one()
+        if not self.access_token or (self.token_expires and self.token_expires <= fields.Datetime.now()):
+            self._get_access_token()
+        if not self.access_token:
+            raise UserError(_('No se pudo obtener el token de acceso'))
+
+    def _get_api_headers(self):
+        """Cabeceras comunes para las llamadas a la API de Zoom"""
+        self.ensure_one()
+        self._ensure_access_token()
+        return {
+            'Authorization': f'Bearer {self.access_token}',
+            'Content-Type': 'application/json'
+        }
+
+    def _get_circuit_breaker(self):
+        """Circuit breaker de esta configuración (compartido en el proceso)"""
+        self.ensure_one()
+        return get_circuit_breaker(
+            self.env.cr.dbname, self.id,
+            failure_threshold=self.circuit_failure_threshold or DEFAULT_FAILURE_THRESHOLD,
+            reset_timeout=self.circuit_reset_timeout or DEFAULT_RESET_TIMEOUT,
+        )
+
+    def _get_api_metrics(self):
+        """Acumulador de métricas de las llamadas a Zoom (ver ``zoom.api.metric``)"""
+        return get_api_metrics(self.env.cr.dbname)
+
+    def _zoom_request(self, method, path, **kwargs):
+        """Llamada a la API de Zoom con token y circuit breaker
+
+        Lanza ``ZoomUnavailable`` al instante si Zoom lleva varios fallos
+        seguidos, en lugar de esperar al timeout.
+        """
+        self.ensure_one()
+        breaker = self._get_circuit_breaker()
+        metrics = self._get_api_metrics()
+        url = f'{self.base_url}{path}'
+        if breaker.is_open():
+            metrics.record(method, url, STATUS_CIRCUIT_OPEN)
+            raise ZoomUnavailable(_('Zoom no está disponible en este momento. Inténtelo de nuevo en unos minutos.'))
+        kwargs.setdefault('headers', self._get_api_headers())
+        try:
+            return zoom_request(method, url, breaker=breaker, metrics=metrics, **kwargs)
+        finally:
+            self.env['zoom.api.metric']._flush_buffer()
+
+    def _zoom_get_pages(self, path, items_key, params=None, page_token=None):
+        """Recorrer un endpoint paginado de Zoom (next_page_token)
+
+        Genera tuplas ``(items, next_page_token)`` página a página para que el
+        llamador pueda procesar y confirmar cada página por separado.
+        """
+        self.ensure_one()
+        return iter_zoom_pages(self.base_url, self._get_api_headers(), path, items_key,
+                               params=params, page_token=page_token, breaker=self._get_circuit_breaker(),
+                               metrics=self._get_api_metrics())
+
     @api.model
-    def _sync_meetings_automatically(self):
-        """Sincronización automática de reuniones con Zoom"""
+    @profiled
+    def _sync_meetings_automatically(self, partition=0):
+        """Sincronización automática de reuniones con Zoom (cron)
+
+        Con alcance de cuenta, ``partition`` permite repartir los anfitriones
+        entre varios crons (``sync_partitions``). Cada llamada procesa un lote
+        de ``cron_batch_size`` reuniones (o anfitriones) e informa del progreso
+        a ``ir.cron``, que confirma y vuelve a llamar mientras quede trabajo.
+        """
         try:
             config = self.get_active_config()
             if not config or not config.is_configured:
                 _logger.info('Sincronización automática omitida: configuración no disponible')
                 return
-            
-            # Obtener reuniones desde Zoom
-            meetings = config.get_meetings_from_zoom()
-            if not meetings:
-                _logger.info('Sincronización automática: no se encontraron reuniones en Zoom')
+
+            stats = self.env['zoom.sync.pipeline'].run_sync(
+                config, trigger='cron', partition=partition, auto_commit=True,
+                limit=config.cron_batch_size or DEFAULT_CRON_BATCH_SIZE)
+            if stats is None:
                 return
-        
-            # Crear o actualizar reuniones en Odoo
-            synced_count = 0
-            for meeting_data in meetings:
-                # Convertir fecha de Zoom a formato Odoo
-                start_time_str = meeting_data.get('start_time')
-                start_time = None
-                if start_time_str:
-                    try:
-                        from datetime import datetime
-                        # Convertir de ISO 8601 a formato Odoo (naive datetime)
-                        start_time = datetime.fromisoformat(start_time_str.replace('Z', '+00:00')).replace(tzinfo=None)
-                    except Exception as e:
-                        _logger.warning(f'Error convirtiendo fecha {start_time_str}: {e}')
-                
-                existing_meeting = self.env['zoom.meeting'].search([
-                    ('meeting_id', '=', meeting_data.get('id'))
-                ], limit=1)
-                
-                if existing_meeting:
-                    # Actualizar reunión existente
-                    existing_meeting.write({
-                        'name': meeting_data.get('topic', ''),
-                        'start_time': start_time,
-                        'duration': meeting_data.get('duration', 0),
-                        'join_url': meeting_data.get('join_url', ''),
-                        'start_url': meeting_data.get('start_url', ''),
-                        'status': meeting_data.get('status', 'scheduled'),
-                    })
-                else:
-                    # Crear nueva reunión
-                    self.env['zoom.meeting'].create({
-                        'name': meeting_data.get('topic', ''),
-                        'meeting_id': meeting_data.get('id'),
-                        'start_time': start_time,
-                        'duration': meeting_data.get('duration', 0),
-                        'join_url': meeting_data.get('join_url', ''),
-                        'start_url': meeting_data.get('start_url', ''),
-                        'status': meeting_data.get('status', 'scheduled'),
-                    })
-                synced_count += 1
-            
-            _logger.info(f'Sincronización automática completada: {synced_count} reuniones procesadas')
-            
+            self.env['ir.cron']._notify_progress(done=stats['processed'], remaining=stats['remaining'])
+            _logger.info('Sincronización automática: %s procesadas en este lote, %s pendientes', stats['processed'], stats['remaining'])
+
         except Exception as e:
-            _logger.error(f'Error en sincronización automática: {str(e)}')
+            _logger.error('Error en sincronización automática: %s', e)
             # No lanzar excepción para evitar que falle el cron job
 
+    @profiled
     def sync_meetings_manually(self):
         """Sincronizar reuniones manualmente sin webhooks"""
+        self.ensure_one()
+        if self.use_webhooks:
+            raise UserError(_('Los webhooks están activados. La sincronización manual no es necesaria.'))
+
         try:
-            if not self.use_webhooks:
-                # Obtener token de acceso
-                self._get_access_token()
-                
-                # Sincronizar reuniones desde Zoom
-                import requests
-                headers = {
-                    'Authorization': f'Bearer {self.access_token}',
-                    'Content-Type': 'application/json'
-                }
-                
-                # Obtener reuniones del usuario
-                meetings_url = f"{self.base_url}/users/me/meetings"
-                response = requests.get(meetings_url, headers=headers, timeout=30)
-                
-                if response.status_code == 200:
-                    meetings_data = response.json()
-                    meetings = meetings_data.get('meetings', [])
-                    
-                    # Actualizar reuniones en Odoo
-                    for meeting_data in meetings:
-                        meeting_id = meeting_data.get('id')
-                        existing_meeting = self.env['zoom.meeting'].search([('zoom_meeting_id', '=', meeting_id)], limit=1)
-                        
-                        if not existing_meeting:
-                            # Convertir fecha de Zoom a formato Odoo
-                            start_time_str = meeting_data.get('start_time')
-                            start_time = None
-                            if start_time_str:
-                                try:
-                                    from datetime import datetime
-                                    # Convertir de ISO 8601 a formato Odoo (naive datetime)
-                                    start_time = datetime.fromisoformat(start_time_str.replace('Z', '+00:00')).replace(tzinfo=None)
-                                except Exception as e:
-                                    _logger.warning(f'Error convirtiendo fecha {start_time_str}: {e}')
-                            
-                            # Crear nueva reunión
-                            meeting = self.env['zoom.meeting'].create({
-                                'name': meeting_data.get('topic', 'Reunión Zoom'),
-                                'meeting_id': meeting_id,
-                                'start_time': start_time,
-                                'duration': meeting_data.get('duration', 60),
-                                'join_url': meeting_data.get('join_url'),
-                                'status': 'scheduled',
-                                'zoom_created': True
-                            })
-                            
-                            # Crear evento en calendario automáticamente
-                            meeting._create_calendar_event()
-                    
-                    _logger.info(f'Sincronizadas {len(meetings)} reuniones desde Zoom')
-                    return {
-                        'type': 'ir.actions.client',
-                        'tag': 'display_notification',
-                        'params': {
-                            'title': 'Sincronización Exitosa',
-                            'message': f'Se sincronizaron {len(meetings)} reuniones desde Zoom',
-                            'type': 'success',
-                        }
-                    }
-                else:
-                    _logger.error(f'Error sincronizando reuniones: {response.status_code} - {response.text}')
-                    raise UserError(_('Error sincronizando reuniones: %s') % response.text)
-            else:
-                raise UserError(_('Los webhooks están activados. La sincronización manual no es necesaria.'))
-                
+            stats = self.env['zoom.sync.pipeline'].run_sync(self, trigger='manual')
         except Exception as e:
-            _logger.error(f'Error en sincronización manual: {str(e)}')
+            _logger.error('Error en sincronización manual: %s', e)
             raise UserError(_('Error en sincronización manual: %s') % str(e))
 
+        return {
+            'type': 'ir.actions.client',
+            'tag': 'display_notification',
+            'params': {
+                'title': _('Sincronización Exitosa'),
+                'message': _('Se sincronizaron %(total)s reuniones desde Zoom (%(created)s nuevas, %(updated)s actualizadas)') % {
+                    'total': stats['fetched'],
+                    'created': stats['created'],
+                    'updated': stats['updated'],
+                },
+                'type': 'success',
+            }
+        }
+
     def get_meetings_from_zoom(self):
-        """Obtener reuniones desde Zoom API"""
+        """Obtener todas las reuniones del usuario desde Zoom API"""
+        self.ensure_one()
         try:
-            # Obtener token si es necesario
-            if not self.access_token or (self.token_expires and self.token_expires <= fields.Datetime.now()):
-                self._get_access_token()
-            
-            if not self.access_token:
-                raise UserError(_('No se pudo obtener el token de acceso'))
-            
-            headers = {
-                'Authorization': f'Bearer {self.access_token}',
-                'Content-Type': 'application/json'
-            }
-            
-            # Obtener reuniones del usuario
-            response = requests.get(
-                f'{self.base_url}/users/me/meetings',
-                headers=headers,
-                timeout=30
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                meetings = data.get('meetings', [])
-                _logger.info(f'Obtenidas {len(meetings)} reuniones desde Zoom')
-                return meetings
-            else:
-                _logger.error(f'Error obteniendo reuniones: {response.status_code} - {response.text}')
-                raise UserError(_('Error obteniendo reuniones: %s') % response.text)
-                
+            meetings = []
+            for page, _next_token in self._zoom_get_pages('/users/me/meetings', 'meetings'):
+                meetings.extend(page)
+            _logger.info('Obtenidas %s reuniones desde Zoom', len(meetings))
+            return meetings
         except Exception as e:
-            _logger.error(f'Error obteniendo reuniones desde Zoom: {str(e)}')
+            _logger.error('Error obteniendo reuniones desde Zoom: %s', e)
             raise UserError(_('Error obteniendo reuniones desde Zoom: %s') % str(e))
 
     def sync_meetings_automatically(self):
         """Sincronización automática de reuniones desde Zoom a Odoo"""
+        self.ensure_one()
         try:
             _logger.info('Iniciando sincronización automática de reuniones...')
-            
-            # Obtener reuniones desde Zoom
-            zoom_meetings = self.get_meetings_from_zoom()
-            
-            if not zoom_meetings:
-                _logger.info('No hay reuniones en Zoom para sincronizar')
-                return
-            
-            # Obtener reuniones existentes en Odoo
-            existing_meetings = self.env['zoom.meeting'].search([])
-            existing_zoom_ids = set(existing_meetings.mapped('meeting_id'))
-            
-            created_count = 0
-            updated_count = 0
-            
-            for meeting_data in zoom_meetings:
-                zoom_id = str(meeting_data.get('id'))
-                topic = meeting_data.get('topic', 'Sin título')
-                start_time = meeting_data.get('start_time')
-                duration = meeting_data.get('duration', 0)
-                join_url = meeting_data.get('join_url', '')
-                status = meeting_data.get('status', 'scheduled')
-                
-                # Convertir fecha de Zoom a formato Odoo
-                if start_time:
-                    try:
-                        from datetime import datetime
-                        odoo_date = datetime.fromisoformat(start_time.replace('Z', '+00:00')).replace(tzinfo=None)
-                    except:
-                        odoo_date = fields.Datetime.now()
-                else:
-                    odoo_date = fields.Datetime.now()
-                
-                # Determinar estado de control total del equipo
-                control_status = self._get_control_status(status, start_time)
-                
-                if zoom_id in existing_zoom_ids:
-                    # Actualizar reunión existente
-                    existing_meeting = existing_meetings.filtered(lambda m: m.meeting_id == zoom_id)
-                    if existing_meeting:
-                        existing_meeting.write({
-                            'name': topic,
-                            'start_time': odoo_date,
-                            'duration': duration,
-                            'join_url': join_url,
-                            'status': 'active' if status == 'started' else 'scheduled',
-                            'last_sync': fields.Datetime.now(),
-                        })
-                        updated_count += 1
-                else:
-                    # Crear nueva reunión
-                    self.env['zoom.meeting'].create({
-                        'name': topic,
-                        'meeting_id': zoom_id,
-                        'start_time': odoo_date,
-                        'duration': duration,
-                        'join_url': join_url,
-                        'status': 'active' if status == 'started' else 'scheduled',
-                        'zoom_created': True,
-                        'expected_participants': 1,
-                        'actual_participants': 0,
-                        'last_sync': fields.Datetime.now(),
-                    })
-                    created_count += 1
-            
-            _logger.info(f'Sincronización completada: {created_count} creadas, {updated_count} actualizadas')
-            
+            stats = self.env['zoom.sync.pipeline'].run_sync(self, trigger='manual')
+            _logger.info('Sincronización completada: %s creadas, %s actualizadas', stats['created'], stats['updated'])
             return {
-                'created': created_count,
-                'updated': updated_count,
-                'total': len(zoom_meetings)
+                'created': stats['created'],
+                'updated': stats['updated'],
+                'total': stats['fetched'],
             }
-                
         except Exception as e:
-            _logger.error(f'Error en sincronización automática: {str(e)}')
+            _logger.error('Error en sincronización automática: %s', e)
             raise UserError(_('Error en sincronización automática: %s') % str(e))
 
     def _get_control_status(self, status, start_time):
@@ -744,23 +842,24 @@ class ZoomConfig(models.Model):
         else:
             return 'Programado'
 
-    def create_zoom_meeting(self, meeting_data):
-        """Crear reunión en Zoom API desde configuración"""
+    def create_zoom_meeting(self, meeting_data, record=None):
+        """Crear reunión en Zoom API desde configuración
+
+        Con ``record`` el alta se registra en ``zoom.outbox`` y se envía tras
+        el commit: se devuelve un diccionario vacío y el registro recibe el
+        resultado en ``_zoom_outbox_done``. Sin ``record`` la llamada es síncrona.
+        """
         try:
-            # Obtener token si es necesario
-            if not self.access_token or (self.token_expires and self.token_expires <= fields.Datetime.now()):
-                self._get_access_token()
-            
-            headers = {
-                'Authorization': f'Bearer {self.access_token}',
-                'Content-Type': 'application/json'
-            }
-            
             # Preparar datos para Zoom API
+            start_time = meeting_data.get('start_time') or fields.Datetime.now()
+            if isinstance(start_time, datetime):
+                # Fechas de Odoo en UTC: formato GMT de Zoom (serializable para la cola)
+                start_time = start_time.strftime('%Y-%m-%dT%H:%M:%SZ')
+            
             zoom_data = {
                 'topic': meeting_data.get('name', 'Reunión Odoo'),
                 'type': 2,  # Reunión programada
-                'start_time': meeting_data.get('start_time', fields.Datetime.now().isoformat()),
+                'start_time': start_time,
                 'duration': meeting_data.get('duration', 60),
                 'timezone': 'America/Lima',
                 'settings': {
@@ -773,12 +872,12 @@ class ZoomConfig(models.Model):
                 }
             }
             
-            response = requests.post(
-                f'{self.base_url}/users/me/meetings',
-                headers=headers,
-                json=zoom_data,
-                timeout=30
-            )
+            if record:
+                self.env['zoom.outbox']._enqueue(
+                    self, 'create_meeting', 'POST', '/users/me/meetings', zoom_data, record=record)
+                return {}
+            
+            response = self._zoom_request('POST', '/users/me/meetings', json=zoom_data)
             
             if response.status_code == 201:
                 meeting_info = response.json()
@@ -790,14 +889,16 @@ class ZoomConfig(models.Model):
                     'last_sync': fields.Datetime.now()
                 }
             else:
-                _logger.error(f'Error creando reunión en Zoom: {response.text}')
+                _logger.error('Error creando reunión en Zoom: %s', response.text)
                 raise UserError(_('Error al crear reunión en Zoom: %s') % response.text)
                 
+        except ZoomUnavailable:
+            raise
         except requests.exceptions.RequestException as e:
-            _logger.error(f'Error de conexión con Zoom: {str(e)}')
+            _logger.error('Error de conexión con Zoom: %s', e)
             raise UserError(_('Error de conexión con Zoom: %s') % str(e))
         except Exception as e:
-            _logger.error(f'Error inesperado: {str(e)}')
+            _logger.error('Error inesperado: %s', e)
             raise UserError(_('Error inesperado: %s') % str(e))
 
 
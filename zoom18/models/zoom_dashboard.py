@@ -2,9 +2,67 @@
 
 from odoo import models, fields, api, _
 from odoo.exceptions import UserError
-import logging
+import threading
+import time
+from datetime import timedelta
 
-_logger = logging.getLogger(__name__)
+from .zoom_profile import profiled
+from .zoom_logging import get_logger
+
+_logger = get_logger(__name__)
+
+# Segundos que se sirve el mismo resumen del dashboard
+DASHBOARD_CACHE_TTL = 60
+
+
+class ZoomDashboardCache:
+    """Resumen del dashboard por base de datos, compañía, zona horaria e idioma
+
+    Abrir el dashboard cuenta reuniones, suma métricas de la API y dibuja la
+    línea de tiempo de sincronización: con muchos usuarios es el mismo
+    trabajo repetido. Cada entrada se sirve durante ``ttl`` segundos; las
+    escrituras que cambian lo que se muestra (estado o inicio de reuniones,
+    configuración, fin de una sincronización) invalidan las de su base de
+    datos. La caché es de cada proceso: otro worker puede mostrar datos de
+    hasta ``ttl`` segundos. Es segura entre hilos.
+    """
+
+    def __init__(self, ttl=DASHBOARD_CACHE_TTL):
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, key, compute):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] > now:
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+        value = compute()
+        with self._lock:
+            self._entries[key] = (now + self.ttl, value)
+        return value
+
+    def invalidate(self, dbname):
+        """Descartar los resúmenes de esta base de datos"""
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == dbname]:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+
+dashboard_cache = ZoomDashboardCache()
 
 
 class ZoomDashboard(models.Model):
@@ -24,10 +82,34 @@ class ZoomDashboard(models.Model):
     config_status_icon = fields.Char('Icono de Estado', default='fa-exclamation-triangle')
     config_status_color = fields.Char('Color de Estado', default='#dc3545')
 
+    # Llamadas a la API de Zoom en las últimas 24 horas (zoom.api.metric)
+    api_calls_24h = fields.Integer('Llamadas a la API', default=0)
+    api_error_rate_24h = fields.Float('Tasa de Error (%)', default=0.0, digits=(16, 1))
+    api_avg_latency_ms_24h = fields.Float('Latencia Media (ms)', default=0.0, digits=(16, 1))
+    api_throttled_24h = fields.Integer('Llamadas Limitadas (429)', default=0)
+    api_retries_24h = fields.Integer('Reintentos', default=0)
+
+    # Últimas sincronizaciones (zoom.sync.run)
+    sync_timeline_html = fields.Html('Línea de Tiempo de Sincronización', sanitize=False, default=False)
+    slow_runs_7d = fields.Integer('Sincronizaciones Lentas (7 días)', default=0)
+
+    # Análisis de reuniones de los últimos 30 días (zoom.meeting.report)
+    meeting_hours_30d = fields.Float('Horas de Reunión (30 días)', default=0.0, digits=(16, 1))
+    attendance_rate_30d = fields.Float('Tasa de Asistencia (30 días)', default=0.0, digits=(16, 1))
+    no_show_rate_30d = fields.Float('Tasa de Ausencia (30 días)', default=0.0, digits=(16, 1))
+
     @api.model
     def default_get(self, fields_list):
-        """Calcular estadísticas y configuración por defecto"""
+        """Estadísticas y configuración por defecto, desde ``dashboard_cache``"""
         res = super().default_get(fields_list)
+        key = (self.env.cr.dbname, self.env.company.id, self.env.context.get('tz'), self.env.lang)
+        res.update(dashboard_cache.get(key, self._get_dashboard_values))
+        return res
+
+    @api.model
+    def _get_dashboard_values(self):
+        """Calcular estadísticas y configuración"""
+        res = {}
         
         # Calcular estadísticas
         active_count = self.env['zoom.meeting'].search_count([('status', '=', 'active')])
@@ -40,6 +122,31 @@ class ZoomDashboard(models.Model):
         res['finished_meetings'] = finished_count
         res['total_meetings'] = total_count
         
+        # Llamadas a la API de Zoom
+        api = self.env['zoom.api.metric']._get_summary(hours=24)
+        res['api_calls_24h'] = api['calls']
+        res['api_error_rate_24h'] = api['error_rate']
+        res['api_avg_latency_ms_24h'] = api['avg_time_ms']
+        res['api_throttled_24h'] = api['throttled']
+        res['api_retries_24h'] = api['retries']
+        
+        # Últimas sincronizaciones y tiempo de cada etapa
+        SyncRun = self.env['zoom.sync.run']
+        res['sync_timeline_html'] = SyncRun.search([('state', '!=', 'running')], limit=10)._render_timeline()
+        res['slow_runs_7d'] = SyncRun.search_count([
+            ('is_slow', '=', True),
+            ('started_at', '>=', fields.Datetime.now() - timedelta(days=7)),
+        ])
+        
+        # Horas y asistencia de los últimos 30 días, desde el análisis diario
+        [(hours, attendance_rate, no_show_rate)] = self.env['zoom.meeting.report']._read_group(
+            [('date', '>=', fields.Date.today() - timedelta(days=30))],
+            aggregates=['actual_hours:sum', 'attendance_rate:avg', 'no_show_rate:avg'],
+        )
+        res['meeting_hours_30d'] = hours or 0.0
+        res['attendance_rate_30d'] = attendance_rate or 0.0
+        res['no_show_rate_30d'] = no_show_rate or 0.0
+        
         # Obtener información de configuración
         config = self.env['zoom.config'].search([], limit=1)
         if config:
@@ -85,6 +192,20 @@ class ZoomDashboard(models.Model):
         
         return res
 
+    @api.model
+    def _invalidate_cache(self):
+        """Descartar el resumen en caché ahora y otra vez al confirmar la transacción
+
+        La segunda vez descarta lo que otras transacciones hayan guardado
+        mientras tanto sin ver todavía estos cambios.
+        """
+        dbname = self.env.cr.dbname
+        dashboard_cache.invalidate(dbname)
+        postcommit = self.env.cr.postcommit
+        if not postcommit.data.get('zoom.dashboard.invalidate'):
+            postcommit.data['zoom.dashboard.invalidate'] = True
+            postcommit.add(lambda: dashboard_cache.invalidate(dbname))
+
     def action_create_quick_meeting(self):
         """Crear una reunión rápida"""
         return {
@@ -120,6 +241,18 @@ class ZoomDashboard(models.Model):
             'domain': [('status', '=', 'active')],
         }
 
+    def action_view_api_metrics(self):
+        """Ver las métricas de la API de Zoom por endpoint"""
+        return self.env['ir.actions.act_window']._for_xml_id('zoom18.action_zoom_api_metric')
+
+    def action_view_meeting_report(self):
+        """Ver el análisis de reuniones"""
+        return self.env['ir.actions.act_window']._for_xml_id('zoom18.action_zoom_meeting_report')
+
+    def action_view_sync_runs(self):
+        """Ver el historial de sincronización"""
+        return self.env['ir.actions.act_window']._for_xml_id('zoom18.action_zoom_sync_run')
+
     def action_view_calendar(self):
         """Ver calendario nativo de Odoo con filtro para reuniones Zoom"""
         return {
@@ -145,6 +278,7 @@ class ZoomDashboard(models.Model):
             'target': 'current',
         }
 
+    @profiled
     def action_sync_meetings(self):
         """Sincronizar reuniones desde Zoom"""
         config = self.env['zoom.config'].get_active_config()
@@ -168,7 +302,7 @@ class ZoomDashboard(models.Model):
                 }
             }
         except Exception as e:
-            _logger.error(f'Error sincronizando reuniones: {str(e)}')
+            _logger.error('Error sincronizando reuniones: %s', e)
             raise UserError(_('Error al sincronizar reuniones: %s') % str(e))
 
 
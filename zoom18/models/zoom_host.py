@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+
+from odoo import models, fields, api, _
+
+from .zoom_logging import get_logger
+
+_logger = get_logger(__name__)
+
+
+class ZoomHost(models.Model):
+    _name = 'zoom.host'
+    _description = 'Anfitrión de Zoom'
+    _rec_name = 'email'
+    _order = 'email'
+
+    config_id = fields.Many2one(
+        'zoom.config',
+        string='Configuración',
+        required=True,
+        ondelete='cascade',
+        index=True
+    )
+
+    zoom_user_id = fields.Char(
+        string='ID de Usuario Zoom',
+        required=True,
+        index=True,
+        help='Identificador del usuario en Zoom'
+    )
+
+    email = fields.Char(
+        string='Email',
+        help='Email del anfitrión en Zoom'
+    )
+
+    name = fields.Char(
+        string='Nombre',
+        help='Nombre del anfitrión en Zoom'
+    )
+
+    active = fields.Boolean(
+        string='Activo',
+        default=True,
+        help='Los anfitriones inactivos no se sincronizan'
+    )
+
+    meeting_ids = fields.One2many(
+        'zoom.meeting',
+        'host_id',
+        string='Reuniones'
+    )
+
+    # === CONTROL DE SINCRONIZACIÓN ===
+    last_sync_cycle = fields.Integer(
+        string='Último Ciclo Sincronizado',
+        default=0,
+        help='Ciclo de sincronización de la cuenta completado para este anfitrión'
+    )
+
+    last_sync = fields.Datetime(
+        string='Última Sincronización',
+        readonly=True
+    )
+
+    sync_error = fields.Text(
+        string='Último Error',
+        readonly=True
+    )
+
+    _sql_constraints = [
+        ('zoom_user_unique', 'unique(config_id, zoom_user_id)', 'El usuario de Zoom ya está registrado para esta configuración.'),
+    ]
+
+    @api.model
+    def _upsert_from_zoom(self, config, users):
+        """Crear o actualizar anfitriones a partir de una página de /users"""
+        users = {str(user['id']): user for user in users if user.get('id')}
+        if not users:
+            return self.browse()
+        existing = self.with_context(active_test=False).search([
+            ('config_id', '=', config.id),
+            ('zoom_user_id', 'in', list(users)),
+        ])
+        existing_by_id = {host.zoom_user_id: host for host in existing}
+
+        to_create = []
+        for zoom_user_id, user in users.items():
+            name = ' '.join(filter(None, [user.get('first_name'), user.get('last_name')])) or user.get('email')
+            vals = {
+                'email': user.get('email'),
+                'name': name,
+                'active': user.get('status', 'active') == 'active',
+            }
+            host = existing_by_id.get(zoom_user_id)
+            if not host:
+                to_create.append(dict(vals, config_id=config.id, zoom_user_id=zoom_user_id))
+            elif any(host[key] != value for key, value in vals.items()):
+                host.write(vals)
+        return existing | self.create(to_create)
+
+    def _in_partition(self, partition, partitions):
+        """Filtrar los anfitriones asignados a una partición de cron"""
+        if not partitions or partitions <= 1:
+            return self
+        return self.filtered(lambda host: host.id % partitions == partition)
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+
+from odoo import models, api
+import threading
+from collections import OrderedDict
+
+# Entradas (plantilla, reunión, write_date) que se conservan por proceso
+RENDER_CACHE_SIZE = 512
+
+
+class ZoomRenderCache:
+    """LRU acotada con los valores de reunión que usan las plantillas de correo
+
+    Una oleada de invitaciones renderiza la misma plantilla para cientos de
+    asistentes de una misma reunión: los datos de la reunión (nombre, fecha
+    formateada, enlace, organizador...) se calculan una sola vez y el resto
+    de asistentes los leen de aquí. La clave incluye ``write_date``, así que
+    una reunión modificada en otra transacción nunca reutiliza valores viejos;
+    dentro de la misma transacción ``zoom.meeting.write`` invalida sus
+    entradas. Es segura entre hilos.
+    """
+
+    def __init__(self, max_size=RENDER_CACHE_SIZE):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, compute):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+        value = compute()
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return value
+
+    def invalidate(self, dbname, meeting_ids):
+        """Descartar las entradas de estas reuniones"""
+        meeting_ids = set(meeting_ids)
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == dbname and key[2] in meeting_ids]:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+
+render_cache = ZoomRenderCache()
+
+
+class MailRenderMixin(models.AbstractModel):
+    _inherit = 'mail.render.mixin'
+
+    @api.model
+    def _render_eval_context(self):
+        """Añadir ``zoom_meeting_values(reunión)`` a las plantillas
+
+        Devuelve los valores de ``zoom.meeting._get_mail_render_values``
+        pasando por la caché, con la plantilla que se está renderizando como
+        parte de la clave.
+        """
+        render_context = super()._render_eval_context()
+        template_id = self.id if self._name == 'mail.template' and len(self) == 1 else 0
+        dbname = self.env.cr.dbname
+
+        def zoom_meeting_values(meeting):
+            if not meeting:
+                return self.env['zoom.meeting']._get_mail_render_values()
+            meeting.ensure_one()
+            key = (dbname, template_id, meeting.id, meeting.write_date)
+            return render_cache.get(key, meeting._get_mail_render_values)
+
+        render_context['zoom_meeting_values'] = zoom_meeting_values
+        return render_context
@@ -4,10 +4,34 @@ from odoo import models, fields, api, _
 from odoo.exceptions import UserError, ValidationError
 import requests
 import json
-import logging
+from collections import defaultdict
 from datetime import datetime, timedelta
 
-_logger = logging.getLogger(__name__)
+from .zoom_client import ZoomUnavailable
+from .zoom_mail_render import render_cache
+from .zoom_profile import profiled
+from .zoom_logging import LogBatch, get_logger
+
+_logger = get_logger(__name__)
+
+# Campos de la reunión -> campos del evento de calendario que dependen de ellos
+MEETING_TO_CALENDAR_FIELDS = {
+    'name': ('name',),
+    'start_time': ('start', 'stop'),
+    'duration': ('stop',),
+    'description': ('description',),
+    'join_url': ('description',),
+    'meeting_id': ('location',),
+}
+
+# Campos que cambian los trabajos programados de la reunión (zoom.scheduled.job)
+SCHEDULED_JOB_FIELDS = {'start_time', 'duration', 'status', 'meeting_id'}
+
+# Campos que cambian el resumen del dashboard (zoom.dashboard)
+DASHBOARD_FIELDS = {'start_time', 'status'}
+
+# Campos que cambian el análisis diario de reuniones (zoom.meeting.daily)
+DAILY_FIELDS = {'start_time', 'host_id', 'task_id', 'status', 'duration', 'actual_start_time', 'actual_end_time'}
 
 
 class ZoomMeeting(models.Model):
@@ -81,6 +105,14 @@ class ZoomMeeting(models.Model):
         help='ID de la reunión en Zoom (alias de meeting_id)'
     )
     
+    host_id = fields.Many2one(
+        'zoom.host',
+        string='Anfitrión',
+        index=True,
+        ondelete='set null',
+        help='Anfitrión de Zoom propietario de la reunión'
+    )
+    
     join_url = fields.Char(
         string='URL para Unirse',
         help='Enlace para unirse a la reunión'
@@ -94,6 +126,7 @@ class ZoomMeeting(models.Model):
     task_id = fields.Many2one(
         'project.task',
         string='Tarea Asociada',
+        index=True,
         help='Tarea de proyecto relacionada con esta reunión'
     )
     
@@ -185,6 +218,20 @@ class ZoomMeeting(models.Model):
     )
 
     # === CAMPOS DE ASISTENTES (PARTE 3) ===
+    participant_ids = fields.One2many(
+        'zoom.meeting.participant',
+        'meeting_id',
+        string='Participantes (Informe Zoom)',
+        readonly=True
+    )
+    
+    recording_ids = fields.One2many(
+        'zoom.recording',
+        'meeting_id',
+        string='Grabaciones',
+        readonly=True
+    )
+    
     attendee_ids = fields.One2many(
         'zoom.meeting.attendee',
         'meeting_id',
@@ -221,6 +268,13 @@ class ZoomMeeting(models.Model):
     )
 
 
+    def init(self):
+        # El análisis diario (zoom.meeting.daily) recalcula por día de inicio
+        self.env.cr.execute("""
+            CREATE INDEX IF NOT EXISTS zoom_meeting_start_date_idx
+                ON zoom_meeting ((start_time::date))
+        """)
+
     @api.depends('meeting_id')
     def _compute_zoom_meeting_id(self):
         """Sincronizar zoom_meeting_id con meeting_id"""
@@ -364,14 +418,13 @@ class ZoomMeeting(models.Model):
         if not self.attendee_ids:
             raise UserError(_('No hay asistentes para invitar.'))
         
+        to_invite = self.attendee_ids.filtered(lambda a: a.status == 'invited' and a.email)
         sent_count = 0
-        for attendee in self.attendee_ids:
-            if attendee.status == 'invited':
-                try:
-                    attendee._send_invitation()
-                    sent_count += 1
-                except Exception as e:
-                    _logger.warning(f'Error enviando invitación a {attendee.email}: {str(e)}')
+        try:
+            to_invite._send_invitation()
+            sent_count = len(to_invite)
+        except Exception as e:
+            _logger.warning('Error enviando invitaciones de %s: %s', self.name, e)
         
         return {
             'type': 'ir.actions.client',
@@ -535,21 +588,77 @@ class ZoomMeeting(models.Model):
             'today_meetings': today_meetings,
         }
     
+    def _sync_participants(self):
+        """Descargar el informe de participantes de Zoom y marcar la asistencia
+
+        Devuelve las reuniones que no se pudieron procesar porque Zoom no
+        está disponible, para reintentarlas más tarde.
+        """
+        config = self.env['zoom.config'].get_active_config()
+        Participant = self.env['zoom.meeting.participant']
+        unavailable = self.browse()
+        for meeting in self.filtered('meeting_id'):
+            try:
+                participants = Participant._fetch_report(config, meeting)
+            except ZoomUnavailable:
+                unavailable |= meeting
+                continue
+            except UserError as e:
+                _logger.warning('Informe de participantes no disponible para %s: %s', meeting.name, e)
+                continue
+            Participant._ingest(meeting, participants)
+        return unavailable
+
+    def action_sync_participants(self):
+        """Obtener la asistencia real desde el informe de participantes de Zoom"""
+        self.ensure_one()
+        if not self.meeting_id:
+            raise UserError(_('La reunión no está creada en Zoom.'))
+        config = self.env['zoom.config'].get_active_config()
+        participants = self.env['zoom.meeting.participant']._fetch_report(config, self)
+        self.env['zoom.meeting.participant']._ingest(self, participants)
+        return {
+            'type': 'ir.actions.client',
+            'tag': 'display_notification',
+            'params': {
+                'title': _('Participantes Actualizados'),
+                'message': _('%d participantes en el informe de Zoom') % self.actual_participants,
+                'type': 'success',
+            }
+        }
+
     # === MÉTODOS DE NOTIFICACIONES (PARTE 6) ===
+    def _get_mail_render_values(self):
+        """Datos de la reunión que usan las plantillas (``zoom_meeting_values``)
+
+        Se calculan una vez por plantilla y reunión; ver ``zoom_mail_render``.
+        """
+        organizer = self.create_uid
+        return {
+            'name': self.name or '',
+            'start': self.start_time.strftime('%d/%m/%Y a las %H:%M') if self.start_time else '',
+            'duration': self.duration or 0,
+            'description': self.description or '',
+            'join_url': self.join_url or '',
+            'zoom_id': self.meeting_id or '',
+            'organizer_name': organizer.name or 'El equipo',
+            'organizer_email': organizer.email_formatted if organizer.email else '',
+        }
+
     def _notify_organizer_attendance_update(self):
         """Notificar al organizador sobre actualización de asistencia"""
         self.ensure_one()
         
         if not self.create_uid or not self.create_uid.email:
-            _logger.warning(f"No email found for organizer {self.create_uid.name if self.create_uid else 'Unknown'}")
+            _logger.warning('Reunión %s sin email del organizador: no se notifica la asistencia', self.id)
             return
         
         try:
             template = self.env.ref('zoom18.email_template_organizer_notification')
             template.send_mail(self.id, force_send=True)
-            _logger.info(f"Organizer notification sent for meeting {self.name}")
+            _logger.debug('Notificación al organizador enviada (reunión %s)', self.id)
         except Exception as e:
-            _logger.error(f"Error sending organizer notification for meeting {self.name}: {str(e)}")
+            _logger.error('Error notificando al organizador de la reunión %s: %s', self.id, e)
     
     def action_send_reminders(self):
         """Enviar recordatorios a todos los asistentes confirmados"""
@@ -560,13 +669,14 @@ class ZoomMeeting(models.Model):
         if not confirmed_attendees:
             raise UserError(_('No hay asistentes confirmados para enviar recordatorios.'))
         
-        sent_count = 0
-        for attendee in confirmed_attendees:
-            try:
-                attendee._send_reminder()
-                sent_count += 1
-            except Exception as e:
-                _logger.warning(f'Error enviando recordatorio a {attendee.email}: {str(e)}')
+        with LogBatch(_logger, 'Recordatorios enviados') as batch:
+            for attendee in confirmed_attendees:
+                try:
+                    attendee._send_reminder()
+                    batch.add()
+                except Exception as e:
+                    _logger.warning('Error enviando recordatorio a %s: %s', attendee.email, e)
+        sent_count = batch.count
         
         return {
             'type': 'ir.actions.client',
@@ -590,54 +700,8 @@ class ZoomMeeting(models.Model):
         if not attended_attendees:
             raise UserError(_('No hay asistentes que hayan participado en la reunión.'))
         
-        # Crear template personalizado para el resumen
-        action_items_html = ""
-        if self.action_items:
-            action_items_html = f"""
-                    <h3>Elementos de Acción:</h3>
-                    <p>{self.action_items}</p>
-                    <br/>"""
-        
-        template_data = {
-            'name': f'Resumen de Reunión - {self.name}',
-            'model_id': self.env.ref('zoom18.model_zoom_meeting').id,
-            'subject': f'Resumen de Reunión: {self.name}',
-            'email_from': self.create_uid.email_formatted,
-            'body_html': f'''
-                <div style="margin: 0px; padding: 0px; font-size: 13px;">
-                    <p>Hola,</p>
-                    <br/>
-                    <p>Te enviamos el resumen de la reunión en la que participaste:</p>
-                    <br/>
-                    <div style="margin: 16px 0px 16px 0px; padding: 8px 16px 8px 16px; background-color: #f8f9fa; border-left: 4px solid #007bff;">
-                        <p><strong>Reunión:</strong> {self.name}</p>
-                        <p><strong>Fecha:</strong> {self.start_time.strftime('%d/%m/%Y a las %H:%M')}</p>
-                        <p><strong>Duración:</strong> {self.meeting_duration} minutos</p>
-                    </div>
-                    <br/>
-                    <h3>Resumen de la Reunión:</h3>
-                    <p>{self.meeting_summary}</p>
-                    <br/>
-                    {action_items_html}
-                    <p>Saludos cordiales,<br/>{self.create_uid.name}</p>
-                </div>
-            ''',
-            'auto_delete': True
-        }
-        
-        template = self.env['mail.template'].create(template_data)
-        
-        sent_count = 0
-        for attendee in attended_attendees:
-            try:
-                template.write({'email_to': attendee.email})
-                template.send_mail(self.id, force_send=True)
-                sent_count += 1
-            except Exception as e:
-                _logger.warning(f'Error enviando resumen a {attendee.email}: {str(e)}')
-        
-        # Eliminar template temporal
-        template.unlink()
+        mails = attended_attendees._send_meeting_summary()
+        sent_count = len(mails)
         
         return {
             'type': 'ir.actions.client',
@@ -651,123 +715,72 @@ class ZoomMeeting(models.Model):
     
     @api.model
     def _send_automatic_reminders(self):
-        """Enviar recordatorios automáticos (llamado por cron job)"""
-        # Buscar reuniones que empiecen en 1 hora
-        one_hour_from_now = fields.Datetime.now() + timedelta(hours=1)
-        one_hour_plus_30min = one_hour_from_now + timedelta(minutes=30)
-        
-        meetings_to_remind = self.search([
-            ('status', '=', 'scheduled'),
-            ('start_time', '>=', one_hour_from_now),
-            ('start_time', '<=', one_hour_plus_30min),
-        ])
-        
-        total_reminders_sent = 0
-        for meeting in meetings_to_remind:
-            confirmed_attendees = meeting.attendee_ids.filtered(lambda a: a.status == 'confirmed')
-            
-            for attendee in confirmed_attendees:
-                try:
-                    attendee._send_reminder()
-                    total_reminders_sent += 1
-                except Exception as e:
-                    _logger.error(f'Error sending automatic reminder to {attendee.email}: {str(e)}')
-        
-        if total_reminders_sent > 0:
-            _logger.info(f'Automatic reminders sent: {total_reminders_sent} reminders for {len(meetings_to_remind)} meetings')
-        
-        return total_reminders_sent
+        """Enviar todos los recordatorios vencidos de una pasada
+
+        El cron no lo usa: ejecuta los trabajos de ``zoom.scheduled.job`` de
+        cada reunión a su hora. Sirve para ponerse al día tras una parada.
+        Los recordatorios se llevan en ``zoom.reminder``, una fila por asistente
+        y antelación configurada (``reminder_offsets``), así que volver a
+        llamarlo no duplica envíos. Cada llamada encola un lote de
+        ``cron_batch_size`` correos.
+        """
+        return len(self.env['zoom.reminder']._process_due())
 
 
     def create_zoom_meeting(self, meeting_data=None):
-        """Crear reunión en Zoom API"""
+        """Crear reunión en Zoom API
+
+        El alta se registra en ``zoom.outbox`` y se envía cuando la transacción
+        se confirma; la reunión recibe su ID y enlaces en ``_zoom_outbox_done``.
+        Así un rollback posterior no deja reuniones huérfanas en Zoom y la
+        transacción no espera a la API.
+        """
         self.ensure_one()
-        try:
-            config = self.env['zoom.config'].get_config()
-            if not config:
-                raise UserError(_('Configuración de Zoom no encontrada'))
-            
-            # Obtener token si es necesario
-            if not config.access_token or (config.token_expires and config.token_expires <= fields.Datetime.now()):
-                config._get_access_token()
-            
-            headers = {
-                'Authorization': f'Bearer {config.access_token}',
-                'Content-Type': 'application/json'
+        config = self.env['zoom.config'].get_config()
+        if not config:
+            raise UserError(_('Configuración de Zoom no encontrada'))
+        
+        # Preparar datos para Zoom API
+        if not meeting_data:
+            meeting_data = {
+                'name': self.name,
+                'start_time': self.start_time.isoformat(),
+                'duration': self.duration
             }
-            
-            # Preparar datos para Zoom API
-            if not meeting_data:
-                meeting_data = {
-                    'name': self.name,
-                    'start_time': self.start_time.isoformat(),
-                    'duration': self.duration
-                }
-            
-            zoom_data = {
-                'topic': meeting_data.get('name', self.name),
-                'type': 2,  # Reunión programada
-                'start_time': meeting_data.get('start_time', self.start_time.isoformat()),
-                'duration': meeting_data.get('duration', self.duration),
-                'timezone': 'America/Lima',
-                'settings': {
-                    'host_video': True,
-                    'participant_video': True,
-                    'join_before_host': config.join_before_host,
-                    'mute_upon_entry': config.mute_on_entry,
-                    'waiting_room': config.waiting_room,
-                    'auto_recording': 'local' if config.auto_record else 'none',
-                }
+        
+        zoom_data = {
+            'topic': meeting_data.get('name', self.name),
+            'type': 2,  # Reunión programada
+            'start_time': meeting_data.get('start_time', self.start_time.isoformat()),
+            'duration': meeting_data.get('duration', self.duration),
+            'timezone': 'America/Lima',
+            'settings': {
+                'host_video': True,
+                'participant_video': True,
+                'join_before_host': config.join_before_host,
+                'mute_upon_entry': config.mute_on_entry,
+                'waiting_room': config.waiting_room,
+                'auto_recording': 'local' if config.auto_record else 'none',
             }
-            
-            response = requests.post(
-                f'{config.base_url}/users/me/meetings',
-                headers=headers,
-                json=zoom_data,
-                timeout=30
-            )
-            
-            if response.status_code == 201:
-                meeting_info = response.json()
-                result = {
-                    'meeting_id': str(meeting_info.get('id')),
-                    'join_url': meeting_info.get('join_url'),
-                    'start_url': meeting_info.get('start_url'),
-                    'zoom_created': True,
-                    'last_sync': fields.Datetime.now()
-                }
-                
-                # Actualizar el registro
-                self.write(result)
-                return result
-            else:
-                _logger.error(f'Error creando reunión en Zoom: {response.text}')
-                raise UserError(_('Error al crear reunión en Zoom: %s') % response.text)
-                
-        except requests.exceptions.RequestException as e:
-            _logger.error(f'Error de conexión con Zoom: {str(e)}')
-            raise UserError(_('Error de conexión con Zoom: %s') % str(e))
-        except Exception as e:
-            _logger.error(f'Error inesperado: {str(e)}')
-            raise UserError(_('Error inesperado: %s') % str(e))
+        }
+        
+        self.env['zoom.outbox']._enqueue(
+            config, 'create_meeting', 'POST', '/users/me/meetings', zoom_data, record=self)
+        return {}
 
+    @profiled
     def create_instant_meeting(self):
-        """Crear reunión instantánea"""
+        """Crear reunión instantánea
+
+        Es la única alta síncrona (el usuario necesita ya el enlace de inicio);
+        si la transacción se revierte después, la reunión se borra de Zoom.
+        """
         self.ensure_one()
         try:
             config = self.env['zoom.config'].get_config()
             if not config:
                 raise UserError(_('Configuración de Zoom no encontrada'))
             
-            # Obtener token si es necesario
-            if not config.access_token or (config.token_expires and config.token_expires <= fields.Datetime.now()):
-                config._get_access_token()
-            
-            headers = {
-                'Authorization': f'Bearer {config.access_token}',
-                'Content-Type': 'application/json'
-            }
-            
             zoom_data = {
                 'topic': self.name or f'Reunión Instantánea - {self.task_id.name if self.task_id else "Odoo"}',
                 'type': 1,  # Reunión instantánea
@@ -781,23 +794,13 @@ class ZoomMeeting(models.Model):
                 }
             }
             
-            response = requests.post(
-                f'{config.base_url}/users/me/meetings',
-                headers=headers,
-                json=zoom_data,
-                timeout=30
-            )
+            # Una reunión instantánea no puede esperar en cola: si Zoom no
+            # está disponible se falla al instante (ZoomUnavailable)
+            response = config._zoom_request('POST', '/users/me/meetings', json=zoom_data)
             
             if response.status_code == 201:
-                meeting_info = response.json()
-                self.write({
-                    'meeting_id': str(meeting_info.get('id')),
-                    'join_url': meeting_info.get('join_url'),
-                    'start_url': meeting_info.get('start_url'),
-                    'status': 'active',
-                    'zoom_created': True,
-                    'last_sync': fields.Datetime.now()
-                })
+                self.write(dict(self._zoom_meeting_vals(response.json()), status='active'))
+                self._delete_from_zoom_on_rollback(config)
                 
                 # Crear evento en calendario
                 self._create_calendar_event()
@@ -811,88 +814,158 @@ class ZoomMeeting(models.Model):
                 raise UserError(_('Error al crear reunión instantánea: %s') % response.text)
                 
         except Exception as e:
-            _logger.error(f'Error creando reunión instantánea: {str(e)}')
+            _logger.error('Error creando reunión instantánea: %s', e)
             raise UserError(_('Error: %s') % str(e))
 
+    def _delete_from_zoom_on_rollback(self, config):
+        """Compensar un alta síncrona si la transacción no llega a confirmarse"""
+        self.ensure_one()
+        if self.env.registry.in_test_mode():
+            return
+        registry, uid, config_id, path = self.env.registry, self.env.uid, config.id, f'/meetings/{self.meeting_id}'
+
+        @self.env.cr.postrollback.add
+        def compensate():
+            with registry.cursor() as cr:
+                env = api.Environment(cr, uid, {})
+                env['zoom.outbox']._enqueue(env['zoom.config'].browse(config_id), 'delete_meeting', 'DELETE', path)
+
+    def _get_participant_emails(self):
+        """Emails de participantes declarados en el campo de texto"""
+        self.ensure_one()
+        if not self.participants:
+            return []
+        return [email.strip() for email in self.participants.split(',') if email.strip()]
+
+    def _get_partners_by_email(self, emails):
+        """Buscar (o crear) los partners de un conjunto de emails en bloque"""
+        emails = set(emails)
+        if not emails:
+            return {}
+        Partner = self.env['res.partner']
+        partners = {}
+        for partner in Partner.search([('email', 'in', list(emails))]):
+            partners.setdefault(partner.email, partner.id)
+        missing = [email for email in emails if email not in partners]
+        if missing:
+            # Crear partners inexistentes
+            created = Partner.create([{
+                'name': email,
+                'email': email,
+                'is_company': False,
+            } for email in missing])
+            partners.update({partner.email: partner.id for partner in created})
+        return partners
+
     def _create_calendar_event(self):
-        """Crear evento en calendario de Odoo"""
-        if not self.calendar_event_id and self.start_time:
-            # Obtener participantes si están definidos
-            partner_ids = []
-            if self.participants:
-                emails = [email.strip() for email in self.participants.split(',') if email.strip()]
-                for email in emails:
-                    partner = self.env['res.partner'].search([('email', '=', email)], limit=1)
-                    if partner:
-                        partner_ids.append(partner.id)
-                    else:
-                        # Crear partner si no existe
-                        partner = self.env['res.partner'].create({
-                            'name': email,
-                            'email': email,
-                            'is_company': False
-                        })
-                        partner_ids.append(partner.id)
-            
-            event = self.env['calendar.event'].create({
-                'name': self.name,
-                'start': self.start_time,
-                'stop': self.start_time + timedelta(minutes=self.duration),
-                'duration': self.duration,
-                'description': self.description or f'Reunión Zoom: {self.name}\n\nURL para unirse: {self.join_url or "No disponible"}',
-                'location': f'Zoom Meeting ID: {self.meeting_id}',
-                'user_id': self.env.user.id,
-                'partner_ids': [(6, 0, partner_ids)],
-                'allday': False,
-                'show_as': 'busy',
-            })
-            self.calendar_event_id = event.id
-            _logger.info(f'Evento de calendario creado: {event.id} para reunión {self.id}')
+        """Crear eventos en calendario de Odoo para las reuniones que no lo tengan"""
+        meetings = self.filtered(lambda m: not m.calendar_event_id and m.start_time)
+        if not meetings:
+            return
 
-    def _update_calendar_event(self):
-        """Actualizar evento de calendario existente"""
-        if self.calendar_event_id:
-            self.calendar_event_id.write({
-                'name': self.name,
-                'start': self.start_time,
-                'stop': self.start_time + timedelta(minutes=self.duration),
-                'duration': self.duration,
-                'description': self.description or f'Reunión Zoom: {self.name}\n\nURL para unirse: {self.join_url or "No disponible"}',
-                'location': f'Zoom Meeting ID: {self.meeting_id}',
-            })
-            _logger.info(f'Evento de calendario actualizado: {self.calendar_event_id.id}')
+        batch = LogBatch(_logger, 'Eventos de calendario creados')
+        # Obtener participantes de todas las reuniones de una vez
+        emails_by_meeting = {meeting.id: meeting._get_participant_emails() for meeting in meetings}
+        partners = self._get_partners_by_email(
+            email for emails in emails_by_meeting.values() for email in emails
+        )
 
-    def _delete_calendar_event(self):
-        """Eliminar evento de calendario"""
-        if self.calendar_event_id:
-            event_id = self.calendar_event_id.id
-            self.calendar_event_id.unlink()
-            self.calendar_event_id = False
-            _logger.info(f'Evento de calendario eliminado: {event_id}')
+        events = self.env['calendar.event'].with_context(zoom_skip_meeting_sync=True).create([
+            dict(
+                meeting._get_calendar_event_vals(),
+                zoom_meeting_id=meeting.id,
+                is_zoom_meeting=True,
+                user_id=self.env.user.id,
+                partner_ids=[(6, 0, [partners[email] for email in emails_by_meeting[meeting.id]])],
+                allday=False,
+                show_as='busy',
+            )
+            for meeting in meetings
+        ])
+        for meeting, event in zip(meetings.with_context(zoom_skip_calendar_sync=True), events):
+            meeting.calendar_event_id = event.id
+        batch.add(len(events))
+        batch.flush()
 
-    @api.model
-    def create(self, vals):
+    def _get_calendar_event_vals(self, fnames=None):
+        """Valores del evento de calendario a partir de la reunión
+
+        Con ``fnames`` (campos de la reunión modificados) solo se devuelven
+        los campos del evento que dependen de ellos.
+        """
+        self.ensure_one()
+        vals = {
+            'name': self.name,
+            'start': self.start_time,
+            'stop': self.start_time + timedelta(minutes=self.duration or 0) if self.start_time else False,
+            'description': self.description or f'Reunión Zoom: {self.name}\n\nURL para unirse: {self.join_url or "No disponible"}',
+            'location': f'Zoom Meeting ID: {self.meeting_id}',
+        }
+        if fnames is None:
+            return vals
+        event_fnames = {event_fname for fname in fnames for event_fname in MEETING_TO_CALENDAR_FIELDS.get(fname, ())}
+        return {key: value for key, value in vals.items() if key in event_fnames}
+
+    def _update_calendar_event(self, fnames=None):
+        """Propagar cambios a los eventos de calendario en un solo sentido
+
+        Solo se escriben los campos que realmente cambian, agrupando los
+        eventos con los mismos valores, y con ``zoom_skip_meeting_sync`` para
+        que el evento no vuelva a escribir en la reunión.
+        """
+        batch = LogBatch(_logger, 'Eventos de calendario actualizados')
+        groups = defaultdict(lambda: self.env['calendar.event'])
+        for meeting in self.filtered('calendar_event_id'):
+            event = meeting.calendar_event_id
+            changes = {
+                fname: value for fname, value in meeting._get_calendar_event_vals(fnames).items()
+                if fname == 'description' or event[fname] != value
+            }
+            if changes:
+                groups[tuple(sorted(changes.items()))] |= event
+        for changes, events in groups.items():
+            events.with_context(zoom_skip_meeting_sync=True).write(dict(changes))
+            batch.add(len(events))
+        batch.flush()
+
+    @api.model_create_multi
+    def create(self, vals_list):
         """Override create para manejar calendario"""
-        meeting = super().create(vals)
-        if meeting.start_time and meeting.duration:
-            meeting._create_calendar_event()
-        return meeting
+        meetings = super().create(vals_list)
+        # Los trabajos programados son internos: los usuarios solo tienen lectura
+        self.env['zoom.scheduled.job'].sudo()._schedule_meetings(meetings)
+        self.env['zoom.dashboard']._invalidate_cache()
+        self.env['zoom.meeting.daily']._mark_dirty(meetings.mapped('start_time'))
+        if not self.env.context.get('zoom_skip_calendar_sync'):
+            meetings.filtered(lambda m: m.start_time and m.duration)._create_calendar_event()
+        return meetings
 
     def write(self, vals):
         """Override write para manejar calendario"""
+        # Los días de los que sale la reunión también cambian en el análisis diario
+        old_starts = self.mapped('start_time') if 'start_time' in vals else []
         result = super().write(vals)
-        for meeting in self:
-            if any(field in vals for field in ['name', 'start_time', 'duration', 'description', 'meeting_id', 'join_url']):
-                if meeting.calendar_event_id:
-                    meeting._update_calendar_event()
-                elif meeting.start_time and meeting.duration:
-                    meeting._create_calendar_event()
+        render_cache.invalidate(self.env.cr.dbname, self.ids)
+        if set(vals) & SCHEDULED_JOB_FIELDS:
+            self.env['zoom.scheduled.job'].sudo()._schedule_meetings(self)
+        if set(vals) & DASHBOARD_FIELDS:
+            self.env['zoom.dashboard']._invalidate_cache()
+        if set(vals) & DAILY_FIELDS:
+            self.env['zoom.meeting.daily']._mark_dirty(old_starts + self.mapped('start_time'))
+        fnames = set(vals) & set(MEETING_TO_CALENDAR_FIELDS)
+        if not fnames or self.env.context.get('zoom_skip_calendar_sync'):
+            return result
+        with_event = self.filtered('calendar_event_id')
+        with_event._update_calendar_event(fnames)
+        (self - with_event).filtered(lambda m: m.start_time and m.duration)._create_calendar_event()
         return result
 
     def unlink(self):
-        """Override unlink para eliminar eventos de calendario"""
-        for meeting in self:
-            meeting._delete_calendar_event()
+        """Override unlink para eliminar eventos de calendario en un solo lote"""
+        if not self.env.context.get('zoom_skip_calendar_sync'):
+            self.calendar_event_id.with_context(zoom_skip_meeting_sync=True).unlink()
+        self.env['zoom.dashboard']._invalidate_cache()
+        self.env['zoom.meeting.daily']._mark_dirty(self.mapped('start_time'))
         return super().unlink()
 
     def action_start_meeting(self):
@@ -934,7 +1007,7 @@ class ZoomMeeting(models.Model):
         try:
             return meeting.create_instant_meeting()
         except Exception as e:
-            _logger.error(f'Error creando reunión instantánea: {str(e)}')
+            _logger.error('Error creando reunión instantánea: %s', e)
             raise UserError(_('Error al crear reunión instantánea: %s') % str(e))
 
     def action_schedule_meeting(self):
@@ -998,40 +1071,51 @@ class ZoomMeeting(models.Model):
         }
 
     def action_cancel_meeting(self):
-        """Cancelar reunión en Zoom"""
-        self.ensure_one()
-        if not self.meeting_id or not self.zoom_created:
-            self.status = 'cancelled'
+        """Cancelar reunión en Zoom
+
+        Las reuniones se cancelan en Odoo al instante; las bajas en Zoom se
+        envían desde ``zoom.outbox`` cuando la transacción se confirma.
+        """
+        self.write({'status': 'cancelled'})
+        self._cancel_in_zoom()
+        # Eliminar eventos de calendario
+        self.calendar_event_id.with_context(zoom_skip_meeting_sync=True).unlink()
+
+    def _cancel_in_zoom(self):
+        """Registrar en zoom.outbox la baja de estas reuniones, en bloque
+
+        Las altas que aún no se enviaron se anulan (Zoom no conoce la reunión);
+        el resto se borra de Zoom con un único lote de operaciones.
+        """
+        Outbox = self.env['zoom.outbox']
+        pending_creates = Outbox._find_pending('create_meeting', self)
+        pending_creates.write({'state': 'cancelled'})
+        voided = set(pending_creates.mapped('res_id'))
+        to_delete = self.filtered(lambda m: m.meeting_id and m.zoom_created and m.id not in voided)
+        if not to_delete:
             return
-        
-        try:
-            config = self.env['zoom.config'].get_config()
-            if not config:
-                self.status = 'cancelled'
-                return
-            
-            headers = {
-                'Authorization': f'Bearer {config.access_token}',
-            }
-            
-            response = requests.delete(
-                f'{config.base_url}/meetings/{self.meeting_id}',
-                headers=headers,
-                timeout=30
-            )
-            
-            if response.status_code in [200, 204]:
-                self.status = 'cancelled'
-                # Eliminar evento de calendario
-                if self.calendar_event_id:
-                    self.calendar_event_id.unlink()
-            else:
-                _logger.warning(f'No se pudo cancelar reunión en Zoom: {response.text}')
-                self.status = 'cancelled'
-                
-        except Exception as e:
-            _logger.error(f'Error cancelando reunión: {str(e)}')
-            self.status = 'cancelled'
+        config = self.env['zoom.config'].get_config()
+        Outbox._enqueue_many(config, 'delete_meeting', [
+            ('DELETE', f'/meetings/{meeting.meeting_id}', None, meeting)
+            for meeting in to_delete
+        ])
+
+    @api.model
+    def _zoom_meeting_vals(self, meeting_info):
+        """Valores de la reunión a partir de la respuesta de alta de Zoom"""
+        return {
+            'meeting_id': str(meeting_info.get('id')),
+            'join_url': meeting_info.get('join_url'),
+            'start_url': meeting_info.get('start_url'),
+            'zoom_created': True,
+            'last_sync': fields.Datetime.now()
+        }
+
+    def _zoom_outbox_done(self, operation, result):
+        """Aplicar el resultado de una operación reenviada desde zoom.outbox"""
+        self.ensure_one()
+        if operation == 'create_meeting' and result.get('id'):
+            self.write(self._zoom_meeting_vals(result))
 
     @api.model
     def update_meeting_status(self, meeting_id, status):
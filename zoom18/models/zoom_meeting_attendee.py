@@ -2,9 +2,10 @@
 
 from odoo import models, fields, api, _
 from odoo.exceptions import UserError, ValidationError
-import logging
 
-_logger = logging.getLogger(__name__)
+from .zoom_logging import get_logger
+
+_logger = get_logger(__name__)
 
 
 class ZoomMeetingAttendee(models.Model):
@@ -16,6 +17,7 @@ class ZoomMeetingAttendee(models.Model):
         'zoom.meeting',
         string='Reunión',
         required=True,
+        index=True,
         ondelete='cascade'
     )
     
@@ -44,6 +46,12 @@ class ZoomMeetingAttendee(models.Model):
         help='Fecha y hora cuando se envió la invitación'
     )
     
+    reminder_sent = fields.Datetime(
+        string='Recordatorio Enviado',
+        readonly=True,
+        help='Fecha y hora del último recordatorio enviado'
+    )
+    
     confirmation_date = fields.Datetime(
         string='Fecha de Confirmación',
         readonly=True,
@@ -78,22 +86,44 @@ class ZoomMeetingAttendee(models.Model):
         for record in self:
             record.is_attended = record.status == 'attended'
     
-    @api.model
-    def create(self, vals):
-        """Crear asistente y enviar invitación automáticamente"""
-        attendee = super(ZoomMeetingAttendee, self).create(vals)
+    @api.model_create_multi
+    def create(self, vals_list):
+        """Crear asistentes y enviar invitaciones automáticamente"""
+        attendees = super().create(vals_list)
         
-        # Enviar invitación automáticamente
-        if attendee.meeting_id:
-            attendee._send_invitation()
+        # Enviar invitaciones automáticamente, en un solo lote
+        attendees.filtered('meeting_id')._send_invitation()
+        self.env['zoom.meeting.daily']._mark_dirty(attendees.meeting_id.mapped('start_time'))
         
-        return attendee
+        return attendees
+    
+    def write(self, vals):
+        """Override write para programar recordatorios de los nuevos confirmados"""
+        old_meetings = self.meeting_id if 'meeting_id' in vals else self.meeting_id.browse()
+        result = super().write(vals)
+        if vals.get('status') == 'confirmed':
+            self.env['zoom.scheduled.job'].sudo()._requeue_reminders(self.meeting_id)
+        if 'status' in vals or 'meeting_id' in vals:
+            self.env['zoom.meeting.daily']._mark_dirty((old_meetings | self.meeting_id).mapped('start_time'))
+        return result
+
+    def unlink(self):
+        """Override unlink para recalcular el análisis diario de sus reuniones"""
+        self.env['zoom.meeting.daily']._mark_dirty(self.meeting_id.mapped('start_time'))
+        return super().unlink()
     
     def _send_invitation(self):
-        """Enviar invitación por email al asistente"""
-        self.ensure_one()
-        
-        if not self.email:
+        """Enviar invitación por email a los asistentes
+
+        Toda la oleada se renderiza en un lote (``send_mail_batch``); los
+        datos de cada reunión se calculan una sola vez gracias a la caché de
+        ``zoom_meeting_values``. Los correos quedan en la cola de correo, como
+        los recordatorios, en lugar de enviarse uno a uno dentro de la
+        transacción.
+        """
+        if not self:
+            return
+        if not all(self.mapped('email')):
             raise UserError(_('No se puede enviar invitación sin email.'))
         
         # Crear template de email
@@ -104,7 +134,7 @@ class ZoomMeetingAttendee(models.Model):
         
         # Enviar email
         try:
-            template.send_mail(self.id, force_send=True)
+            template.send_mail_batch(self.ids, force_send=False)
             self.write({
                 'invitation_sent': fields.Datetime.now(),
                 'status': 'invited'
@@ -122,11 +152,43 @@ class ZoomMeetingAttendee(models.Model):
         try:
             template = self.env.ref('zoom18.email_template_meeting_reminder')
             template.send_mail(self.id, force_send=True)
-            _logger.info(f"Reminder sent to {self.email} for meeting {self.meeting_id.name}")
+            self.reminder_sent = fields.Datetime.now()
+            _logger.debug('Recordatorio enviado a %s (reunión %s)', self.email, self.meeting_id.id)
         except Exception as e:
-            _logger.error(f"Error sending reminder to {self.email}: {str(e)}")
+            _logger.error('Error enviando recordatorio a %s: %s', self.email, e)
             raise UserError(_('Error enviando recordatorio: %s') % str(e))
     
+    def _send_meeting_summary(self):
+        """Encolar el resumen de la reunión para estos asistentes
+
+        La plantilla se renderiza una vez por campo para todos los asistentes
+        (``_render_field``) y los correos se crean con un único ``create``;
+        los envía la cola de correo.
+        """
+        attendees = self.filtered('email')
+        if not attendees:
+            return self.env['mail.mail']
+        template = self.env.ref('zoom18.email_template_meeting_summary')
+        res_ids = attendees.ids
+        rendered = {
+            fname: template._render_field(fname, res_ids, compute_lang=True)
+            for fname in ('subject', 'email_from', 'email_to')
+        }
+        rendered['body_html'] = template._render_field(
+            'body_html', res_ids, compute_lang=True, options={'post_process': True}
+        )
+        mails = self.env['mail.mail'].sudo().create([{
+            'model': 'zoom.meeting',
+            'res_id': attendee.meeting_id.id,
+            'subject': rendered['subject'][attendee.id],
+            'email_from': rendered['email_from'][attendee.id],
+            'email_to': rendered['email_to'][attendee.id],
+            'body_html': rendered['body_html'][attendee.id],
+            'auto_delete': template.auto_delete,
+        } for attendee in attendees])
+        _logger.info('Resumen de reunión en cola para %d asistentes', len(mails))
+        return mails
+    
     def _send_confirmation(self):
         """Enviar confirmación de asistencia por email"""
         self.ensure_one()
@@ -137,9 +199,9 @@ class ZoomMeetingAttendee(models.Model):
         try:
             template = self.env.ref('zoom18.email_template_attendance_confirmation')
             template.send_mail(self.id, force_send=True)
-            _logger.info(f"Confirmation sent to {self.email} for meeting {self.meeting_id.name}")
+            _logger.debug('Confirmación enviada a %s (reunión %s)', self.email, self.meeting_id.id)
         except Exception as e:
-            _logger.error(f"Error sending confirmation to {self.email}: {str(e)}")
+            _logger.error('Error enviando confirmación a %s: %s', self.email, e)
             raise UserError(_('Error enviando confirmación: %s') % str(e))
     
     def _create_invitation_template(self):
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+
+from odoo import models, fields, api, _
+from odoo.exceptions import UserError
+
+from .zoom_client import ZoomUnavailable
+from .zoom_sync import parse_zoom_datetime
+from .zoom_logging import get_logger
+
+_logger = get_logger(__name__)
+
+# Informes de participantes: el de cuenta (planes Pro+) y, si no está disponible, el de reuniones pasadas
+PARTICIPANT_REPORT_PATHS = (
+    '/report/meetings/{meeting}/participants',
+    '/past_meetings/{meeting}/participants',
+)
+
+
+def normalize_email(email):
+    """Email en minúsculas y sin espacios, o False"""
+    return (email or '').strip().lower() or False
+
+
+class ZoomMeetingParticipant(models.Model):
+    """Intervalos de conexión de los participantes según el informe de Zoom
+
+    Una fila por cada entrada/salida: quien se reconecta aparece varias veces.
+    """
+    _name = 'zoom.meeting.participant'
+    _description = 'Participante de Reunión Zoom'
+    _order = 'meeting_id, join_time, id'
+
+    meeting_id = fields.Many2one(
+        'zoom.meeting',
+        string='Reunión',
+        required=True,
+        ondelete='cascade',
+        index=True
+    )
+
+    attendee_id = fields.Many2one(
+        'zoom.meeting.attendee',
+        string='Asistente',
+        ondelete='set null',
+        index=True,
+        help='Asistente invitado con el mismo email, si lo hay'
+    )
+
+    name = fields.Char(string='Nombre')
+    email = fields.Char(string='Email', help='Email normalizado (minúsculas)')
+    zoom_user_id = fields.Char(string='ID de Usuario Zoom')
+
+    join_time = fields.Datetime(string='Entrada')
+    leave_time = fields.Datetime(string='Salida')
+    duration = fields.Integer(string='Duración (s)')
+
+    @api.model
+    def _fetch_report(self, config, meeting):
+        """Descargar todas las páginas del informe de participantes"""
+        error = None
+        for path in PARTICIPANT_REPORT_PATHS:
+            try:
+                participants = []
+                for page, _next_token in config._zoom_get_pages(path.format(meeting=meeting.meeting_id), 'participants'):
+                    participants.extend(page)
+                return participants
+            except ZoomUnavailable:
+                raise
+            except UserError as e:
+                error = e
+        raise error
+
+    @api.model
+    def _prepare_rows(self, meeting, participants, attendee_by_email):
+        return [{
+            'meeting_id': meeting.id,
+            'attendee_id': attendee_by_email.get(normalize_email(participant.get('user_email'))),
+            'name': participant.get('name'),
+            'email': normalize_email(participant.get('user_email')),
+            'zoom_user_id': participant.get('user_id') or participant.get('id'),
+            'join_time': parse_zoom_datetime(participant.get('join_time')),
+            'leave_time': parse_zoom_datetime(participant.get('leave_time')),
+            'duration': participant.get('duration') or 0,
+        } for participant in participants]
+
+    @api.model
+    def _ingest(self, meeting, participants):
+        """Guardar el informe de una reunión y actualizar la asistencia
+
+        Sustituye las filas anteriores de la reunión, así que repetirlo con el
+        mismo informe deja el mismo resultado. Los asistentes se emparejan por
+        email normalizado en memoria y los estados se actualizan con una
+        escritura por estado.
+        """
+        attendee_by_email = {
+            normalize_email(attendee.email): attendee.id
+            for attendee in meeting.attendee_ids
+            if attendee.email
+        }
+        self.search([('meeting_id', '=', meeting.id)]).unlink()
+        rows = self.create(self._prepare_rows(meeting, participants, attendee_by_email))
+
+        matched = rows.attendee_id
+        matched.filtered(lambda a: a.status != 'attended').write({'status': 'attended'})
+        (meeting.attendee_ids - matched).filtered(lambda a: a.status == 'confirmed').write({'status': 'no_show'})
+
+        people = {row.email or row.zoom_user_id or row.name for row in rows}
+        vals = {'actual_participants': len(people)}
+        join_times = [t for t in rows.mapped('join_time') if t]
+        leave_times = [t for t in rows.mapped('leave_time') if t]
+        if join_times and not meeting.actual_start_time:
+            vals['actual_start_time'] = min(join_times)
+        if leave_times and not meeting.actual_end_time:
+            vals['actual_end_time'] = max(leave_times)
+        meeting.write(vals)
+        return rows
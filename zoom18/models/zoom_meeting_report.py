@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+
+from odoo import models, fields, api, tools
+from odoo.tools import SQL
+
+from .zoom_logging import get_logger
+
+_logger = get_logger(__name__)
+
+# Tasas del análisis: (campos del numerador, campos del denominador). En cada
+# agrupación se recalculan con la suma de sus contadores, no como media de filas
+REPORT_RATES = {
+    'attendance_rate': (('attended_count',), ('invited_count',)),
+    'no_show_rate': (('no_show_count',), ('attended_count', 'no_show_count')),
+    'utilization_rate': (('actual_hours',), ('held_scheduled_hours',)),
+}
+
+
+def _meeting_status_selection(model):
+    return model.env['zoom.meeting']._fields['status'].selection
+
+
+class ZoomMeetingDaily(models.Model):
+    """Hechos diarios de reuniones: una fila por día, anfitrión, proyecto y estado
+
+    Se mantiene de forma incremental: crear, modificar o eliminar reuniones y
+    asistentes marca sus días (``_mark_dirty``) y, antes de confirmar la
+    transacción, se recalculan solo esos días con una consulta agregada. Los
+    días son los de ``start_time`` en UTC.
+    """
+    _name = 'zoom.meeting.daily'
+    _description = 'Hechos Diarios de Reuniones Zoom'
+    _order = 'date desc, id'
+    _log_access = False
+
+    date = fields.Date(string='Día', required=True, readonly=True, index=True)
+    host_id = fields.Many2one('zoom.host', string='Anfitrión', ondelete='set null', readonly=True)
+    project_id = fields.Many2one('project.project', string='Proyecto', ondelete='set null', readonly=True)
+    status = fields.Selection(_meeting_status_selection, string='Estado', readonly=True)
+
+    # === CONTADORES ===
+    meeting_count = fields.Integer(string='Reuniones', readonly=True)
+    scheduled_minutes = fields.Integer(string='Minutos Programados', readonly=True)
+    actual_minutes = fields.Integer(string='Minutos Reales', readonly=True)
+    held_scheduled_minutes = fields.Integer(
+        string='Minutos Programados (Celebradas)',
+        readonly=True,
+        help='Minutos programados de las reuniones con duración real registrada'
+    )
+    invited_count = fields.Integer(string='Invitados', readonly=True)
+    confirmed_count = fields.Integer(string='Confirmados', readonly=True)
+    declined_count = fields.Integer(string='Rechazados', readonly=True)
+    attended_count = fields.Integer(string='Asistieron', readonly=True)
+    no_show_count = fields.Integer(string='No Asistieron', readonly=True)
+
+    def init(self):
+        # Instalación sobre reuniones existentes: rellenar la tabla una vez
+        self.env.cr.execute("SELECT 1 FROM zoom_meeting_daily LIMIT 1")
+        if not self.env.cr.fetchone():
+            self._refresh()
+
+    @api.model
+    def _mark_dirty(self, start_times):
+        """Recalcular antes de confirmar la transacción los días de estos inicios"""
+        days = {start.date() for start in start_times if start}
+        if not days:
+            return
+        precommit = self.env.cr.precommit
+        pending = precommit.data.setdefault('zoom.meeting.daily.days', set())
+        if not pending:
+            @precommit.add
+            def refresh():
+                self._refresh(pending)
+        pending.update(days)
+
+    @api.model
+    def _refresh(self, days=None):
+        """Recalcular las filas de ``days`` (o la tabla entera) desde reuniones y asistentes"""
+        self.env['zoom.meeting'].flush_model([
+            'start_time', 'host_id', 'project_id', 'status', 'duration', 'meeting_duration',
+        ])
+        self.env['zoom.meeting.attendee'].flush_model(['meeting_id', 'status'])
+        if days is None:
+            self.env.cr.execute("DELETE FROM zoom_meeting_daily")
+            where = SQL("m.start_time IS NOT NULL")
+        else:
+            days = sorted(days)
+            self.env.cr.execute("DELETE FROM zoom_meeting_daily WHERE date = ANY(%s)", [days])
+            where = SQL("m.start_time::date = ANY(%s)", days)
+        self.env.cr.execute(SQL("""
+            WITH meeting AS (
+                SELECT m.id, m.start_time::date AS date, m.host_id, m.project_id, m.status,
+                       COALESCE(m.duration, 0) AS duration, COALESCE(m.meeting_duration, 0) AS meeting_duration
+                  FROM zoom_meeting m
+                 WHERE %s
+            ), attendee AS (
+                SELECT a.meeting_id,
+                       COUNT(*) AS invited,
+                       COUNT(*) FILTER (WHERE a.status = 'confirmed') AS confirmed,
+                       COUNT(*) FILTER (WHERE a.status = 'declined') AS declined,
+                       COUNT(*) FILTER (WHERE a.status = 'attended') AS attended,
+                       COUNT(*) FILTER (WHERE a.status = 'no_show') AS no_show
+                  FROM zoom_meeting_attendee a
+                  JOIN meeting ON meeting.id = a.meeting_id
+                 GROUP BY a.meeting_id
+            )
+            INSERT INTO zoom_meeting_daily (
+                date, host_id, project_id, status, meeting_count, scheduled_minutes, actual_minutes,
+                held_scheduled_minutes, invited_count, confirmed_count, declined_count, attended_count, no_show_count
+            )
+            SELECT meeting.date, meeting.host_id, meeting.project_id, meeting.status,
+                   COUNT(*),
+                   SUM(meeting.duration),
+                   SUM(meeting.meeting_duration),
+                   COALESCE(SUM(meeting.duration) FILTER (WHERE meeting.meeting_duration > 0), 0),
+                   COALESCE(SUM(attendee.invited), 0),
+                   COALESCE(SUM(attendee.confirmed), 0),
+                   COALESCE(SUM(attendee.declined), 0),
+                   COALESCE(SUM(attendee.attended), 0),
+                   COALESCE(SUM(attendee.no_show), 0)
+              FROM meeting
+              LEFT JOIN attendee ON attendee.meeting_id = meeting.id
+             GROUP BY meeting.date, meeting.host_id, meeting.project_id, meeting.status
+        """, where))
+        self.invalidate_model()
+        # El dashboard resume los últimos 30 días de esta tabla
+        self.env['zoom.dashboard']._invalidate_cache()
+        _logger.debug('Análisis diario de reuniones recalculado: %s días', 'todos los' if days is None else len(days))
+
+
+class ZoomMeetingReport(models.Model):
+    """Análisis de reuniones sobre ``zoom.meeting.daily``
+
+    Vista SQL para ``read_group``, pivote y gráfica: añade horas, la
+    configuración del anfitrión y las tasas de asistencia, ausencia y
+    aprovechamiento.
+    """
+    _name = 'zoom.meeting.report'
+    _description = 'Análisis de Reuniones Zoom'
+    _auto = False
+    _order = 'date desc'
+    _rec_name = 'date'
+
+    date = fields.Date(string='Día', readonly=True)
+    host_id = fields.Many2one('zoom.host', string='Anfitrión', readonly=True)
+    config_id = fields.Many2one('zoom.config', string='Configuración', readonly=True)
+    project_id = fields.Many2one('project.project', string='Proyecto', readonly=True)
+    status = fields.Selection(_meeting_status_selection, string='Estado', readonly=True)
+
+    meeting_count = fields.Integer(string='Reuniones', readonly=True)
+    scheduled_hours = fields.Float(string='Horas Programadas', digits=(16, 2), readonly=True)
+    actual_hours = fields.Float(string='Horas Reales', digits=(16, 2), readonly=True)
+    held_scheduled_hours = fields.Float(
+        string='Horas Programadas (Celebradas)',
+        digits=(16, 2),
+        readonly=True,
+        help='Horas programadas de las reuniones con duración real registrada'
+    )
+    invited_count = fields.Integer(string='Invitados', readonly=True)
+    confirmed_count = fields.Integer(string='Confirmados', readonly=True)
+    declined_count = fields.Integer(string='Rechazados', readonly=True)
+    attended_count = fields.Integer(string='Asistieron', readonly=True)
+    no_show_count = fields.Integer(string='No Asistieron', readonly=True)
+
+    attendance_rate = fields.Float(
+        string='Tasa de Asistencia (%)',
+        digits=(16, 1),
+        readonly=True,
+        aggregator='avg',
+        help='Asistentes que se unieron sobre el total de invitados'
+    )
+    no_show_rate = fields.Float(
+        string='Tasa de Ausencia (%)',
+        digits=(16, 1),
+        readonly=True,
+        aggregator='avg',
+        help='Asistentes que no se unieron sobre los que tenían asistencia registrada'
+    )
+    utilization_rate = fields.Float(
+        string='Aprovechamiento (%)',
+        digits=(16, 1),
+        readonly=True,
+        aggregator='avg',
+        help='Duración real sobre la programada de las reuniones celebradas'
+    )
+
+    def init(self):
+        tools.drop_view_if_exists(self.env.cr, self._table)
+        self.env.cr.execute("""
+            CREATE OR REPLACE VIEW zoom_meeting_report AS (
+                SELECT d.id,
+                       d.date,
+                       d.host_id,
+                       h.config_id,
+                       d.project_id,
+                       d.status,
+                       d.meeting_count,
+                       d.scheduled_minutes / 60.0 AS scheduled_hours,
+                       d.actual_minutes / 60.0 AS actual_hours,
+                       d.held_scheduled_minutes / 60.0 AS held_scheduled_hours,
+                       d.invited_count,
+                       d.confirmed_count,
+                       d.declined_count,
+                       d.attended_count,
+                       d.no_show_count,
+                       COALESCE(d.attended_count * 100.0 / NULLIF(d.invited_count, 0), 0) AS attendance_rate,
+                       COALESCE(d.no_show_count * 100.0 / NULLIF(d.attended_count + d.no_show_count, 0), 0)
+                           AS no_show_rate,
+                       COALESCE(d.actual_minutes * 100.0 / NULLIF(d.held_scheduled_minutes, 0), 0)
+                           AS utilization_rate
+                  FROM zoom_meeting_daily d
+                  LEFT JOIN zoom_host h ON h.id = d.host_id
+            )
+        """)
+
+    @api.model
+    def _read_group_select(self, aggregate_spec, query):
+        """Tasas de cada grupo a partir de la suma de sus contadores"""
+        fname, __, func = aggregate_spec.partition(':')
+        if fname in REPORT_RATES and func == 'avg':
+            numerator, denominator = (
+                SQL(' + ').join(SQL('SUM(%s)', self._field_to_sql(self._table, name, query)) for name in names)
+                for names in REPORT_RATES[fname]
+            )
+            return SQL('COALESCE((%s) * 100.0 / NULLIF(%s, 0), 0)', numerator, denominator)
+        return super()._read_group_select(aggregate_spec, query)
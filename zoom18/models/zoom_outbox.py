@@ -0,0 +1,297 @@
+# -*- coding: utf-8 -*-
+
+from odoo import models, fields, api, _
+from odoo.exceptions import UserError
+import contextvars
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+import requests
+
+from .zoom_client import ZoomUnavailable, ZOOM_FAILURE_STATUS, zoom_request
+from .zoom_profile import profiled
+from .zoom_logging import LogBatch, correlation, get_logger
+
+_logger = get_logger(__name__)
+
+# Reintentos con espera exponencial: 30 s, 1 min, 2 min... hasta 1 hora
+OUTBOX_RETRY_DELAY = 30
+OUTBOX_MAX_DELAY = 3600
+OUTBOX_MAX_ATTEMPTS = 8
+
+# Operaciones bloqueadas y enviadas (en paralelo) por cada transacción del despachador
+OUTBOX_BATCH_SIZE = 50
+
+
+class ZoomOutbox(models.Model):
+    """Operaciones de escritura en Zoom (outbox transaccional)
+
+    Los métodos de negocio no llaman a Zoom dentro de la transacción: guardan
+    aquí la operación y, cuando la transacción se confirma, un despachador la
+    envía desde otro cursor y aplica el resultado al registro origen. Si la
+    transacción se revierte, la operación desaparece con ella y Zoom nunca se
+    entera. Las operaciones que fallan se reintentan con espera exponencial.
+    """
+    _name = 'zoom.outbox'
+    _description = 'Operación Pendiente de Zoom'
+    _order = 'id'
+
+    config_id = fields.Many2one(
+        'zoom.config',
+        string='Configuración',
+        required=True,
+        ondelete='cascade',
+        index=True
+    )
+
+    operation = fields.Selection([
+        ('create_meeting', 'Crear Reunión'),
+        ('delete_meeting', 'Cancelar Reunión'),
+    ], string='Operación', required=True)
+
+    idempotency_key = fields.Char(
+        string='Clave de Idempotencia',
+        required=True,
+        index=True,
+        copy=False,
+        help='Identifica la operación: encolarla de nuevo mientras está pendiente no la duplica'
+    )
+
+    method = fields.Char(string='Método HTTP', required=True)
+    path = fields.Char(string='Ruta', required=True)
+    payload = fields.Json(string='Datos')
+
+    res_model = fields.Char(string='Modelo Origen')
+    res_id = fields.Many2oneReference(string='Registro Origen', model_field='res_model')
+
+    state = fields.Selection([
+        ('pending', 'Pendiente'),
+        ('done', 'Enviada'),
+        ('failed', 'Fallida'),
+        ('cancelled', 'Anulada'),
+    ], string='Estado', default='pending', required=True, index=True)
+
+    attempts = fields.Integer(string='Intentos', default=0)
+    next_attempt = fields.Datetime(
+        string='Próximo Intento',
+        index=True,
+        help='Vacío: se envía en cuanto se confirma la transacción'
+    )
+    last_error = fields.Text(string='Último Error')
+    done_at = fields.Datetime(string='Enviada el')
+
+    @api.model
+    def _enqueue(self, config, operation, method, path, payload=None, record=None):
+        """Registrar una escritura en Zoom que se enviará tras el commit"""
+        return self._enqueue_many(config, operation, [(method, path, payload, record)])
+
+    @api.model
+    def _enqueue_many(self, config, operation, items):
+        """Registrar varias escrituras ``(método, ruta, datos, registro)`` en bloque
+
+        Una sola búsqueda de claves pendientes y un solo ``create``.
+        """
+        items_by_key = {}
+        for method, path, payload, record in items:
+            key = self._get_idempotency_key(operation, record) if record else str(uuid.uuid4())
+            items_by_key[key] = (method, path, payload, record)
+        existing = self.search([('idempotency_key', 'in', list(items_by_key)), ('state', '=', 'pending')])
+        for entry in existing:
+            method, path, payload, _record = items_by_key.pop(entry.idempotency_key)
+            entry.write({'method': method, 'path': path, 'payload': payload})
+        entries = existing | self.create([{
+            'config_id': config.id,
+            'operation': operation,
+            'idempotency_key': key,
+            'method': method,
+            'path': path,
+            'payload': payload,
+            'res_model': record._name if record else False,
+            'res_id': record.id if record else False,
+        } for key, (method, path, payload, record) in items_by_key.items()])
+        entries._dispatch_after_commit()
+        return entries
+
+    @api.model
+    def _get_idempotency_key(self, operation, record):
+        return f'{operation}:{record._name}:{record.id}'
+
+    @api.model
+    def _find_pending(self, operation, records):
+        return self.search([
+            ('idempotency_key', 'in', [self._get_idempotency_key(operation, record) for record in records]),
+            ('state', '=', 'pending'),
+        ])
+
+    def _dispatch_after_commit(self):
+        """Enviar estas operaciones en cuanto se confirme la transacción actual"""
+        pending_ids = self.env.cr.postcommit.data.setdefault('zoom.outbox.ids', set())
+        if not pending_ids:
+            registry, uid, context = self.env.registry, self.env.uid, dict(self.env.context)
+
+            @self.env.cr.postcommit.add
+            def dispatch():
+                with registry.cursor() as cr:
+                    env = api.Environment(cr, uid, context)
+                    env['zoom.outbox']._dispatch(ids=list(pending_ids))
+        pending_ids.update(self.ids)
+
+    @api.model
+    def _claim_batch(self, ids=None, size=1):
+        """Bloquear las siguientes operaciones vencidas sin esperar a otros despachadores"""
+        self.flush_model()
+        query = """
+            SELECT id FROM zoom_outbox
+             WHERE state = 'pending'
+               AND (next_attempt IS NULL OR next_attempt <= %s)
+        """
+        params = [fields.Datetime.now()]
+        if ids:
+            query += " AND id IN %s"
+            params.append(tuple(ids))
+        query += " ORDER BY id LIMIT %s FOR UPDATE SKIP LOCKED"
+        params.append(size)
+        self.env.cr.execute(query, params)
+        return self.browse([row[0] for row in self.env.cr.fetchall()])
+
+    @api.model
+    def _dispatch(self, ids=None, limit=None):
+        """Enviar operaciones vencidas por lotes
+
+        Cada lote se bloquea con ``FOR UPDATE SKIP LOCKED``, sus llamadas HTTP
+        se hacen en paralelo y se confirma al terminar, así el cron y el
+        despacho tras commit nunca envían dos veces la misma operación.
+        Se detiene si Zoom no está disponible.
+        """
+        sent = 0
+        with correlation('outbox'), LogBatch(_logger, 'Operaciones pendientes de Zoom enviadas') as batch:
+            while not limit or sent < limit:
+                size = OUTBOX_BATCH_SIZE if not limit else min(OUTBOX_BATCH_SIZE, limit - sent)
+                entries = self._claim_batch(ids, size)
+                if not entries:
+                    break
+                entries._send()
+                sent += len(entries)
+                batch.add(len(entries))
+                self._outbox_commit()
+                if any(config._get_circuit_breaker().is_open() for config in entries.config_id):
+                    break
+        self.env['zoom.api.metric']._flush_buffer(force=True)
+        return sent
+
+    def _send(self):
+        """Enviar las operaciones a Zoom: HTTP en paralelo, ORM en el hilo principal"""
+        for config in self.config_id:
+            entries = self.filtered(lambda e: e.config_id == config)
+            try:
+                headers = config._get_api_headers()
+            except ZoomUnavailable as e:
+                entries._postpone(str(e))
+                continue
+            except UserError as e:
+                # Error del token: cuenta como intento y no corta el envío de las demás configuraciones
+                for entry in entries:
+                    entry._handle_response(None, e)
+                continue
+            breaker = config._get_circuit_breaker()
+            metrics = config._get_api_metrics()
+            calls = [
+                (entry.method, f'{config.base_url}{entry.path}', entry.payload, entry.attempts > 0)
+                for entry in entries
+            ]
+
+            def call(method, url, payload, retry):
+                try:
+                    return zoom_request(method, url, breaker=breaker, metrics=metrics, retry=retry,
+                                       headers=headers, json=payload), None
+                except (ZoomUnavailable, requests.exceptions.RequestException) as e:
+                    return None, e
+
+            max_workers = max(1, min(config.sync_max_workers or 1, len(calls)))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                # Cada llamada con una copia del contexto del hilo principal (ver trace_http)
+                futures = [executor.submit(contextvars.copy_context().run, call, *args) for args in calls]
+                results = [future.result() for future in futures]
+            for entry, (response, error) in zip(entries, results):
+                entry._handle_response(response, error)
+
+    def _postpone(self, error):
+        """Circuito abierto: no cuenta como intento, se espera a la prueba del circuito"""
+        for config in self.config_id:
+            self.filtered(lambda e: e.config_id == config).write({
+                'next_attempt': fields.Datetime.now() + timedelta(seconds=config._get_circuit_breaker().reset_timeout),
+                'last_error': error,
+            })
+
+    def _handle_response(self, response, error=None):
+        """Registrar el resultado de una llamada y aplicarlo al registro origen"""
+        self.ensure_one()
+        if isinstance(error, ZoomUnavailable):
+            self._postpone(str(error))
+            return
+        self.attempts += 1
+        if error:
+            self._schedule_retry(str(error))
+            return
+        if response.status_code in ZOOM_FAILURE_STATUS:
+            self._schedule_retry(response.text)
+            return
+        if response.status_code >= 400 and not (self.operation == 'delete_meeting' and response.status_code == 404):
+            self.write({'state': 'failed', 'last_error': response.text})
+            _logger.error('Operación Zoom %s rechazada: %s - %s', self.operation, response.status_code, response.text)
+            return
+        result = response.json() if response.content else {}
+        error = False
+        try:
+            with self.env.cr.savepoint():
+                self._apply_result(result)
+        except Exception as e:
+            # Zoom ya aplicó la operación: no se reintenta, solo se deja constancia
+            _logger.exception('Error aplicando el resultado de %s en %s,%s', self.operation, self.res_model, self.res_id)
+            error = str(e)
+        self.write({'state': 'done', 'done_at': fields.Datetime.now(), 'last_error': error})
+
+    def _schedule_retry(self, error):
+        self.ensure_one()
+        if self.attempts >= OUTBOX_MAX_ATTEMPTS:
+            self.write({'state': 'failed', 'last_error': error})
+            _logger.error('Operación Zoom %s abandonada tras %s intentos: %s', self.operation, self.attempts, error)
+            return
+        delay = min(OUTBOX_RETRY_DELAY * 2 ** (self.attempts - 1), OUTBOX_MAX_DELAY)
+        self.write({
+            'next_attempt': fields.Datetime.now() + timedelta(seconds=delay),
+            'last_error': error,
+        })
+
+    def _apply_result(self, result):
+        """Delegar el resultado en el registro origen (``_zoom_outbox_done``)"""
+        self.ensure_one()
+        if not self.res_model or not self.res_id:
+            return
+        record = self.env[self.res_model].browse(self.res_id).exists()
+        if record and hasattr(record, '_zoom_outbox_done'):
+            record._zoom_outbox_done(self.operation, result)
+
+    @api.model
+    def _outbox_commit(self):
+        if not self.env.registry.in_test_mode():
+            self.env.cr.commit()
+
+    def action_retry(self):
+        """Volver a poner en cola operaciones fallidas"""
+        failed = self.filtered(lambda e: e.state == 'failed')
+        failed.write({'state': 'pending', 'attempts': 0, 'next_attempt': False})
+        failed._dispatch_after_commit()
+
+    @api.model
+    @profiled
+    def _cron_replay_outbox(self):
+        """Enviar las operaciones vencidas (reintentos y las que no se despacharon)"""
+        batch_size = self.env['zoom.config']._get_cron_batch_size()
+        sent = self._dispatch(limit=batch_size)
+        remaining = self.search_count([
+            ('state', '=', 'pending'),
+            '|', ('next_attempt', '=', False), ('next_attempt', '<=', fields.Datetime.now()),
+        ]) if sent == batch_size else 0
+        self.env['ir.cron']._notify_progress(done=sent, remaining=remaining)
@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+
+from odoo import models, fields, api, _
+from odoo.tools.profiler import Profiler
+import cProfile
+import functools
+import io
+import pstats
+import random
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import timedelta
+
+from .zoom_client import trace_http
+from .zoom_logging import correlation, get_correlation_id, get_logger
+
+_logger = get_logger(__name__)
+
+# Días que se conservan los perfiles
+PROFILE_RETENTION_DAYS = 14
+
+# Consultas SQL (agrupadas por texto) y funciones de Python que se guardan en cada perfil
+PROFILE_TOP_QUERIES = 15
+PROFILE_TOP_FUNCTIONS = 30
+
+# Llamadas HTTP que se detallan como máximo en cada perfil
+PROFILE_MAX_HTTP_CALLS = 200
+
+# Perfil en curso en el hilo: las acciones anidadas (p. ej. un cron que crea tickets) no se perfilan aparte
+_active_profile = threading.local()
+
+
+def profiled(method):
+    """Perfilar el método cuando el perfilado de zoom.config está activo
+
+    El perfil se guarda como ``<modelo>.<método>``. Sin perfilado activo el
+    coste es una consulta a caché (ver ``zoom.config._get_profiling_settings``).
+    Son los puntos de entrada de la integración: cada llamada abre también un
+    id de correlación para sus líneas de log.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with correlation(), self.env['zoom.profile']._profile(f'{self._name}.{method.__name__}'):
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+class ZoomProfile(models.Model):
+    _name = 'zoom.profile'
+    _description = 'Perfil de Rendimiento Zoom'
+    _order = 'started_at desc, id desc'
+
+    name = fields.Char(
+        string='Acción',
+        required=True,
+        readonly=True,
+        index=True,
+        help='Modelo y método perfilados, p. ej. helpdesk.ticket.create'
+    )
+
+    config_id = fields.Many2one(
+        'zoom.config',
+        string='Configuración',
+        ondelete='cascade',
+        readonly=True
+    )
+
+    user_id = fields.Many2one(
+        'res.users',
+        string='Usuario',
+        ondelete='set null',
+        readonly=True
+    )
+
+    started_at = fields.Datetime(
+        string='Inicio',
+        required=True,
+        readonly=True,
+        index=True
+    )
+
+    correlation_id = fields.Char(
+        string='Id de Correlación',
+        readonly=True,
+        index=True,
+        help='Prefijo de las líneas de log de la acción perfilada'
+    )
+
+    error = fields.Char(
+        string='Error',
+        readonly=True,
+        help='Excepción con la que terminó la acción'
+    )
+
+    # === TIEMPOS ===
+    duration_ms = fields.Float(string='Duración (ms)', digits=(16, 1), readonly=True)
+    sql_count = fields.Integer(string='Consultas SQL', readonly=True)
+    sql_time_ms = fields.Float(string='Tiempo SQL (ms)', digits=(16, 1), readonly=True)
+    http_count = fields.Integer(string='Llamadas a Zoom', readonly=True)
+    http_time_ms = fields.Float(string='Tiempo HTTP (ms)', digits=(16, 1), readonly=True)
+    other_time_ms = fields.Float(
+        string='Resto (ms)',
+        compute='_compute_other_time_ms',
+        digits=(16, 1),
+        help='Tiempo fuera de SQL y de las llamadas a Zoom (Python, plantillas, esperas)'
+    )
+
+    # === DETALLE ===
+    sql_details = fields.Text(string='Consultas más Costosas', readonly=True)
+    http_details = fields.Text(string='Llamadas a Zoom', readonly=True)
+    python_stats = fields.Text(string='Perfil de Python', readonly=True)
+
+    @api.depends('duration_ms', 'sql_time_ms', 'http_time_ms')
+    def _compute_other_time_ms(self):
+        for profile in self:
+            profile.other_time_ms = max(profile.duration_ms - profile.sql_time_ms - profile.http_time_ms, 0.0)
+
+    @api.model
+    @contextmanager
+    def _profile(self, name):
+        """Medir el bloque con el perfilador de Odoo (SQL), las llamadas a Zoom y, opcionalmente, cProfile
+
+        Solo perfila si hay una configuración con ``profiling_enabled``, según
+        ``profiling_sample_rate``, y guarda el perfil si dura al menos
+        ``profiling_min_duration`` ms, también cuando el bloque falla.
+        """
+        settings = self.env['zoom.config']._get_profiling_settings()
+        if not settings or getattr(_active_profile, 'name', None) or random.random() * 100 >= settings[1]:
+            yield
+            return
+        config_id, _sample_rate, min_duration, with_python = settings
+        _active_profile.name = name
+        started_at = fields.Datetime.now()
+        python_profiler = cProfile.Profile() if with_python else None
+        profiler, http_calls, error = None, [], False
+        start = time.perf_counter()
+        try:
+            with Profiler(collectors=['sql'], db=None, description=name) as profiler, trace_http() as http_calls:
+                if python_profiler:
+                    python_profiler.enable()
+                try:
+                    yield
+                finally:
+                    if python_profiler:
+                        python_profiler.disable()
+        except Exception as e:
+            error = f'{type(e).__name__}: {e}'
+            raise
+        finally:
+            _active_profile.name = None
+            duration = time.perf_counter() - start
+            if profiler and duration * 1000 >= min_duration:
+                sql_entries = next(
+                    (collector.entries for collector in profiler.collectors if collector.name == 'sql'), [])
+                self._store(dict(
+                    self._summarize(sql_entries, http_calls, python_profiler),
+                    name=name,
+                    config_id=config_id,
+                    user_id=self.env.uid,
+                    correlation_id=get_correlation_id(),
+                    started_at=started_at,
+                    duration_ms=duration * 1000,
+                    error=error and error[:250],
+                ))
+
+    @api.model
+    def _summarize(self, sql_entries, http_calls, python_profiler=None):
+        """Totales y detalle legible de las consultas, llamadas HTTP y funciones de Python"""
+        queries = defaultdict(lambda: [0, 0.0])
+        for entry in sql_entries:
+            totals = queries[entry.get('query', '')]
+            totals[0] += 1
+            totals[1] += entry.get('time', 0.0)
+        top_queries = sorted(queries.items(), key=lambda item: item[1][1], reverse=True)[:PROFILE_TOP_QUERIES]
+        vals = {
+            'sql_count': len(sql_entries),
+            'sql_time_ms': sum(entry.get('time', 0.0) for entry in sql_entries) * 1000,
+            'sql_details': '\n\n'.join(
+                f'{total * 1000:.1f} ms · {count}x\n{query}' for query, (count, total) in top_queries
+            ),
+            'http_count': len(http_calls),
+            'http_time_ms': sum(elapsed for _method, _endpoint, _status, elapsed in http_calls) * 1000,
+            'http_details': '\n'.join(
+                f'{elapsed * 1000:.1f} ms · {method} {endpoint} → {status}'
+                for method, endpoint, status, elapsed in http_calls[:PROFILE_MAX_HTTP_CALLS]
+            ),
+        }
+        if python_profiler:
+            stream = io.StringIO()
+            pstats.Stats(python_profiler, stream=stream).sort_stats('cumulative').print_stats(PROFILE_TOP_FUNCTIONS)
+            vals['python_stats'] = stream.getvalue()
+        return vals
+
+    @api.model
+    def _store(self, vals):
+        """Guardar el perfil con un cursor propio (salvo en los tests)
+
+        Así se conserva aunque la acción perfilada falle y deshaga su
+        transacción.
+        """
+        try:
+            if getattr(threading.current_thread(), 'testing', False):
+                # En los tests, dentro de su transacción para que se deshaga con ella
+                with self.env.cr.savepoint():
+                    self.sudo().create(vals)
+            else:
+                with self.env.registry.cursor() as cr:
+                    self.with_env(self.env(cr=cr)).sudo().create(vals)
+        except Exception:
+            _logger.warning('No se pudo guardar el perfil de %s', vals.get('name'), exc_info=True)
+
+    @api.autovacuum
+    def _gc_profiles(self):
+        """Eliminar perfiles antiguos"""
+        limit_date = fields.Datetime.now() - timedelta(days=PROFILE_RETENTION_DAYS)
+        self.search([('started_at', '<', limit_date)]).unlink()
@@ -0,0 +1,237 @@
+# -*- coding: utf-8 -*-
+
+from odoo import models, fields, api, _
+from odoo.exceptions import UserError
+from urllib.parse import quote
+
+from .zoom_sync import parse_zoom_datetime
+from .zoom_logging import get_logger
+
+_logger = get_logger(__name__)
+
+# Validez (segundos) del token de descarga que se pide al abrir una grabación
+DOWNLOAD_TOKEN_TTL = 300
+
+
+def encode_meeting_uuid(uuid):
+    """UUID de reunión listo para la ruta de la API
+
+    Zoom exige codificarlo dos veces si empieza por ``/`` o contiene ``//``.
+    """
+    uuid = str(uuid)
+    if uuid.startswith('/') or '//' in uuid:
+        return quote(quote(uuid, safe=''), safe='')
+    return quote(uuid, safe='')
+
+
+class ZoomRecording(models.Model):
+    """Grabación en la nube de una reunión de Zoom
+
+    Se guarda una vez, al llegar el webhook ``recording.completed`` o cuando
+    el trabajo programado la encuentra, y ya no se vuelve a consultar. Los
+    enlaces de descarga no se guardan: se generan al abrir cada archivo.
+    """
+    _name = 'zoom.recording'
+    _description = 'Grabación de Reunión Zoom'
+    _order = 'start_time desc, id desc'
+    _rec_name = 'topic'
+
+    uuid = fields.Char(string='UUID', required=True, help='UUID de la sesión grabada en Zoom')
+
+    zoom_meeting_id = fields.Char(
+        string='ID Reunión Zoom',
+        required=True,
+        index=True,
+        help='ID numérico de la reunión (el mismo que usan reuniones y tickets)'
+    )
+
+    meeting_id = fields.Many2one(
+        'zoom.meeting',
+        string='Reunión',
+        ondelete='set null',
+        index=True
+    )
+
+    topic = fields.Char(string='Tema')
+    start_time = fields.Datetime(string='Inicio')
+    duration = fields.Integer(string='Duración (min)')
+    # En bytes; Float porque los enteros de Odoo no pasan de 2 GB
+    total_size = fields.Float(string='Tamaño Total (bytes)', digits=(16, 0))
+
+    file_ids = fields.One2many(
+        'zoom.recording.file',
+        'recording_id',
+        string='Archivos'
+    )
+
+    file_count = fields.Integer(string='Archivos', compute='_compute_file_count')
+
+    _sql_constraints = [
+        ('uuid_unique', 'unique(uuid)', 'La grabación ya está registrada.'),
+    ]
+
+    @api.depends('file_ids')
+    def _compute_file_count(self):
+        for recording in self:
+            recording.file_count = len(recording.file_ids)
+
+    @api.model
+    def _fetch(self, config, zoom_meeting_id):
+        """Consultar la grabación de una reunión en Zoom y guardarla
+
+        Devuelve la grabación, o un recordset vacío si Zoom aún no la tiene
+        (404 mientras se procesa).
+        """
+        response = config._zoom_request('GET', f'/meetings/{encode_meeting_uuid(zoom_meeting_id)}/recordings', timeout=10)
+        if response.status_code == 404:
+            return self.browse()
+        if response.status_code != 200:
+            raise UserError(_('Error obteniendo la grabación de Zoom: %s') % response.text)
+        data = response.json()
+        if not data.get('recording_files'):
+            return self.browse()
+        return self._ingest(data, zoom_meeting_id=zoom_meeting_id)
+
+    @api.model
+    def _ingest(self, data, zoom_meeting_id=None):
+        """Guardar o actualizar una grabación con todos sus archivos
+
+        ``data`` es el objeto de Zoom (``payload.object`` del webhook o la
+        respuesta de ``/meetings/{id}/recordings``). Los archivos se
+        identifican por su ID, así que recibir el mismo evento dos veces no
+        duplica nada.
+        """
+        zoom_meeting_id = str(data.get('id') or zoom_meeting_id or '')
+        uuid = data.get('uuid') or zoom_meeting_id
+        vals = {
+            'uuid': uuid,
+            'zoom_meeting_id': zoom_meeting_id,
+            'topic': data.get('topic'),
+            'start_time': parse_zoom_datetime(data.get('start_time')),
+            'duration': data.get('duration') or 0,
+            'total_size': data.get('total_size') or sum(f.get('file_size') or 0 for f in data.get('recording_files', [])),
+        }
+        recording = self.search([('uuid', '=', uuid)], limit=1)
+        if recording:
+            recording.write(vals)
+        else:
+            vals['meeting_id'] = self.env['zoom.meeting'].search([('meeting_id', '=', zoom_meeting_id)], limit=1).id
+            recording = self.create(vals)
+        self.env['zoom.recording.file']._upsert(recording, data.get('recording_files', []))
+
+        # Ya no hace falta seguir preguntando a Zoom por esta reunión
+        if recording.meeting_id:
+            self.env['zoom.scheduled.job'].search([
+                ('meeting_id', '=', recording.meeting_id.id),
+                ('job_type', '=', 'recordings'),
+                ('state', '=', 'pending'),
+            ]).write({'state': 'done', 'done_at': fields.Datetime.now()})
+        tickets = self.env['helpdesk.ticket'].search([
+            ('zoom_meeting_id', '=', zoom_meeting_id),
+            ('recording_available', '=', False),
+        ])
+        tickets.write({'recording_available': True})
+        return recording
+
+    def _get_download_access_token(self):
+        """Pedir a Zoom un token de descarga de corta duración"""
+        self.ensure_one()
+        config = self.env['zoom.config'].get_active_config()
+        response = config._zoom_request(
+            'GET', f'/meetings/{encode_meeting_uuid(self.uuid)}/recordings',
+            params={'include_fields': 'download_access_token', 'ttl': DOWNLOAD_TOKEN_TTL},
+            timeout=10,
+        )
+        if response.status_code != 200:
+            raise UserError(_('Error obteniendo el enlace de descarga de Zoom: %s') % response.text)
+        token = response.json().get('download_access_token')
+        if not token:
+            raise UserError(_('Zoom no ha devuelto un token de descarga para esta grabación.'))
+        return token
+
+
+class ZoomRecordingFile(models.Model):
+    """Archivo de una grabación (vídeo, audio, chat, transcripción...)"""
+    _name = 'zoom.recording.file'
+    _description = 'Archivo de Grabación Zoom'
+    _order = 'recording_id, recording_start, id'
+    _rec_name = 'file_type'
+
+    recording_id = fields.Many2one(
+        'zoom.recording',
+        string='Grabación',
+        required=True,
+        ondelete='cascade',
+        index=True
+    )
+
+    zoom_file_id = fields.Char(string='ID de Archivo', required=True)
+    file_type = fields.Char(string='Tipo', help='MP4, M4A, CHAT, TRANSCRIPT...')
+    file_extension = fields.Char(string='Extensión')
+    recording_type = fields.Char(string='Vista', help='shared_screen_with_speaker_view, audio_only...')
+    file_size = fields.Float(string='Tamaño (bytes)', digits=(16, 0))
+    checksum = fields.Char(string='Checksum', help='Suma de control del archivo, si Zoom la envía')
+    recording_start = fields.Datetime(string='Inicio')
+    recording_end = fields.Datetime(string='Fin')
+    duration = fields.Integer(string='Duración (s)')
+    status = fields.Char(string='Estado')
+    # URL base de Zoom: sin token no sirve para descargar, por eso no caduca
+    download_url = fields.Char(string='URL de Zoom')
+    play_url = fields.Char(string='URL de Reproducción')
+
+    _sql_constraints = [
+        ('recording_file_unique', 'unique(recording_id, zoom_file_id)', 'El archivo ya está registrado.'),
+    ]
+
+    @api.model
+    def _prepare_file(self, file_data):
+        start = parse_zoom_datetime(file_data.get('recording_start'))
+        end = parse_zoom_datetime(file_data.get('recording_end'))
+        return {
+            'zoom_file_id': str(file_data.get('id') or file_data.get('download_url') or ''),
+            'file_type': file_data.get('file_type'),
+            'file_extension': file_data.get('file_extension'),
+            'recording_type': file_data.get('recording_type'),
+            'file_size': file_data.get('file_size') or 0,
+            'checksum': file_data.get('checksum') or file_data.get('file_checksum') or False,
+            'recording_start': start,
+            'recording_end': end,
+            'duration': int((end - start).total_seconds()) if start and end else 0,
+            'status': file_data.get('status'),
+            'download_url': file_data.get('download_url'),
+            'play_url': file_data.get('play_url'),
+        }
+
+    @api.model
+    def _upsert(self, recording, files):
+        """Crear los archivos nuevos en un solo ``create`` y actualizar los demás"""
+        existing = {file.zoom_file_id: file for file in recording.file_ids}
+        to_create = []
+        for file_data in files:
+            vals = self._prepare_file(file_data)
+            if not vals['zoom_file_id']:
+                continue
+            file = existing.get(vals['zoom_file_id'])
+            if file:
+                file.write(vals)
+            else:
+                vals['recording_id'] = recording.id
+                to_create.append(vals)
+        return self.create(to_create)
+
+    def _get_download_url(self):
+        """Enlace de descarga válido durante ``DOWNLOAD_TOKEN_TTL`` segundos"""
+        self.ensure_one()
+        if not self.download_url:
+            raise UserError(_('Zoom no ofrece descarga para este archivo.'))
+        token = self.recording_id._get_download_access_token()
+        separator = '&' if '?' in self.download_url else '?'
+        return f'{self.download_url}{separator}access_token={token}'
+
+    def action_download(self):
+        self.ensure_one()
+        return {
+            'type': 'ir.actions.act_url',
+            'url': f'/zoom/recording/file/{self.id}/download',
+            'target': 'new',
+        }
@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+
+from odoo import models, fields, api, _
+from datetime import timedelta
+
+from .zoom_logging import get_logger
+
+_logger = get_logger(__name__)
+
+# Días que se conservan los recordatorios de reuniones ya pasadas
+REMINDER_RETENTION_DAYS = 30
+
+
+class ZoomReminder(models.Model):
+    """Registro de recordatorios por asistente y antelación
+
+    Cada fila es un recordatorio concreto (asistente + minutos de antelación).
+    La restricción única hace que programar dos veces no duplique nada y el
+    estado evita reenviar lo que ya salió, aunque el cron se ejecute de nuevo.
+    """
+    _name = 'zoom.reminder'
+    _description = 'Recordatorio de Reunión Zoom'
+    _order = 'scheduled_at, id'
+    _rec_name = 'attendee_id'
+
+    attendee_id = fields.Many2one(
+        'zoom.meeting.attendee',
+        string='Asistente',
+        required=True,
+        ondelete='cascade',
+        index=True
+    )
+
+    meeting_id = fields.Many2one(
+        'zoom.meeting',
+        string='Reunión',
+        related='attendee_id.meeting_id',
+        store=True,
+        index=True
+    )
+
+    offset_minutes = fields.Integer(
+        string='Antelación (min)',
+        required=True,
+        help='Minutos antes del inicio de la reunión'
+    )
+
+    scheduled_at = fields.Datetime(
+        string='Programado Para',
+        compute='_compute_scheduled_at',
+        store=True,
+        index=True,
+        help='Se recalcula si cambia la hora de la reunión'
+    )
+
+    state = fields.Selection([
+        ('pending', 'Pendiente'),
+        ('sent', 'En Cola de Correo'),
+        ('skipped', 'Omitido'),
+        ('failed', 'Fallido'),
+    ], string='Estado', default='pending', required=True, index=True)
+
+    sent_at = fields.Datetime(string='Enviado el', readonly=True)
+    mail_id = fields.Many2one('mail.mail', string='Correo', readonly=True, ondelete='set null')
+    error = fields.Text(string='Error', readonly=True)
+
+    _sql_constraints = [
+        ('attendee_offset_unique', 'unique(attendee_id, offset_minutes)',
+         'Ya existe un recordatorio con esa antelación para el asistente.'),
+    ]
+
+    @api.depends('meeting_id.start_time', 'offset_minutes')
+    def _compute_scheduled_at(self):
+        for reminder in self:
+            start = reminder.meeting_id.start_time
+            reminder.scheduled_at = start - timedelta(minutes=reminder.offset_minutes) if start else False
+
+    @api.model
+    def _schedule(self, offsets, meetings=None):
+        """Crear las filas que falten para los asistentes de las próximas reuniones
+
+        Sin ``meetings`` se consideran las reuniones que empiezan dentro de la
+        mayor antelación. Una búsqueda de asistentes, una de recordatorios
+        existentes y un único ``create`` con los que faltan.
+        """
+        if not offsets:
+            return self.browse()
+        now = fields.Datetime.now()
+        domain = [
+            ('status', '=', 'confirmed'),
+            ('meeting_id.status', '=', 'scheduled'),
+            ('meeting_id.start_time', '>', now),
+        ]
+        if meetings is not None:
+            domain.append(('meeting_id', 'in', meetings.ids))
+        else:
+            domain.append(('meeting_id.start_time', '<=', now + timedelta(minutes=max(offsets))))
+        attendees = self.env['zoom.meeting.attendee'].search(domain)
+        if not attendees:
+            return self.browse()
+        existing = {
+            (reminder.attendee_id.id, reminder.offset_minutes)
+            for reminder in self.search_fetch([('attendee_id', 'in', attendees.ids)], ['attendee_id', 'offset_minutes'])
+        }
+        return self.create([
+            {'attendee_id': attendee.id, 'offset_minutes': offset}
+            for attendee in attendees
+            for offset in offsets
+            if (attendee.id, offset) not in existing
+        ])
+
+    @api.model
+    def _get_due_domain(self, meetings=None):
+        now = fields.Datetime.now()
+        domain = [
+            ('state', '=', 'pending'),
+            ('scheduled_at', '<=', now),
+            ('meeting_id.start_time', '>', now),
+        ]
+        if meetings is not None:
+            domain.append(('meeting_id', 'in', meetings.ids))
+        return domain
+
+    @api.model
+    def _skip_obsolete(self, meetings=None):
+        """Omitir recordatorios pendientes que ya no deben enviarse"""
+        domain = [
+            ('state', '=', 'pending'),
+            '|', '|', '|',
+            ('meeting_id.start_time', '<=', fields.Datetime.now()),
+            ('meeting_id.status', '!=', 'scheduled'),
+            ('attendee_id.status', '!=', 'confirmed'),
+            ('attendee_id.email', '=', False),
+        ]
+        if meetings is not None:
+            domain.append(('meeting_id', 'in', meetings.ids))
+        obsolete = self.search(domain)
+        obsolete.write({'state': 'skipped'})
+        return obsolete
+
+    def _send(self):
+        """Renderizar y encolar los recordatorios en bloque
+
+        Si un asistente tiene varios recordatorios vencidos (por ejemplo el de
+        24 horas y el de 1 hora) solo se envía el más próximo a la reunión.
+        Los correos se generan con una sola renderización por lote y quedan en
+        la cola de ``mail.mail``, sin envío inmediato.
+        """
+        # Incluye los vencidos de los mismos asistentes que hayan quedado en otro lote
+        due = self | self.search(self._get_due_domain() + [('attendee_id', 'in', self.attendee_id.ids)])
+        nearest = {}
+        for reminder in due.sorted('offset_minutes', reverse=True):
+            nearest[reminder.attendee_id.id] = reminder
+        to_send = self.filtered(lambda r: nearest[r.attendee_id.id] == r)
+        (self - to_send).write({'state': 'skipped'})
+        if not to_send:
+            return to_send
+
+        template = self.env.ref('zoom18.email_template_meeting_reminder')
+        attendees = to_send.attendee_id
+        try:
+            mails = template.send_mail_batch(attendees.ids, force_send=False)
+        except Exception as e:
+            _logger.error('Error generando %s recordatorios: %s', len(to_send), e)
+            to_send.write({'state': 'failed', 'error': str(e)})
+            return self.browse()
+
+        # send_mail_batch devuelve los correos en el orden de los res_ids
+        now = fields.Datetime.now()
+        mail_by_attendee = dict(zip(attendees.ids, mails))
+        for reminder in to_send:
+            reminder.write({
+                'state': 'sent',
+                'sent_at': now,
+                'mail_id': mail_by_attendee[reminder.attendee_id.id].id,
+                'error': False,
+            })
+        attendees.write({'reminder_sent': now})
+        return to_send
+
+    @api.model
+    def _send_due(self, meetings=None, limit=None):
+        """Programar, omitir obsoletos y enviar los recordatorios vencidos
+
+        Devuelve ``(vencidos, enviados)``.
+        """
+        offsets = self.env['zoom.config']._get_reminder_offsets()
+        self._schedule(offsets, meetings)
+        self._skip_obsolete(meetings)
+        due = self.search(self._get_due_domain(meetings), limit=limit)
+        sent = due._send()
+        if sent:
+            _logger.info('Recordatorios automáticos en cola: %s para %s reuniones', len(sent), len(sent.meeting_id))
+        return due, sent
+
+    @api.model
+    def _process_due(self):
+        """Enviar un lote de recordatorios vencidos de todas las reuniones"""
+        batch_size = self.env['zoom.config']._get_cron_batch_size()
+        due, sent = self._send_due(limit=batch_size)
+        remaining = self.search_count(self._get_due_domain()) if len(due) == batch_size else 0
+        self.env['ir.cron']._notify_progress(done=len(due), remaining=remaining)
+        return sent
+
+    @api.autovacuum
+    def _gc_reminders(self):
+        """Eliminar recordatorios de reuniones antiguas"""
+        limit_date = fields.Datetime.now() - timedelta(days=REMINDER_RETENTION_DAYS)
+        self.search([('scheduled_at', '<', limit_date)]).unlink()
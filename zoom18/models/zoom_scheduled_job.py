@@ -0,0 +1,252 @@
+# -*- coding: utf-8 -*-
+
+from odoo import models, fields, api, _
+from odoo.exceptions import UserError
+import requests
+from datetime import timedelta
+
+from .zoom_client import ZoomUnavailable
+from .zoom_profile import profiled
+from .zoom_logging import get_logger
+
+_logger = get_logger(__name__)
+
+# Minutos tras la hora de fin para dar por terminada una reunión en curso
+STATUS_GRACE_MINUTES = 15
+
+# Minutos tras el fin previsto para pedir el informe de participantes
+PARTICIPANT_REPORT_DELAY_MINUTES = 30
+
+# Reintento del informe si Zoom no está disponible
+PARTICIPANT_REPORT_RETRY_MINUTES = 10
+
+# Esperas sucesivas (minutos) mientras Zoom procesa la grabación; después se deja de preguntar
+RECORDING_RETRY_MINUTES = (30, 60, 120, 240, 480)
+
+# No se piden informes ni grabaciones de reuniones más antiguas (p. ej. al importar el histórico)
+PARTICIPANT_REPORT_MAX_AGE_DAYS = 7
+
+# Días que se conservan los trabajos ejecutados o anulados
+SCHEDULED_JOB_RETENTION_DAYS = 7
+
+
+class ZoomScheduledJob(models.Model):
+    """Trabajos de reuniones con hora exacta de ejecución
+
+    En lugar de recorrer todas las reuniones en cada pasada, cada reunión
+    deja aquí sus trabajos (recordatorios, cierre de estado, informe de
+    participantes y grabación) con la hora a la
+    que vencen. El cron, cada minuto, solo lee los vencidos por el índice de
+    ``due_at`` y los bloquea con ``FOR UPDATE SKIP LOCKED``.
+    """
+    _name = 'zoom.scheduled.job'
+    _description = 'Trabajo Programado de Zoom'
+    _order = 'due_at, id'
+    _rec_name = 'job_type'
+
+    meeting_id = fields.Many2one(
+        'zoom.meeting',
+        string='Reunión',
+        required=True,
+        ondelete='cascade',
+        index=True
+    )
+
+    job_type = fields.Selection([
+        ('reminder', 'Recordatorio'),
+        ('finish', 'Fin de Reunión'),
+        ('participants', 'Informe de Participantes'),
+        ('recordings', 'Grabación'),
+    ], string='Tipo', required=True)
+
+    offset_minutes = fields.Integer(
+        string='Antelación (min)',
+        default=0,
+        help='Para recordatorios: minutos antes del inicio'
+    )
+
+    due_at = fields.Datetime(string='Vence', required=True)
+
+    state = fields.Selection([
+        ('pending', 'Pendiente'),
+        ('done', 'Ejecutado'),
+        ('cancelled', 'Anulado'),
+    ], string='Estado', default='pending', required=True)
+
+    done_at = fields.Datetime(string='Ejecutado el', readonly=True)
+
+    attempts = fields.Integer(
+        string='Intentos',
+        default=0,
+        readonly=True,
+        help='Consultas sin resultado (grabación aún no disponible)'
+    )
+
+    _sql_constraints = [
+        ('meeting_job_unique', 'unique(meeting_id, job_type, offset_minutes)',
+         'La reunión ya tiene ese trabajo programado.'),
+    ]
+
+    def init(self):
+        # Índice parcial: el cron solo recorre los pendientes ordenados por vencimiento
+        self.env.cr.execute("""
+            CREATE INDEX IF NOT EXISTS zoom_scheduled_job_pending_due_idx
+                ON zoom_scheduled_job (due_at) WHERE state = 'pending'
+        """)
+
+    @api.model
+    def _get_meeting_jobs(self, meeting, offsets):
+        """Trabajos que debe tener la reunión: ``{(tipo, antelación): vencimiento}``"""
+        jobs = {}
+        if not meeting.start_time:
+            return jobs
+        now = fields.Datetime.now()
+        if meeting.status == 'scheduled' and meeting.start_time > now:
+            for offset in offsets:
+                jobs[('reminder', offset)] = meeting.start_time - timedelta(minutes=offset)
+        finish_at = meeting.start_time + timedelta(minutes=(meeting.duration or 0) + STATUS_GRACE_MINUTES)
+        if meeting.status == 'active' or (meeting.status == 'scheduled' and finish_at > now):
+            jobs[('finish', 0)] = finish_at
+        report_at = finish_at + timedelta(minutes=PARTICIPANT_REPORT_DELAY_MINUTES)
+        if meeting.meeting_id and meeting.status != 'cancelled' \
+                and report_at > now - timedelta(days=PARTICIPANT_REPORT_MAX_AGE_DAYS):
+            jobs[('participants', 0)] = report_at
+            jobs[('recordings', 0)] = report_at
+        return jobs
+
+    @api.model
+    def _schedule_meetings(self, meetings):
+        """Crear, reprogramar o anular los trabajos de las reuniones
+
+        Un trabajo ejecutado cuyo vencimiento no cambia se deja como está, así
+        que llamarlo de nuevo no repite nada.
+        """
+        if not meetings:
+            return
+        offsets = self.env['zoom.config']._get_reminder_offsets()
+        wanted = {
+            (meeting.id, job_type, offset): due_at
+            for meeting in meetings
+            for (job_type, offset), due_at in self._get_meeting_jobs(meeting, offsets).items()
+        }
+        to_cancel = self.browse()
+        for job in self.search([('meeting_id', 'in', meetings.ids)]):
+            due_at = wanted.pop((job.meeting_id.id, job.job_type, job.offset_minutes), None)
+            if due_at is None:
+                if job.state == 'pending':
+                    to_cancel |= job
+            elif job.due_at != due_at or job.state == 'cancelled':
+                job.write({'due_at': due_at, 'state': 'pending', 'done_at': False, 'attempts': 0})
+        to_cancel.write({'state': 'cancelled'})
+        self.create([{
+            'meeting_id': meeting_id,
+            'job_type': job_type,
+            'offset_minutes': offset,
+            'due_at': due_at,
+        } for (meeting_id, job_type, offset), due_at in wanted.items()])
+
+    @api.model
+    def _requeue_reminders(self, meetings):
+        """Volver a lanzar los recordatorios ya vencidos (p. ej. un nuevo confirmado)"""
+        self.search([
+            ('meeting_id', 'in', meetings.ids),
+            ('meeting_id.start_time', '>', fields.Datetime.now()),
+            ('job_type', '=', 'reminder'),
+            ('state', '=', 'done'),
+        ]).write({'state': 'pending', 'done_at': False})
+
+    @api.model
+    def _claim_due(self, size):
+        """Bloquear los siguientes trabajos vencidos sin esperar a otros procesos"""
+        self.flush_model()
+        self.env.cr.execute("""
+            SELECT id FROM zoom_scheduled_job
+             WHERE state = 'pending' AND due_at <= %s
+             ORDER BY due_at, id
+             LIMIT %s
+               FOR UPDATE SKIP LOCKED
+        """, [fields.Datetime.now(), size])
+        return self.browse([row[0] for row in self.env.cr.fetchall()])
+
+    def _execute(self):
+        """Ejecutar los trabajos agrupados por tipo"""
+        reminders = self.filtered(lambda j: j.job_type == 'reminder')
+        if reminders:
+            self.env['zoom.reminder']._send_due(meetings=reminders.meeting_id)
+        finished = self.filtered(lambda j: j.job_type == 'finish').meeting_id.filtered(
+            lambda m: m.status == 'active'
+        )
+        if finished:
+            finished.write({'status': 'finished'})
+            _logger.info('Reuniones finalizadas por horario: %s', len(finished))
+        reports = self.filtered(lambda j: j.job_type == 'participants')
+        retry = self.browse()
+        if reports:
+            unavailable = reports.meeting_id._sync_participants()
+            retry = reports.filtered(lambda j: j.meeting_id in unavailable)
+            retry.write({'due_at': fields.Datetime.now() + timedelta(minutes=PARTICIPANT_REPORT_RETRY_MINUTES)})
+        retry |= self.filtered(lambda j: j.job_type == 'recordings')._fetch_recordings()
+        (self - retry).write({'state': 'done', 'done_at': fields.Datetime.now()})
+
+    def _fetch_recordings(self):
+        """Buscar la grabación de cada reunión con espera creciente
+
+        Devuelve los trabajos reprogramados (grabación aún no disponible o
+        Zoom caído); el resto se da por terminado.
+        """
+        config = self.env['zoom.config'].get_active_config()
+        Recording = self.env['zoom.recording']
+        retry = self.browse()
+        for job in self:
+            meeting = job.meeting_id
+            if meeting.recording_ids or not meeting.meeting_id:
+                continue
+            try:
+                if Recording._fetch(config, meeting.meeting_id):
+                    continue
+            except (ZoomUnavailable, requests.exceptions.RequestException):
+                job.due_at = fields.Datetime.now() + timedelta(minutes=PARTICIPANT_REPORT_RETRY_MINUTES)
+                retry |= job
+                continue
+            except UserError as e:
+                _logger.warning('Grabación no disponible para %s: %s', meeting.name, e)
+                continue
+            if job.attempts < len(RECORDING_RETRY_MINUTES):
+                job.write({
+                    'due_at': fields.Datetime.now() + timedelta(minutes=RECORDING_RETRY_MINUTES[job.attempts]),
+                    'attempts': job.attempts + 1,
+                })
+                retry |= job
+        return retry
+
+    @api.model
+    @profiled
+    def _run_due_jobs(self):
+        """Ejecutar un lote de trabajos vencidos (llamado por cron cada minuto)"""
+        batch_size = self.env['zoom.config']._get_cron_batch_size()
+        jobs = self._claim_due(batch_size)
+        jobs._execute()
+        remaining = self.search_count([
+            ('state', '=', 'pending'),
+            ('due_at', '<=', fields.Datetime.now()),
+        ]) if len(jobs) == batch_size else 0
+        self.env['ir.cron']._notify_progress(done=len(jobs), remaining=remaining)
+        return len(jobs)
+
+    @api.model
+    def _reschedule_all(self):
+        """Reprogramar las reuniones futuras (tras cambiar las antelaciones)"""
+        meetings = self.env['zoom.meeting'].search([
+            '|', ('status', '=', 'active'),
+            '&', ('status', '=', 'scheduled'), ('start_time', '>', fields.Datetime.now()),
+        ])
+        self._schedule_meetings(meetings)
+
+    @api.autovacuum
+    def _gc_scheduled_jobs(self):
+        """Eliminar trabajos ejecutados o anulados antiguos"""
+        limit_date = fields.Datetime.now() - timedelta(days=SCHEDULED_JOB_RETENTION_DAYS)
+        self.search([
+            ('state', '!=', 'pending'),
+            ('due_at', '<', limit_date),
+        ]).unlink()
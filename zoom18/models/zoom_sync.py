@@ -0,0 +1,527 @@
+# -*- coding: utf-8 -*-
+
+from odoo import models, fields, api, _
+from odoo.exceptions import UserError
+import contextvars
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+import requests
+
+from .zoom_client import ZoomUnavailable
+from .zoom_config import iter_zoom_pages
+from .zoom_logging import correlation, get_logger
+
+_logger = get_logger(__name__)
+
+# Espacio de claves del bloqueo consultivo de sincronización ('ZOOM')
+ZOOM_SYNC_LOCK_KEY = 0x5A4F4F4D
+
+# Estados de Zoom -> estados de zoom.meeting
+ZOOM_STATUS_MAP = {
+    'waiting': 'scheduled',
+    'started': 'active',
+    'finished': 'finished',
+    'ended': 'finished',
+    'cancelled': 'cancelled',
+    'deleted': 'cancelled',
+}
+
+# Campos que el pipeline compara para decidir si una reunión cambió
+SYNC_FIELDS = ['name', 'start_time', 'duration', 'join_url', 'start_url', 'status', 'host_id']
+
+# Campos cuyo cambio debe propagarse al evento de calendario
+CALENDAR_FIELDS = {'name', 'start_time', 'duration', 'join_url'}
+
+# Nombre de la etapa en la telemetría (zoom.sync.span) cuando no coincide con el del pipeline
+SYNC_STAGE_SPANS = {'apply': 'write', 'side_effects': 'calendar'}
+
+
+def parse_zoom_datetime(value):
+    """Convertir una fecha ISO 8601 de Zoom a datetime UTC sin zona horaria (formato Odoo)"""
+    if not value:
+        return False
+    try:
+        parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except (TypeError, ValueError):
+        _logger.warning('Fecha de Zoom no válida: %s', value)
+        return False
+    if parsed.tzinfo:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def iter_timed(iterable):
+    """Generar ``(elemento, segundos que tardó en obtenerse)``
+
+    Mide lo que cuesta cada paso de un generador perezoso (p. ej. la descarga
+    de cada página) sin contar el trabajo que hace el llamador entre pasos.
+    """
+    iterator = iter(iterable)
+    while True:
+        start = time.perf_counter()
+        try:
+            item = next(iterator)
+        except StopIteration:
+            return
+        yield item, time.perf_counter() - start
+
+
+def fetch_host_meetings(base_url, headers, zoom_user_id, breaker=None, metrics=None):
+    """Descargar todas las páginas de reuniones de un anfitrión (se ejecuta en un hilo)"""
+    with requests.Session() as session:
+        return [
+            meetings for meetings, _next_token in iter_zoom_pages(
+                base_url, headers, f'/users/{zoom_user_id}/meetings', 'meetings',
+                session=session, breaker=breaker, metrics=metrics)
+        ]
+
+
+class ZoomSyncPipeline(models.AbstractModel):
+    _name = 'zoom.sync.pipeline'
+    _description = 'Pipeline de Sincronización Zoom'
+
+    # === ORQUESTACIÓN ===
+    @api.model
+    def _get_sync_stages(self):
+        """Etapas aplicadas a cada página descargada, en orden
+
+        Cada etapa es un método ``_sync_stage_<nombre>(state)``; para añadir o
+        sustituir etapas basta con heredar el modelo y extender esta lista.
+        """
+        return ['normalize', 'diff', 'apply', 'side_effects']
+
+    @api.model
+    def _new_sync_stats(self):
+        return {
+            'fetched': 0,
+            'skipped': 0,
+            'created': 0,
+            'updated': 0,
+            'unchanged': 0,
+            'calendar_events': 0,
+        }
+
+    @api.model
+    def run_sync(self, config, trigger='manual', partition=0, auto_commit=False, limit=None):
+        """Ejecutar el pipeline completo de sincronización para una configuración
+
+        fetch (por páginas) -> normalize -> diff -> apply -> side_effects
+        Todos los puntos de entrada (cron, botones, dashboard y post-configuración)
+        usan este método. Cada ejecución queda registrada en ``zoom.sync.run``
+        y está protegida por un bloqueo consultivo de PostgreSQL, de modo que
+        nunca se solapan dos sincronizaciones de la misma configuración.
+        Sus líneas de log y las de sus llamadas a Zoom llevan el id de
+        correlación que se guarda en la ejecución (``correlation_id``).
+        Con ``limit`` la ejecución se detiene tras el primer checkpoint que
+        alcance ese número de reuniones (o anfitriones, con alcance de cuenta)
+        y queda abierta para que la siguiente llamada continúe el lote.
+        Devuelve un diccionario con los contadores, además de ``processed``
+        (elementos de esta llamada) y ``remaining`` (trabajo pendiente), o
+        ``None`` si el cron encontró otra ejecución en curso.
+        """
+        config.ensure_one()
+        with correlation('sync'), self._sync_lock(config, partition) as acquired:
+            if not acquired:
+                if trigger == 'cron':
+                    _logger.info('Sincronización Zoom omitida: ya hay otra ejecución en curso')
+                    return None
+                raise UserError(_('Ya hay una sincronización de Zoom en curso. Inténtelo de nuevo en unos minutos.'))
+            try:
+                return self._run_sync_locked(config, trigger, partition, auto_commit, limit)
+            finally:
+                self.env['zoom.api.metric']._flush_buffer(force=True)
+
+    @contextmanager
+    def _sync_lock(self, config, partition=0):
+        """Bloqueo consultivo de sesión por configuración y partición
+
+        Se toma en un cursor dedicado: se libera aunque la transacción principal
+        falle, y PostgreSQL lo suelta solo si el proceso muere.
+        """
+        lock_key = (ZOOM_SYNC_LOCK_KEY + partition, config.id)
+        with self.env.registry.cursor() as lock_cr:
+            lock_cr.execute('SELECT pg_try_advisory_lock(%s, %s)', lock_key)
+            acquired = lock_cr.fetchone()[0]
+            try:
+                yield acquired
+            finally:
+                if acquired:
+                    lock_cr.execute('SELECT pg_advisory_unlock(%s, %s)', lock_key)
+
+    @api.model
+    def _run_sync_locked(self, config, trigger, partition, auto_commit, limit=None):
+        # Ejecuciones y tiempos son de solo lectura para los usuarios: el pipeline los registra
+        run = self.env['zoom.sync.run'].sudo()._start(config, trigger, partition)
+        progress = {
+            'run': run,
+            'auto_commit': auto_commit,
+            'clock': time.monotonic(),
+            'base_duration': run.duration,
+            'spans': [],
+        }
+        stats = run._get_stats()
+        fetched_before = stats['fetched']
+        remaining = 0
+        if auto_commit:
+            self._sync_commit()
+        _logger.info('Sincronización Zoom iniciada (%s, ejecución %s)', trigger, run.id)
+
+        try:
+            if config.sync_scope == 'account':
+                processed, remaining = self._run_account_sync(
+                    config, trigger, stats, progress, partition=partition, limit=limit)
+            else:
+                pages = iter_timed(self._sync_fetch_pages(config, page_token=run.page_token))
+                for (page, next_token), fetch_time in pages:
+                    state = self._sync_process_page(config, trigger, page, stats)
+                    self._sync_record_spans(progress, dict(state['spans'], fetch=fetch_time), len(page))
+                    self._sync_checkpoint(progress, stats, page_token=next_token)
+                    if limit and next_token and stats['fetched'] - fetched_before >= limit:
+                        # Lote completo: la ejecución sigue abierta con su cursor
+                        remaining = 1
+                        break
+                processed = stats['fetched'] - fetched_before
+        except Exception as e:
+            if auto_commit:
+                # Conservar lo ya confirmado y dejar constancia del fallo
+                self.env.cr.rollback()
+                run._fail(stats, self._sync_elapsed(progress), e, spans=progress['spans'])
+                self._sync_commit()
+            raise
+
+        if remaining:
+            return dict(stats, processed=processed, remaining=remaining)
+        run._finish(stats, self._sync_elapsed(progress), spans=progress['spans'])
+        if auto_commit:
+            self._sync_commit()
+        _logger.info(
+            'Sincronización Zoom finalizada (%s, ejecución %s): %d recibidas, %d creadas, %d actualizadas, '
+            '%d sin cambios en %.2f s',
+            trigger, run.id, stats['fetched'], stats['created'], stats['updated'], stats['unchanged'], run.duration,
+        )
+        return dict(stats, processed=processed, remaining=0)
+
+    @api.model
+    def _sync_process_page(self, config, trigger, page, stats, host=None):
+        """Aplicar todas las etapas del pipeline a una página de reuniones
+
+        Los segundos de cada etapa quedan en ``state['spans']``.
+        """
+        state = {
+            'config': config,
+            'trigger': trigger,
+            'host': host,
+            'raw': page,
+            'stats': stats,
+            'spans': {},
+        }
+        stats['fetched'] += len(page)
+        for stage in self._get_sync_stages():
+            start = time.perf_counter()
+            getattr(self, f'_sync_stage_{stage}')(state)
+            span = SYNC_STAGE_SPANS.get(stage, stage)
+            state['spans'][span] = state['spans'].get(span, 0.0) + time.perf_counter() - start
+        return state
+
+    @api.model
+    def _sync_record_spans(self, progress, spans, item_count, host=None):
+        """Anotar los tiempos de la página en curso; se guardan en el siguiente checkpoint"""
+        page = progress['run'].pages_done
+        progress['spans'].extend({
+            'page': page,
+            'stage': stage,
+            'duration': duration,
+            'item_count': item_count,
+            'host_id': host.id if host else False,
+        } for stage, duration in spans.items())
+
+    @api.model
+    def _sync_elapsed(self, progress):
+        return progress['base_duration'] + time.monotonic() - progress['clock']
+
+    @api.model
+    def _sync_checkpoint(self, progress, stats, page_token=None):
+        """Guardar el cursor de la ejecución y confirmar la página procesada"""
+        spans, progress['spans'] = progress['spans'], []
+        progress['run']._checkpoint(stats, self._sync_elapsed(progress), page_token=page_token, spans=spans)
+        if progress['auto_commit']:
+            start = time.perf_counter()
+            self._sync_commit()
+            # El commit de esta página se guarda con la siguiente (o al terminar)
+            progress['spans'].append({
+                'page': progress['run'].pages_done - 1,
+                'stage': 'commit',
+                'duration': time.perf_counter() - start,
+                'item_count': 0,
+            })
+
+    @api.model
+    def _sync_commit(self):
+        """Confirmar el progreso (checkpoint) fuera de los tests"""
+        if not self.env.registry.in_test_mode():
+            self.env.cr.commit()
+
+    # === FETCH ===
+    @api.model
+    def _sync_fetch_pages(self, config, page_token=None):
+        """Descargar las reuniones de Zoom página a página
+
+        Genera ``(reuniones, next_page_token)``. Si el token guardado de una
+        ejecución interrumpida ya caducó (Zoom los invalida a los 15 minutos),
+        se vuelve a empezar desde la primera página.
+        """
+        pages = config._zoom_get_pages('/users/me/meetings', 'meetings', page_token=page_token)
+        if page_token:
+            try:
+                first = next(pages)
+            except StopIteration:
+                return
+            except UserError:
+                _logger.info('Token de página caducado, reiniciando la sincronización desde el principio')
+                pages = config._zoom_get_pages('/users/me/meetings', 'meetings')
+            else:
+                yield first
+        yield from pages
+
+    # === SINCRONIZACIÓN DE TODA LA CUENTA ===
+    @api.model
+    def _sync_refresh_hosts(self, config):
+        """Actualizar la lista de anfitriones recorriendo /users"""
+        # Los anfitriones son de solo lectura para los usuarios: el pipeline los mantiene
+        Host = self.env['zoom.host'].sudo()
+        seen = Host.browse()
+        for users, _next_token in config._zoom_get_pages('/users', 'users', params={'status': 'active'}):
+            seen |= Host._upsert_from_zoom(config, users)
+        # Los usuarios que ya no aparecen en Zoom dejan de sincronizarse
+        (config.sudo().host_ids - seen).filtered('active').write({'active': False})
+        return seen
+
+    @api.model
+    def _sync_pending_hosts(self, config):
+        return self.env['zoom.host'].sudo().search([
+            ('config_id', '=', config.id),
+            ('last_sync_cycle', '<', config.sync_cycle),
+        ])
+
+    @api.model
+    def _run_account_sync(self, config, trigger, stats, progress, partition=0, limit=None):
+        """Sincronizar las reuniones de todos los anfitriones de la cuenta
+
+        Cada anfitrión completado queda marcado con el ciclo actual; si el cron
+        se interrumpe, la siguiente ejecución continúa con los pendientes en
+        lugar de empezar de cero. Las descargas HTTP se hacen en paralelo
+        (``sync_max_workers``) y la escritura ORM en el hilo principal.
+        Devuelve ``(anfitriones procesados, anfitriones pendientes)``.
+        """
+        hosts = self._sync_pending_hosts(config)
+        if not hosts:
+            # Todos los anfitriones están al día: empezar un nuevo ciclo
+            self.env.cr.execute(
+                'UPDATE zoom_config SET sync_cycle = sync_cycle + 1 WHERE id = %s', [config.id])
+            config.invalidate_recordset(['sync_cycle'])
+            self._sync_refresh_hosts(config)
+            self._sync_checkpoint(progress, stats)
+            hosts = self._sync_pending_hosts(config)
+        hosts = hosts._in_partition(partition, config.sync_partitions)
+        remaining = 0
+        if limit and len(hosts) > limit:
+            remaining = len(hosts) - limit
+            hosts = hosts[:limit]
+        if not hosts:
+            return 0, 0
+
+        cycle = config.sync_cycle
+        base_url = config.base_url
+        headers = config._get_api_headers()
+        breaker = config._get_circuit_breaker()
+        metrics = config._get_api_metrics()
+        max_workers = max(1, config.sync_max_workers or 1)
+        pending = iter(hosts)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {}
+
+            def timed_fetch(zoom_user_id):
+                start = time.perf_counter()
+                pages = fetch_host_meetings(base_url, headers, zoom_user_id, breaker=breaker, metrics=metrics)
+                return pages, time.perf_counter() - start
+
+            def submit_next():
+                host = next(pending, None)
+                if host:
+                    futures[executor.submit(contextvars.copy_context().run, timed_fetch, host.zoom_user_id)] = host
+
+            # Ventana acotada: nunca más de 2x workers descargas en memoria
+            for _i in range(max_workers * 2):
+                submit_next()
+
+            while futures:
+                done, _not_done = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    host = futures.pop(future)
+                    submit_next()
+                    host_vals = {'last_sync_cycle': cycle, 'last_sync': fields.Datetime.now(), 'sync_error': False}
+                    stats_before = dict(stats)
+                    try:
+                        pages, fetch_time = future.result()
+                        spans = {'fetch': fetch_time}
+                        # Un error de base de datos en un anfitrión solo deshace sus páginas
+                        with self.env.cr.savepoint():
+                            for page in pages:
+                                state = self._sync_process_page(config, trigger, page, stats, host=host)
+                                for stage, duration in state['spans'].items():
+                                    spans[stage] = spans.get(stage, 0.0) + duration
+                        self._sync_record_spans(progress, spans, sum(len(page) for page in pages), host=host)
+                    except ZoomUnavailable:
+                        # Zoom caído: el anfitrión sigue pendiente para el próximo ciclo
+                        raise
+                    except Exception as e:
+                        _logger.warning('Error sincronizando anfitrión %s: %s', host.email, e)
+                        host_vals['sync_error'] = str(e)
+                        stats.update(stats_before)
+                    host.write(host_vals)
+                    self._sync_checkpoint(progress, stats)
+        return len(hosts), remaining
+
+    # === NORMALIZE ===
+    @api.model
+    def _normalize_zoom_meeting(self, data):
+        """Traducir un objeto reunión de la API de Zoom a valores de zoom.meeting
+
+        Solo se incluyen las claves que Zoom informa, para no sobrescribir datos
+        locales con valores vacíos.
+        """
+        if not data.get('id'):
+            return None
+        vals = {
+            'meeting_id': str(data['id']),
+            'name': data.get('topic') or _('Reunión Zoom'),
+            'zoom_created': True,
+        }
+        start_time = parse_zoom_datetime(data.get('start_time'))
+        if start_time:
+            vals['start_time'] = start_time
+        if data.get('duration') is not None:
+            vals['duration'] = int(data['duration'])
+        for key in ('join_url', 'start_url'):
+            if data.get(key):
+                vals[key] = data[key]
+        status = ZOOM_STATUS_MAP.get(data.get('status'))
+        if status:
+            vals['status'] = status
+        return vals
+
+    @api.model
+    def _sync_stage_normalize(self, state):
+        normalized = {}
+        host = state.get('host')
+        for data in state['raw']:
+            vals = self._normalize_zoom_meeting(data)
+            if not vals:
+                state['stats']['skipped'] += 1
+                continue
+            if host:
+                vals['host_id'] = host.id
+            # Zoom puede repetir la misma reunión (recurrentes): gana la última
+            normalized[vals['meeting_id']] = vals
+        state['normalized'] = normalized
+
+    # === DIFF ===
+    @api.model
+    def _sync_changed_values(self, meeting, vals):
+        """Devolver solo los valores que difieren del registro existente"""
+        changes = {}
+        for field_name in SYNC_FIELDS:
+            if field_name not in vals:
+                continue
+            current = meeting[field_name]
+            new = vals[field_name]
+            if meeting._fields[field_name].type == 'many2one':
+                current = current.id
+            elif meeting._fields[field_name].type == 'datetime':
+                current = current and current.replace(microsecond=0)
+                new = new and fields.Datetime.to_datetime(new).replace(microsecond=0)
+            if (current or False) != (new or False):
+                changes[field_name] = vals[field_name]
+        return changes
+
+    @api.model
+    def _sync_stage_diff(self, state):
+        normalized = state['normalized']
+        existing = self.env['zoom.meeting'].search([('meeting_id', 'in', list(normalized))])
+        existing_by_id = {meeting.meeting_id: meeting for meeting in existing}
+
+        to_create = []
+        to_update = []
+        unchanged = self.env['zoom.meeting']
+        for zoom_id, vals in normalized.items():
+            meeting = existing_by_id.get(zoom_id)
+            if not meeting:
+                vals.setdefault('start_time', fields.Datetime.now())
+                vals.setdefault('status', 'scheduled')
+                to_create.append(vals)
+                continue
+            changes = self._sync_changed_values(meeting, vals)
+            if changes:
+                to_update.append((meeting, changes))
+            else:
+                unchanged |= meeting
+
+        state.update({
+            'existing': existing,
+            'to_create': to_create,
+            'to_update': to_update,
+        })
+        state['stats']['unchanged'] += len(unchanged)
+
+    # === APPLY ===
+    @api.model
+    def _sync_stage_apply(self, state):
+        Meeting = self.env['zoom.meeting'].with_context(zoom_skip_calendar_sync=True)
+        now = fields.Datetime.now()
+
+        created = Meeting.browse()
+        if state['to_create']:
+            for vals in state['to_create']:
+                vals['last_sync'] = now
+            created = Meeting.create(state['to_create'])
+
+        # Agrupar escrituras con los mismos valores en un único UPDATE
+        groups = defaultdict(lambda: Meeting.browse())
+        for meeting, changes in state['to_update']:
+            groups[tuple(sorted(changes.items()))] |= meeting
+        updated = Meeting.browse()
+        calendar_dirty = Meeting.browse()
+        for key, meetings in groups.items():
+            meetings.write(dict(key))
+            updated |= meetings
+            if CALENDAR_FIELDS.intersection(dict(key)):
+                calendar_dirty |= meetings
+
+        # Marcar la fecha de sincronización de todo lo recibido en una sola escritura
+        touched = (state['existing'] | updated).with_context(zoom_skip_calendar_sync=True)
+        if touched:
+            touched.write({'last_sync': now})
+
+        state.update({
+            'created': created,
+            'updated': updated,
+            'calendar_dirty': calendar_dirty,
+        })
+        state['stats']['created'] += len(created)
+        state['stats']['updated'] += len(updated)
+
+    # === SIDE EFFECTS ===
+    @api.model
+    def _sync_stage_side_effects(self, state):
+        """Crear/actualizar eventos de calendario de lo que cambió en esta página"""
+        to_create = (state['created'] | state['calendar_dirty']).filtered(lambda m: not m.calendar_event_id)
+        to_update = state['calendar_dirty'].filtered('calendar_event_id')
+        if to_create:
+            to_create._create_calendar_event()
+        to_update._update_calendar_event()
+        state['stats']['calendar_events'] += len(to_create) + len(to_update)
@@ -0,0 +1,363 @@
+# -*- coding: utf-8 -*-
+
+from odoo import models, fields, api, _
+from odoo.tools import html_escape
+from datetime import timedelta
+
+from .zoom_logging import get_correlation_id, get_logger
+
+_logger = get_logger(__name__)
+
+# Días que se conservan las ejecuciones finalizadas
+SYNC_RUN_RETENTION_DAYS = 30
+
+# Etapas medidas en cada página, en el orden en que se ejecutan
+SYNC_SPAN_STAGES = ('fetch', 'normalize', 'diff', 'write', 'calendar', 'commit')
+
+# Color de cada etapa en la línea de tiempo del dashboard
+SYNC_STAGE_COLORS = {
+    'fetch': '#17a2b8',
+    'normalize': '#6f42c1',
+    'diff': '#fd7e14',
+    'write': '#28a745',
+    'calendar': '#007bff',
+    'commit': '#6c757d',
+}
+SYNC_STAGE_DEFAULT_COLOR = '#adb5bd'
+
+
+class ZoomSyncRun(models.Model):
+    _name = 'zoom.sync.run'
+    _description = 'Ejecución de Sincronización Zoom'
+    _order = 'started_at desc, id desc'
+    _rec_name = 'started_at'
+
+    config_id = fields.Many2one(
+        'zoom.config',
+        string='Configuración',
+        required=True,
+        ondelete='cascade',
+        index=True
+    )
+
+    trigger = fields.Selection([
+        ('cron', 'Cron'),
+        ('manual', 'Manual'),
+        ('config', 'Tras Configuración'),
+        ('test', 'Test'),
+    ], string='Origen', default='manual', required=True)
+
+    partition = fields.Integer(
+        string='Partición',
+        default=0,
+        help='Partición de anfitriones procesada por esta ejecución'
+    )
+
+    state = fields.Selection([
+        ('running', 'En Ejecución'),
+        ('done', 'Completada'),
+        ('failed', 'Fallida'),
+    ], string='Estado', default='running', required=True, index=True)
+
+    # === CURSOR / CHECKPOINT ===
+    page_token = fields.Char(
+        string='Token de Página',
+        help='next_page_token de la última página confirmada; se usa para reanudar'
+    )
+
+    pages_done = fields.Integer(
+        string='Páginas Procesadas',
+        default=0
+    )
+
+    resume_count = fields.Integer(
+        string='Reanudaciones',
+        default=0,
+        help='Veces que esta ejecución continuó en otra llamada (siguiente lote del cron o tras una interrupción)'
+    )
+
+    # === CONTADORES ===
+    fetched_count = fields.Integer(string='Recibidas', default=0)
+    created_count = fields.Integer(string='Creadas', default=0)
+    updated_count = fields.Integer(string='Actualizadas', default=0)
+    unchanged_count = fields.Integer(string='Sin Cambios', default=0)
+    skipped_count = fields.Integer(string='Descartadas', default=0)
+    calendar_count = fields.Integer(string='Eventos de Calendario', default=0)
+
+    # === TIEMPOS ===
+    started_at = fields.Datetime(
+        string='Inicio',
+        default=fields.Datetime.now,
+        required=True
+    )
+
+    finished_at = fields.Datetime(
+        string='Fin'
+    )
+
+    duration = fields.Float(
+        string='Duración (s)',
+        digits=(16, 3),
+        help='Tiempo de ejecución acumulado en segundos'
+    )
+
+    error = fields.Text(
+        string='Error'
+    )
+
+    correlation_id = fields.Char(
+        string='Id de Correlación',
+        readonly=True,
+        index=True,
+        help='Prefijo de las líneas de log de la ejecución y de sus llamadas a Zoom, p. ej. [sync-1a2b3c4d]'
+    )
+
+    # === TELEMETRÍA ===
+    span_ids = fields.One2many(
+        'zoom.sync.span',
+        'run_id',
+        string='Tiempos por Página'
+    )
+
+    is_slow = fields.Boolean(
+        string='Lenta',
+        default=False,
+        readonly=True,
+        help='La ejecución superó el umbral de alerta de la configuración'
+    )
+
+    stage_summary = fields.Char(
+        string='Tiempo por Etapa',
+        compute='_compute_stage_summary',
+        help='Segundos acumulados de cada etapa en todas las páginas'
+    )
+
+    @api.depends('span_ids.duration')
+    def _compute_stage_summary(self):
+        times_by_run = self._get_stage_times()
+        for run in self:
+            times = times_by_run.get(run.id, {})
+            run.stage_summary = ' · '.join(
+                f'{stage} {times[stage]:.2f} s' for stage in self._sort_stages(times)
+            )
+
+    @api.model
+    def _sort_stages(self, stages):
+        """Etapas conocidas en orden de ejecución y después las añadidas por herencia"""
+        known = [stage for stage in SYNC_SPAN_STAGES if stage in stages]
+        return known + sorted(set(stages) - set(SYNC_SPAN_STAGES))
+
+    def _get_stage_times(self):
+        """``{run_id: {etapa: segundos}}`` con una sola consulta agrupada"""
+        times = {run.id: {} for run in self}
+        if not self.ids:
+            return times
+        for run, stage, duration in self.env['zoom.sync.span']._read_group(
+                [('run_id', 'in', self.ids)], groupby=['run_id', 'stage'], aggregates=['duration:sum']):
+            times[run.id][stage] = duration or 0.0
+        return times
+
+    @api.model
+    def _start(self, config, trigger, partition=0):
+        """Crear la ejecución o reanudar la que quedó interrumpida
+
+        Solo se llama con el bloqueo de sincronización tomado, así que una
+        ejecución en estado ``running`` quedó a medias: un lote anterior del
+        cron o un proceso que murió.
+        """
+        interrupted = self.search([
+            ('config_id', '=', config.id),
+            ('partition', '=', partition),
+            ('state', '=', 'running'),
+        ], limit=1)
+        if interrupted:
+            interrupted.write({
+                'resume_count': interrupted.resume_count + 1,
+                'correlation_id': get_correlation_id() or interrupted.correlation_id,
+            })
+            _logger.info('Reanudando sincronización %s desde la página %s', interrupted.id, interrupted.pages_done)
+            run = interrupted
+        else:
+            run = self.create({
+                'config_id': config.id,
+                'trigger': trigger,
+                'partition': partition,
+                'correlation_id': get_correlation_id(),
+            })
+        return run
+
+    def _get_stats(self):
+        """Contadores de la ejecución en el formato del pipeline"""
+        self.ensure_one()
+        return {
+            'fetched': self.fetched_count,
+            'created': self.created_count,
+            'updated': self.updated_count,
+            'unchanged': self.unchanged_count,
+            'skipped': self.skipped_count,
+            'calendar_events': self.calendar_count,
+        }
+
+    def _checkpoint(self, stats, duration, page_token=None, page_done=True, spans=None):
+        """Guardar contadores, cursor y tiempo acumulado tras confirmar una página
+
+        ``spans`` son los tiempos medidos desde el checkpoint anterior
+        (diccionarios con ``page``, ``stage``, ``duration``, ``item_count`` y
+        opcionalmente ``host_id``); se guardan con una sola creación.
+        """
+        self.ensure_one()
+        if spans:
+            self.env['zoom.sync.span'].create([dict(span, run_id=self.id) for span in spans])
+        self.write({
+            'page_token': page_token or False,
+            'pages_done': self.pages_done + (1 if page_done else 0),
+            'fetched_count': stats['fetched'],
+            'created_count': stats['created'],
+            'updated_count': stats['updated'],
+            'unchanged_count': stats['unchanged'],
+            'skipped_count': stats['skipped'],
+            'calendar_count': stats['calendar_events'],
+            'duration': duration,
+        })
+
+    def _finish(self, stats, duration, spans=None):
+        self.ensure_one()
+        self._checkpoint(stats, duration, page_done=False, spans=spans)
+        self.write({
+            'state': 'done',
+            'finished_at': fields.Datetime.now(),
+            'error': False,
+        })
+        self._check_slow()
+        self.env['zoom.dashboard']._invalidate_cache()
+
+    def _fail(self, stats, duration, error, spans=None):
+        self.ensure_one()
+        self._checkpoint(stats, duration, page_token=self.page_token, page_done=False, spans=spans)
+        self.write({
+            'state': 'failed',
+            'finished_at': fields.Datetime.now(),
+            'error': str(error),
+        })
+        self._check_slow()
+        self.env['zoom.dashboard']._invalidate_cache()
+
+    def _check_slow(self):
+        """Marcar y avisar si la ejecución superó ``sync_slow_threshold``
+
+        El aviso va al log con la etapa más lenta y, si la configuración tiene
+        ``sync_alert_email``, por correo (en la cola de correo).
+        """
+        self.ensure_one()
+        threshold = self.config_id.sync_slow_threshold
+        if not threshold or self.duration <= threshold:
+            return
+        self.is_slow = True
+        times = self._get_stage_times()[self.id]
+        slowest = max(times, key=times.get) if times else None
+        _logger.warning(
+            'Sincronización Zoom lenta: ejecución %s tardó %.1f s (umbral %s s); etapa más lenta: %s (%s)',
+            self.id, self.duration, threshold, slowest or 'sin datos', self.stage_summary or '-',
+        )
+        if self.config_id.sync_alert_email:
+            template = self.env.ref('zoom18.email_template_sync_slow_run', False)
+            if template:
+                template.send_mail(self.id)
+
+    def _render_timeline(self):
+        """HTML con una barra por ejecución, apilando el tiempo de cada etapa
+
+        Las barras se escalan a la ejecución más larga del conjunto; las lentas
+        se marcan en rojo.
+        """
+        if not self:
+            return '<p class="text-muted">%s</p>' % html_escape(_('Aún no hay ejecuciones de sincronización'))
+        times_by_run = self._get_stage_times()
+        longest = max(max(self.mapped('duration')), 0.001)
+        stages = self._sort_stages({stage for times in times_by_run.values() for stage in times})
+        rows = []
+        for run in self:
+            times = times_by_run[run.id]
+            segments = ''.join(
+                '<div title="%s" style="width: %.2f%%; background-color: %s;"></div>' % (
+                    html_escape(f'{stage}: {times[stage]:.2f} s'),
+                    min(times[stage] * 100 / longest, 100),
+                    SYNC_STAGE_COLORS.get(stage, SYNC_STAGE_DEFAULT_COLOR),
+                )
+                for stage in self._sort_stages(times)
+            )
+            label = '%s · %s · %.1f s' % (
+                fields.Datetime.context_timestamp(self, run.started_at).strftime('%d/%m %H:%M'),
+                dict(self._fields['trigger'].selection).get(run.trigger, run.trigger),
+                run.duration,
+            )
+            rows.append(
+                '<div style="margin-bottom: 6px;">'
+                '<div style="font-size: 12px;%s">%s%s</div>'
+                '<div style="display: flex; height: 14px; background-color: #f1f3f5;">%s</div>'
+                '</div>' % (
+                    ' color: #dc3545; font-weight: bold;' if run.is_slow else '',
+                    html_escape(label),
+                    html_escape(_(' · lenta')) if run.is_slow else '',
+                    segments,
+                )
+            )
+        legend = ' '.join(
+            '<span style="margin-right: 12px;"><span style="display: inline-block; width: 10px; height: 10px; '
+            'background-color: %s;"></span> %s</span>' % (
+                SYNC_STAGE_COLORS.get(stage, SYNC_STAGE_DEFAULT_COLOR), html_escape(stage))
+            for stage in stages
+        )
+        return '<div class="o_zoom_sync_timeline">%s<div style="font-size: 12px;">%s</div></div>' % (
+            ''.join(rows), legend)
+
+    @api.autovacuum
+    def _gc_sync_runs(self):
+        """Eliminar ejecuciones finalizadas antiguas"""
+        limit_date = fields.Datetime.now() - timedelta(days=SYNC_RUN_RETENTION_DAYS)
+        self.search([
+            ('state', '!=', 'running'),
+            ('started_at', '<', limit_date),
+        ]).unlink()
+
+
+class ZoomSyncSpan(models.Model):
+    _name = 'zoom.sync.span'
+    _description = 'Tiempo de Etapa de Sincronización Zoom'
+    _order = 'run_id, page, id'
+    _rec_name = 'stage'
+
+    run_id = fields.Many2one(
+        'zoom.sync.run',
+        string='Ejecución',
+        required=True,
+        ondelete='cascade',
+        index=True
+    )
+
+    page = fields.Integer(
+        string='Página',
+        help='Página (o anfitrión, con alcance de cuenta) de la ejecución, empezando en 0'
+    )
+
+    host_id = fields.Many2one(
+        'zoom.host',
+        string='Anfitrión',
+        ondelete='set null'
+    )
+
+    stage = fields.Char(
+        string='Etapa',
+        required=True,
+        help='fetch (HTTP), normalize, diff, write (ORM), calendar (eventos) o commit'
+    )
+
+    duration = fields.Float(
+        string='Duración (s)',
+        digits=(16, 4)
+    )
+
+    item_count = fields.Integer(
+        string='Reuniones',
+        help='Reuniones de la página procesadas en la etapa'
+    )
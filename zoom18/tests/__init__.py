@@ -6,3 +6,22 @@ from . import test_zoom_meeting_attendee
 from . import test_zoom_dashboard
 from . import test_integration
 from . import test_helpdesk_integration
+from . import test_zoom_sync
+from . import test_zoom_outbox
+from . import test_calendar_sync
+from . import test_zoom_reminder
+from . import test_zoom_scheduled_job
+from . import test_zoom_mail_render
+from . import test_zoom_meeting_participant
+from . import test_helpdesk_ticket_participant
+from . import test_zoom_recording
+from . import test_zoom_fake_server
+from . import test_zoom_benchmark
+from . import test_zoom_query_count
+from . import test_zoom_api_metric
+from . import test_zoom_sync_telemetry
+from . import test_zoom_profile
+from . import test_zoom_logging
+from . import test_zoom_dashboard_cache
+from . import test_zoom_meeting_report
+from . import test_project_task
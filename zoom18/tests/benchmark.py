@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""Medición de escenarios de rendimiento y comparación de informes
+
+Lo usan los tests etiquetados ``zoom_benchmark`` (``test_zoom_benchmark``),
+que escriben un informe JSON por ejecución. Sin dependencias de Odoo, para
+poder comparar dos informes desde la línea de comandos::
+
+    python zoom18/tests/benchmark.py antes.json despues.json
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+# Tamaños por defecto; ZOOM_BENCHMARK_SIZES=1000,10000,100000 para la serie completa
+DEFAULT_BENCHMARK_SIZES = (1000,)
+
+REPORT_VERSION = 1
+
+# Métricas que se comparan entre informes
+REPORT_METRICS = ('wall_time', 'queries', 'http_calls', 'peak_memory_kb')
+
+
+def benchmark_sizes():
+    value = os.environ.get('ZOOM_BENCHMARK_SIZES')
+    if not value:
+        return DEFAULT_BENCHMARK_SIZES
+    return tuple(int(size) for size in value.split(',') if size.strip())
+
+
+def benchmark_report_path():
+    return os.environ.get('ZOOM_BENCHMARK_REPORT') or os.path.join(tempfile.gettempdir(), 'zoom18_benchmark.json')
+
+
+class BenchmarkRecorder:
+    """Acumula las mediciones de los escenarios y las guarda en JSON
+
+    ``count_queries`` y ``count_http`` son funciones sin argumentos que
+    devuelven un contador acumulado (consultas SQL del cursor, peticiones al
+    servidor Zoom simulado); cada escenario guarda la diferencia.
+    """
+
+    def __init__(self, label=None):
+        self.label = label if label is not None else os.environ.get('ZOOM_BENCHMARK_LABEL', '')
+        self.results = []
+
+    # tracemalloc también ralentiza el código medido: compare solo informes generados igual
+    @contextmanager
+    def measure(self, scenario, size, count_queries, count_http=lambda: 0):
+        extra = {}
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        queries, http_calls = count_queries(), count_http()
+        start = time.perf_counter()
+        try:
+            yield extra
+        finally:
+            wall_time = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1]
+            if started_tracing:
+                tracemalloc.stop()
+            self.results.append({
+                'scenario': scenario,
+                'size': size,
+                'wall_time': round(wall_time, 4),
+                'queries': count_queries() - queries,
+                'http_calls': count_http() - http_calls,
+                'peak_memory_kb': peak // 1024,
+                'extra': extra,
+            })
+
+    def report(self):
+        return {
+            'version': REPORT_VERSION,
+            'label': self.label,
+            'generated_at': datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ'),
+            'results': sorted(self.results, key=lambda r: (r['scenario'], r['size'])),
+        }
+
+    def write(self, path=None):
+        """Añadir las mediciones al informe (varios tests escriben en el mismo fichero)"""
+        path = path or benchmark_report_path()
+        report = self.report()
+        if os.path.exists(path):
+            with open(path) as f:
+                previous = json.load(f)
+            if previous.get('version') == REPORT_VERSION and previous.get('label') == report['label']:
+                keys = {(r['scenario'], r['size']) for r in report['results']}
+                kept = [r for r in previous['results'] if (r['scenario'], r['size']) not in keys]
+                report['results'] = sorted(kept + report['results'], key=lambda r: (r['scenario'], r['size']))
+        with open(path, 'w') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+            f.write('\n')
+        return path
+
+
+def compare_reports(old, new):
+    """Filas ``(escenario, tamaño, métrica, antes, después, variación %)``"""
+    old_results = {(r['scenario'], r['size']): r for r in old['results']}
+    rows = []
+    for result in new['results']:
+        before = old_results.get((result['scenario'], result['size']))
+        if not before:
+            continue
+        for metric in REPORT_METRICS:
+            previous, current = before[metric], result[metric]
+            change = (current - previous) * 100.0 / previous if previous else 0.0
+            rows.append((result['scenario'], result['size'], metric, previous, current, round(change, 1)))
+    return rows
+
+
+def main(argv):
+    if len(argv) != 2:
+        print('Uso: benchmark.py ANTES.json DESPUES.json')
+        return 2
+    reports = []
+    for path in argv:
+        with open(path) as f:
+            reports.append(json.load(f))
+    for scenario, size, metric, before, after, change in compare_reports(*reports):
+        print(f'{scenario:<20} {size:>7} {metric:<15} {before:>12} {after:>12} {change:>+8.1f}%')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,498 @@
+# -*- coding: utf-8 -*-
+
+import base64
+import hashlib
+import hmac
+import json
+import re
+import threading
+import time
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlparse
+
+from odoo.tests.common import TransactionCase
+
+# Inicio de la primera reunión generada (las demás van cada hora)
+FAKE_ZOOM_START = datetime(2025, 1, 6, 9, 0)
+
+# Máximo de elementos por página que acepta Zoom
+FAKE_ZOOM_MAX_PAGE_SIZE = 300
+
+
+def zoom_datetime(value):
+    return value.strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+class FakeZoomServer:
+    """Servidor HTTP local que imita la API de Zoom para tests y benchmarks
+
+    Atiende en ``127.0.0.1`` (Odoo bloquea en los tests cualquier otra
+    dirección) el token OAuth Server-to-Server, ``/users``, las reuniones de
+    cada usuario con paginación real por ``next_page_token``, participantes,
+    informes y grabaciones. El tamaño del conjunto de datos es configurable,
+    igual que la latencia por petición y los 429 periódicos, de modo que las
+    pruebas recorren el cliente HTTP, el circuit breaker y la paginación
+    reales en lugar de un ``MagicMock``.
+
+    Uso::
+
+        with FakeZoomServer(users=3, meetings_per_user=500, latency=0.01) as zoom:
+            config.write({'base_url': zoom.base_url, 'token_url': zoom.token_url})
+    """
+
+    def __init__(self, users=1, meetings_per_user=10, participants_per_meeting=5,
+                 recording_every=2, latency=0.0, rate_limit_every=0, token_expires_in=3600):
+        self.latency = latency
+        self.rate_limit_every = rate_limit_every
+        self.token_expires_in = token_expires_in
+        self.requests = []
+        self.tokens = set()
+        self.failures = []
+        self.users = []
+        self.meetings = {}
+        self.meetings_by_user = {}
+        self.participants = {}
+        self.recordings = {}
+        self._api_calls = 0
+        self._next_meeting_id = 1000000
+        self._lock = threading.Lock()
+        self._httpd = None
+        self._thread = None
+        self._build_dataset(users, meetings_per_user, participants_per_meeting, recording_every)
+
+    # === CONJUNTO DE DATOS ===
+    def _build_dataset(self, users, meetings_per_user, participants_per_meeting, recording_every):
+        for user_index in range(users):
+            user = {
+                'id': f'user{user_index}',
+                'email': f'host{user_index}@example.com',
+                'first_name': 'Anfitrión',
+                'last_name': str(user_index),
+                'type': 2,
+                'status': 'active',
+            }
+            self.users.append(user)
+            self.meetings_by_user[user['id']] = []
+            for _index in range(meetings_per_user):
+                meeting = self.add_meeting(user['id'])
+                self.participants[meeting['id']] = [
+                    self._make_participant(meeting, index) for index in range(participants_per_meeting)
+                ]
+                if recording_every and meeting['id'] % recording_every == 0:
+                    self.recordings[meeting['id']] = self._make_recording(meeting)
+
+    def add_meeting(self, user_id, topic=None, start_time=None, duration=60):
+        with self._lock:
+            meeting_id = self._next_meeting_id
+            self._next_meeting_id += 1
+        start_time = start_time or FAKE_ZOOM_START + timedelta(hours=meeting_id - 1000000)
+        meeting = {
+            'id': meeting_id,
+            'uuid': f'uuid{meeting_id}==',
+            'host_id': user_id,
+            'topic': topic or f'Reunión {meeting_id}',
+            'type': 2,
+            'status': 'waiting',
+            'start_time': zoom_datetime(start_time),
+            'duration': duration,
+            'timezone': 'UTC',
+            'join_url': f'https://zoom.example.com/j/{meeting_id}',
+            'start_url': f'https://zoom.example.com/s/{meeting_id}',
+        }
+        self.meetings[meeting_id] = meeting
+        self.meetings_by_user.setdefault(user_id, []).append(meeting)
+        return meeting
+
+    def _make_participant(self, meeting, index):
+        join = datetime.strptime(meeting['start_time'], '%Y-%m-%dT%H:%M:%SZ') + timedelta(minutes=index)
+        leave = join + timedelta(minutes=meeting['duration'] - index)
+        return {
+            'id': f'p{meeting["id"]}-{index}',
+            'user_id': str(index),
+            'name': f'Participante {index}',
+            'user_email': f'participante{index}@example.com',
+            'join_time': zoom_datetime(join),
+            'leave_time': zoom_datetime(leave),
+            'duration': int((leave - join).total_seconds()),
+            'status': 'in_meeting',
+        }
+
+    def _make_recording(self, meeting):
+        start = datetime.strptime(meeting['start_time'], '%Y-%m-%dT%H:%M:%SZ')
+        end = start + timedelta(minutes=meeting['duration'])
+        files = [{
+            'id': f'{meeting["id"]}-{file_type}',
+            'meeting_id': meeting['uuid'],
+            'recording_start': zoom_datetime(start),
+            'recording_end': zoom_datetime(end),
+            'file_type': file_type,
+            'file_extension': file_type,
+            'file_size': size,
+            'recording_type': recording_type,
+            'status': 'completed',
+            'download_url': f'https://zoom.example.com/rec/download/{meeting["id"]}-{file_type}',
+            'play_url': f'https://zoom.example.com/rec/play/{meeting["id"]}-{file_type}',
+        } for file_type, recording_type, size in (
+            ('MP4', 'shared_screen_with_speaker_view', 250000000),
+            ('M4A', 'audio_only', 30000000),
+        )]
+        return {
+            'uuid': meeting['uuid'],
+            'id': meeting['id'],
+            'host_id': meeting['host_id'],
+            'topic': meeting['topic'],
+            'start_time': meeting['start_time'],
+            'duration': meeting['duration'],
+            'total_size': sum(f['file_size'] for f in files),
+            'recording_count': len(files),
+            'recording_files': files,
+        }
+
+    # === CICLO DE VIDA ===
+    @property
+    def url(self):
+        host, port = self._httpd.server_address[:2]
+        return f'http://{host}:{port}'
+
+    @property
+    def base_url(self):
+        return f'{self.url}/v2'
+
+    @property
+    def token_url(self):
+        return f'{self.url}/oauth/token'
+
+    def start(self):
+        server = self
+        handler = type('FakeZoomHandler', (FakeZoomRequestHandler,), {'server_state': server})
+        self._httpd = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name='fake-zoom', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._httpd:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._thread.join()
+            self._httpd = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    # === INYECCIÓN DE FALLOS Y ESTADÍSTICAS ===
+    def fail_next(self, status=503, count=1):
+        """Responder ``status`` a las próximas ``count`` llamadas a la API"""
+        with self._lock:
+            self.failures.extend([status] * count)
+
+    def request_count(self, prefix=''):
+        with self._lock:
+            return sum(1 for _method, path in self.requests if path.startswith(prefix))
+
+    def reset_stats(self):
+        with self._lock:
+            self.requests.clear()
+
+    def _next_failure(self):
+        """Estado HTTP forzado para la siguiente llamada a la API, si lo hay"""
+        with self._lock:
+            self._api_calls += 1
+            if self.failures:
+                return self.failures.pop(0)
+            if self.rate_limit_every and self._api_calls % self.rate_limit_every == 0:
+                return 429
+        return None
+
+    # === WEBHOOKS ===
+    def make_webhook(self, event, secret, zoom_object=None, payload=None, timestamp=None):
+        """Cuerpo y cabeceras firmadas de un evento, como los envía Zoom"""
+        timestamp = str(int(timestamp if timestamp is not None else time.time()))
+        body = json.dumps({
+            'event': event,
+            'event_ts': int(timestamp) * 1000,
+            'payload': payload if payload is not None else {'account_id': 'fake-account', 'object': zoom_object},
+        })
+        signature = hmac.new(secret.encode(), f'v0:{timestamp}:{body}'.encode(), hashlib.sha256).hexdigest()
+        return body, {
+            'Content-Type': 'application/json',
+            'x-zm-request-timestamp': timestamp,
+            'x-zm-signature': f'v0={signature}',
+        }
+
+    def recording_completed(self, meeting_id, secret, timestamp=None):
+        return self.make_webhook('recording.completed', secret, zoom_object=self.recordings[meeting_id], timestamp=timestamp)
+
+
+class FakeZoomRequestHandler(BaseHTTPRequestHandler):
+    """Rutas de la API simulada; el estado vive en ``server_state``"""
+
+    server_state = None
+    protocol_version = 'HTTP/1.1'
+
+    ROUTES = [
+        ('GET', r'/v2/users', '_get_users'),
+        ('GET', r'/v2/users/(?P<user>[^/]+)/meetings', '_get_user_meetings'),
+        ('POST', r'/v2/users/(?P<user>[^/]+)/meetings', '_create_meeting'),
+        ('GET', r'/v2/meetings/(?P<meeting>[^/]+)', '_get_meeting'),
+        ('PATCH', r'/v2/meetings/(?P<meeting>[^/]+)', '_update_meeting'),
+        ('DELETE', r'/v2/meetings/(?P<meeting>[^/]+)', '_delete_meeting'),
+        ('GET', r'/v2/(?:metrics/|report/|past_)?meetings/(?P<meeting>[^/]+)/participants', '_get_participants'),
+        ('GET', r'/v2/meetings/(?P<meeting>.+)/recordings', '_get_recordings'),
+    ]
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self._dispatch('GET')
+
+    def do_POST(self):
+        self._dispatch('POST')
+
+    def do_PATCH(self):
+        self._dispatch('PATCH')
+
+    def do_DELETE(self):
+        self._dispatch('DELETE')
+
+    # === INFRAESTRUCTURA ===
+    def _dispatch(self, method):
+        state = self.server_state
+        parsed = urlparse(self.path)
+        self.query = {key: values[-1] for key, values in parse_qs(parsed.query).items()}
+        length = int(self.headers.get('Content-Length') or 0)
+        self.body = self.rfile.read(length) if length else b''
+        with state._lock:
+            state.requests.append((method, parsed.path))
+        if state.latency:
+            time.sleep(state.latency)
+
+        if parsed.path == '/oauth/token' and method == 'POST':
+            return self._token()
+        token = (self.headers.get('Authorization') or '').removeprefix('Bearer ')
+        if token not in state.tokens:
+            return self._send(401, {'code': 124, 'message': 'Invalid access token.'})
+        failure = state._next_failure()
+        if failure == 429:
+            return self._send(429, {'code': 429, 'message': "You have reached the maximum per-second rate limit."},
+                              headers={'Retry-After': '1'})
+        if failure:
+            return self._send(failure, {'code': failure, 'message': 'Fallo simulado'})
+        for route_method, pattern, handler in self.ROUTES:
+            match = re.fullmatch(pattern, parsed.path)
+            if route_method == method and match:
+                return getattr(self, handler)(**{key: unquote(value) for key, value in match.groupdict().items()})
+        return self._send(404, {'code': 404, 'message': 'Not found'})
+
+    def _send(self, status, payload=None, headers=None):
+        body = json.dumps(payload).encode() if payload is not None else b''
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _json_body(self):
+        return json.loads(self.body or b'{}')
+
+    def _paginate(self, items, key, extra=None):
+        page_size = min(int(self.query.get('page_size') or 30), FAKE_ZOOM_MAX_PAGE_SIZE)
+        offset = int(self.query.get('next_page_token') or 0)
+        page = items[offset:offset + page_size]
+        next_offset = offset + page_size
+        payload = dict(extra or {}, **{
+            key: page,
+            'page_size': page_size,
+            'total_records': len(items),
+            'next_page_token': str(next_offset) if next_offset < len(items) else '',
+        })
+        return self._send(200, payload)
+
+    def _user_id(self, user):
+        state = self.server_state
+        return state.users[0]['id'] if user == 'me' and state.users else user
+
+    # === RUTAS ===
+    def _token(self):
+        state = self.server_state
+        auth = (self.headers.get('Authorization') or '').removeprefix('Basic ')
+        form = {key: values[-1] for key, values in parse_qs(self.body.decode()).items()}
+        try:
+            client_id, _secret = base64.b64decode(auth).decode().split(':', 1)
+        except ValueError:
+            client_id = None
+        if not client_id or form.get('grant_type') != 'account_credentials' or not form.get('account_id'):
+            return self._send(400, {'reason': 'Invalid client_id or client_secret', 'error': 'invalid_client'})
+        with state._lock:
+            token = f'fake-token-{len(state.tokens) + 1}'
+            state.tokens.add(token)
+        return self._send(200, {
+            'access_token': token,
+            'token_type': 'bearer',
+            'expires_in': state.token_expires_in,
+            'scope': 'meeting:read meeting:write user:read recording:read report:read',
+        })
+
+    def _get_users(self):
+        status = self.query.get('status', 'active')
+        users = [user for user in self.server_state.users if user['status'] == status]
+        return self._paginate(users, 'users')
+
+    def _get_user_meetings(self, user):
+        meetings = self.server_state.meetings_by_user.get(self._user_id(user))
+        if meetings is None:
+            return self._send(404, {'code': 1001, 'message': 'User does not exist.'})
+        return self._paginate(meetings, 'meetings')
+
+    def _create_meeting(self, user):
+        data = self._json_body()
+        start_time = data.get('start_time')
+        meeting = self.server_state.add_meeting(
+            self._user_id(user),
+            topic=data.get('topic'),
+            start_time=datetime.strptime(start_time[:19], '%Y-%m-%dT%H:%M:%S') if start_time else None,
+            duration=data.get('duration') or 60,
+        )
+        return self._send(201, meeting)
+
+    def _find_meeting(self, meeting):
+        state = self.server_state
+        if meeting.isdigit():
+            return state.meetings.get(int(meeting))
+        return next((m for m in state.meetings.values() if m['uuid'] == meeting), None)
+
+    def _get_meeting(self, meeting):
+        found = self._find_meeting(meeting)
+        if not found:
+            return self._send(404, {'code': 3001, 'message': 'Meeting does not exist.'})
+        return self._send(200, found)
+
+    def _update_meeting(self, meeting):
+        found = self._find_meeting(meeting)
+        if not found:
+            return self._send(404, {'code': 3001, 'message': 'Meeting does not exist.'})
+        found.update({key: value for key, value in self._json_body().items() if key in found})
+        return self._send(204)
+
+    def _delete_meeting(self, meeting):
+        state = self.server_state
+        found = self._find_meeting(meeting)
+        if not found:
+            return self._send(404, {'code': 3001, 'message': 'Meeting does not exist.'})
+        with state._lock:
+            del state.meetings[found['id']]
+            state.meetings_by_user[found['host_id']].remove(found)
+        return self._send(204)
+
+    def _get_participants(self, meeting):
+        found = self._find_meeting(meeting)
+        if not found:
+            return self._send(404, {'code': 3001, 'message': 'Meeting does not exist.'})
+        return self._paginate(self.server_state.participants.get(found['id'], []), 'participants')
+
+    def _get_recordings(self, meeting):
+        found = self._find_meeting(unquote(meeting))
+        recording = found and self.server_state.recordings.get(found['id'])
+        if not recording:
+            return self._send(404, {'code': 3301, 'message': 'There is no recording for this meeting.'})
+        payload = dict(recording)
+        if 'download_access_token' in self.query.get('include_fields', ''):
+            payload['download_access_token'] = f'download-{found["id"]}-{self.query.get("ttl", 86400)}'
+        return self._send(200, payload)
+
+
+class ZoomFakeServerCase(TransactionCase):
+    """TransactionCase con un servidor Zoom simulado y la configuración apuntando a él
+
+    Las subclases pueden ajustar el conjunto de datos con ``fake_zoom_options``.
+    """
+
+    fake_zoom_options = {}
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.zoom_server = FakeZoomServer(**cls.fake_zoom_options).start()
+        cls.addClassCleanup(cls.zoom_server.stop)
+
+    def setUp(self):
+        super().setUp()
+        self.zoom_server.reset_stats()
+        self.config = self.env['zoom.config'].get_config()
+        self._configure_fake_zoom(self.zoom_server)
+        # El circuit breaker vive en memoria y no se deshace con el rollback del test
+        breaker = self.config._get_circuit_breaker()
+        breaker.reset()
+        self.addCleanup(breaker.reset)
+
+    def _configure_fake_zoom(self, server):
+        """Apuntar la configuración a ``server`` con un token nuevo"""
+        self.config.write({
+            'client_id': 'fake_client_id',
+            'client_secret': 'fake_client_secret',
+            'account_id': 'fake_account_id',
+            'base_url': server.base_url,
+            'token_url': server.token_url,
+            'access_token': False,
+            'token_expires': False,
+            'connection_status': 'connected',
+        })
+
+
+class ZoomQueryBudgetCase(ZoomFakeServerCase):
+    """Presupuestos de consultas SQL para los caminos críticos del ORM
+
+    ``assertQueryBudget`` ejecuta el mismo camino con varios tamaños, cada uno
+    sobre la base de datos restaurada, y falla si alguno pasa del presupuesto
+    o si el tamaño mayor hace más consultas que el menor: un N+1 que vuelva
+    a aparecer rompe el test aunque siga por debajo del límite.
+    """
+
+    # Tamaños con los que se mide cada camino (el primero también calienta cachés)
+    query_budget_sizes = (2, 20)
+
+    def _count_queries(self, prepare, run, size):
+        """Consultas de ``run(prepare(size))``; los datos se deshacen al terminar"""
+        savepoint = self.env.cr.savepoint(flush=False)
+        try:
+            records = prepare(size)
+            self.env.flush_all()
+            self.env.invalidate_all()
+            count = self.env.cr.sql_log_count
+            run(records)
+            self.env.flush_all()
+            return self.env.cr.sql_log_count - count
+        finally:
+            self.env.flush_all()
+            savepoint.close(rollback=True)
+            self.env.invalidate_all(flush=False)
+
+    def assertQueryBudget(self, budget, prepare, run, per_record=0, sizes=None):
+        """Comprobar que ``run`` no pasa de ``budget`` consultas con ningún tamaño
+
+        ``prepare(size)`` crea los datos (no cuenta) y devuelve lo que recibe
+        ``run``. Los caminos que por diseño trabajan registro a registro (una
+        llamada HTTP por ticket, por ejemplo) declaran ``per_record``: el
+        presupuesto es entonces ``budget + per_record * size`` y no se exige
+        que el número de consultas sea el mismo para todos los tamaños.
+        """
+        sizes = sizes or self.query_budget_sizes
+        # Primera pasada sin medir: ormcache, plantillas y registros de configuración
+        self._count_queries(prepare, run, sizes[0])
+        counts = {size: self._count_queries(prepare, run, size) for size in sizes}
+        for size, count in counts.items():
+            limit = budget + per_record * size
+            self.assertLessEqual(
+                count, limit, f'{count} consultas con {size} registros (presupuesto: {limit})')
+        if not per_record:
+            self.assertLessEqual(
+                counts[sizes[-1]], counts[sizes[0]],
+                f'Las consultas crecen con el número de registros: {counts}')
+        return counts
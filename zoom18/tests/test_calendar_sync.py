@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+
+from odoo.tests.common import TransactionCase
+from unittest.mock import patch
+from datetime import datetime, timedelta
+
+
+class TestCalendarMeetingSync(TransactionCase):
+    """Tests para la propagación reunión <-> evento de calendario"""
+
+    def setUp(self):
+        super().setUp()
+        self.meeting = self.env['zoom.meeting'].create({
+            'name': 'Reunión Sincronizada',
+            'start_time': datetime.now().replace(microsecond=0) + timedelta(days=1),
+            'duration': 30,
+        })
+        self.event = self.meeting.calendar_event_id
+
+    def _count_writes(self):
+        """Contar las llamadas a write de reuniones y eventos"""
+        calls = {'zoom.meeting': 0, 'calendar.event': 0}
+        patches = []
+        for model_name in calls:
+            model_class = type(self.env[model_name])
+            original_write = model_class.write
+
+            def counting_write(records, vals, _original=original_write):
+                calls[records._name] += 1
+                return _original(records, vals)
+
+            patches.append(patch.object(model_class, 'write', counting_write))
+        return calls, patches
+
+    def _count_queries(self, func):
+        self.env.flush_all()
+        start = self.env.cr.sql_log_count
+        func()
+        self.env.flush_all()
+        return self.env.cr.sql_log_count - start
+
+    def test_event_is_linked_to_meeting(self):
+        """Test: El evento creado desde la reunión apunta a ella"""
+        self.assertTrue(self.event)
+        self.assertEqual(self.event.zoom_meeting_id, self.meeting)
+        self.assertEqual(self.event.stop - self.event.start, timedelta(minutes=30))
+
+    def test_meeting_edit_writes_event_once(self):
+        """Test: Editar la reunión produce una sola escritura por modelo"""
+        calls, patches = self._count_writes()
+        with patches[0], patches[1]:
+            self.meeting.write({'name': 'Reunión Renombrada', 'duration': 45})
+
+        self.assertEqual(calls, {'zoom.meeting': 1, 'calendar.event': 1})
+        self.assertEqual(self.event.name, 'Reunión Renombrada')
+        self.assertEqual(self.event.stop - self.event.start, timedelta(minutes=45))
+
+    def test_event_edit_writes_meeting_once(self):
+        """Test: Editar el evento produce una sola escritura por modelo"""
+        calls, patches = self._count_writes()
+        with patches[0], patches[1]:
+            self.event.write({'name': 'Evento Renombrado', 'stop': self.event.start + timedelta(minutes=60)})
+
+        self.assertEqual(calls, {'zoom.meeting': 1, 'calendar.event': 1})
+        self.assertEqual(self.meeting.name, 'Evento Renombrado')
+        self.assertEqual(self.meeting.duration, 60)
+
+    def test_unchanged_values_are_not_propagated(self):
+        """Test: Reescribir el mismo valor no escribe en el otro modelo"""
+        calls, patches = self._count_writes()
+        with patches[0], patches[1]:
+            self.meeting.write({'name': self.meeting.name})
+
+        self.assertEqual(calls, {'zoom.meeting': 1, 'calendar.event': 0})
+
+    def test_propagation_query_count(self):
+        """Test: Propagar una edición cuesta lo mismo que las dos escrituras directas"""
+        direct = self._count_queries(lambda: (
+            self.meeting.with_context(zoom_skip_calendar_sync=True).write({'name': 'Directa'}),
+            self.event.with_context(zoom_skip_meeting_sync=True).write({'name': 'Directa'}),
+        ))
+        propagated = self._count_queries(lambda: self.meeting.write({'name': 'Propagada'}))
+
+        # Margen para las lecturas del changeset
+        self.assertLessEqual(propagated, direct + 2)
+
+
+class TestCalendarCreateZoomMeeting(TransactionCase):
+    """Tests para crear la reunión Zoom desde un evento de calendario"""
+
+    def test_duration_in_minutes(self):
+        """Test: Un evento de 1,5 horas crea una reunión de 90 minutos"""
+        start = datetime.now().replace(microsecond=0) + timedelta(days=3)
+        event = self.env['calendar.event'].create({
+            'name': 'Evento Largo',
+            'start': start,
+            'stop': start + timedelta(hours=1, minutes=30),
+        })
+        Config = type(self.env['zoom.config'])
+        sent = []
+
+        def create_zoom_meeting(config, meeting_data, record=None):
+            sent.append(meeting_data)
+            return {}
+
+        with patch.object(Config, 'create_zoom_meeting', create_zoom_meeting):
+            event.action_create_zoom_meeting()
+
+        self.assertEqual(event.zoom_meeting_id.duration, 90)
+        self.assertEqual([data['duration'] for data in sent], [90])
+        self.assertEqual(event.zoom_meeting_id.calendar_event_id, event)
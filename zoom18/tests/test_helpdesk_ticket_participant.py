@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+
+from odoo.tests.common import TransactionCase
+from unittest.mock import MagicMock, patch
+from datetime import datetime, timedelta
+
+
+class TestHelpdeskTicketParticipant(TransactionCase):
+    """Tests para las sesiones de participantes de los tickets"""
+
+    def setUp(self):
+        super().setUp()
+        self.config = self.env['zoom.config'].get_config()
+        self.config.write({
+            'client_id': 'test_client_id',
+            'client_secret': 'test_client_secret',
+            'account_id': 'test_account_id',
+            'access_token': 'test_token',
+            'token_expires': datetime.now() + timedelta(hours=1),
+        })
+        team = self.env['helpdesk.team'].create({'name': 'Equipo Zoom'})
+        self.ticket = self.env['helpdesk.ticket'].create({
+            'name': 'Ticket con Reunión',
+            'team_id': team.id,
+        })
+        self.ticket.write({'zoom_meeting_id': '555', 'zoom_created': True})
+        self.Session = self.env['helpdesk.ticket.zoom.participant']
+        self.participants = [
+            {'id': 'p1', 'name': 'Ana', 'email': 'Ana@Example.com', 'status': 'in_meeting',
+             'join_time': '2025-03-01T10:00:00Z', 'leave_time': '2025-03-01T10:20:00Z', 'duration': 1200},
+            {'id': 'p1', 'name': 'Ana', 'email': 'ana@example.com', 'status': 'in_meeting',
+             'join_time': '2025-03-01T10:25:00Z', 'duration': 0},
+            {'id': 'p2', 'name': 'Luis', 'email': 'luis@example.com', 'status': 'in_waiting_room',
+             'join_time': '2025-03-01T10:05:00Z', 'duration': 0},
+        ]
+
+    def _response(self, payload):
+        return MagicMock(status_code=200, json=lambda: payload)
+
+    def _sync(self, pages):
+        def fake_request(config, method, path, **kwargs):
+            if path.endswith('/recordings'):
+                return self._response({'recording_files': []})
+            return self._response({'topic': 'Soporte', 'duration': 60, 'status': 'started'})
+
+        def fake_pages(config, path, items_key, params=None, page_token=None):
+            return iter(pages)
+
+        Config = type(self.config)
+        with patch.object(Config, '_zoom_request', fake_request), \
+                patch.object(Config, '_zoom_get_pages', fake_pages):
+            return self.ticket._sync_zoom_data()
+
+    def test_upsert_creates_one_row_per_session(self):
+        """Test: Se guarda una fila por entrada y se normaliza el email"""
+        sessions = self.Session._upsert_sessions(self.ticket, self.participants)
+
+        self.assertEqual(len(sessions), 3)
+        self.assertEqual(set(sessions.mapped('email')), {'ana@example.com', 'luis@example.com'})
+        self.assertEqual(sessions[0].join_time, datetime(2025, 3, 1, 10, 0))
+
+    def test_upsert_updates_only_changed_sessions(self):
+        """Test: Repetir la sincronización no duplica filas y solo reescribe las que cambian"""
+        self.Session._upsert_sessions(self.ticket, self.participants)
+        self.participants[1].update({'leave_time': '2025-03-01T11:00:00Z', 'duration': 2100})
+
+        written = []
+        write = type(self.Session).write
+
+        def spy(records, vals):
+            written.append((records.ids, dict(vals)))
+            return write(records, vals)
+
+        with patch.object(type(self.Session), 'write', spy):
+            sessions = self.Session._upsert_sessions(self.ticket, self.participants)
+
+        self.assertEqual(len(sessions), 3)
+        self.assertEqual(len(written), 1)
+        self.assertEqual(written[0][1], {'leave_time': datetime(2025, 3, 1, 11, 0), 'duration': 2100})
+
+    def test_sync_reads_all_pages_and_computes_list(self):
+        """Test: La sincronización recorre todas las páginas y la lista se calcula"""
+        self.assertTrue(self._sync([(self.participants[:2], 'token'), (self.participants[2:], None)]))
+
+        self.assertEqual(len(self.ticket.zoom_participant_ids), 3)
+        self.assertEqual(self.ticket.total_attendees, 2)
+        self.assertEqual(self.ticket.confirmed_attendees, 1)
+        self.assertEqual(
+            self.ticket.attendees_list,
+            '• Ana (ana@example.com)\n• Luis (luis@example.com)',
+        )
+
+    def test_sync_skips_unchanged_fields(self):
+        """Test: Una segunda sincronización idéntica solo escribe la fecha de sincronización"""
+        pages = [(self.participants, None)]
+        self._sync(pages)
+        self.ticket.last_sync = datetime.now() - timedelta(minutes=5)
+
+        written = []
+        write = type(self.ticket).write
+
+        def spy(records, vals):
+            if records == self.ticket:
+                written.append(set(vals))
+            return write(records, vals)
+
+        with patch.object(type(self.ticket), 'write', spy):
+            self._sync(pages)
+
+        self.assertEqual(written, [{'last_sync'}])
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+
+from odoo.tests.common import TransactionCase
+from datetime import datetime, timedelta
+
+
+class TestProjectZoomStats(TransactionCase):
+    """Tests para las reuniones Zoom de tareas y proyectos"""
+
+    def setUp(self):
+        super().setUp()
+        self.Meeting = self.env['zoom.meeting'].with_context(zoom_skip_calendar_sync=True)
+        self.project = self.env['project.project'].create({'name': 'Proyecto Reuniones'})
+        self.task, self.other_task = self.env['project.task'].create([
+            {'name': 'Tarea con Reuniones', 'project_id': self.project.id},
+            {'name': 'Tarea sin Reuniones', 'project_id': self.project.id},
+        ])
+        self.start = datetime(2030, 5, 6, 9, 0)
+
+    def _meeting(self, task, start, status='scheduled', **vals):
+        return self.Meeting.create(dict({
+            'name': 'Reunión de Tarea',
+            'start_time': start,
+            'duration': 60,
+            'task_id': task.id,
+            'status': status,
+        }, **vals))
+
+    def test_task_count_and_active_meeting(self):
+        """Test: Cantidad de reuniones y la próxima activa o programada"""
+        self._meeting(self.task, self.start - timedelta(days=1), status='finished')
+        later = self._meeting(self.task, self.start + timedelta(days=2))
+        sooner = self._meeting(self.task, self.start + timedelta(days=1))
+
+        tasks = self.task | self.other_task
+        self.assertEqual(tasks.mapped('zoom_meeting_count'), [3, 0])
+        self.assertEqual(self.task.active_zoom_meeting, sooner)
+        self.assertFalse(self.other_task.active_zoom_meeting)
+
+        sooner.status = 'cancelled'
+        self.assertEqual(self.task.active_zoom_meeting, later)
+
+    def test_new_task_in_memory(self):
+        """Test: Una tarea sin guardar se calcula con sus reuniones en memoria"""
+        task = self.env['project.task'].new({'name': 'Tarea Nueva'})
+
+        self.assertEqual(task.zoom_meeting_count, 0)
+        self.assertFalse(task.active_zoom_meeting)
+
+    def test_project_rollup(self):
+        """Test: El proyecto suma las reuniones no canceladas y sus horas reales"""
+        self._meeting(self.task, self.start, status='finished',
+                      actual_start_time=self.start, actual_end_time=self.start + timedelta(minutes=90))
+        self._meeting(self.other_task, self.start + timedelta(days=1))
+        self._meeting(self.other_task, self.start + timedelta(days=1), status='cancelled')
+        # El análisis diario se actualiza al confirmar la transacción
+        self.env.cr.flush()
+
+        self.assertEqual(self.project.zoom_meeting_count, 2)
+        self.assertAlmostEqual(self.project.zoom_meeting_hours, 1.5)
+        self.assertEqual(self.project.action_view_zoom_meeting_report()['domain'], [('project_id', '=', self.project.id)])
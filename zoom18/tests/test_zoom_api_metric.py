@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+
+from odoo.tests.common import HttpCase
+
+from odoo.addons.zoom18.controllers.zoom_metrics import is_local_address
+from odoo.addons.zoom18.models.zoom_api_metric import LATENCY_BUCKET_FIELDS
+from odoo.addons.zoom18.models.zoom_client import ZoomUnavailable, endpoint_template, zoom_request
+from odoo.addons.zoom18.tests.common import ZoomFakeServerCase
+
+
+class TestZoomApiMetric(ZoomFakeServerCase):
+    """Tests para las métricas de las llamadas a la API de Zoom"""
+
+    def setUp(self):
+        super().setUp()
+        self.Metric = self.env['zoom.api.metric']
+        self.metrics = self.config._get_api_metrics()
+        # El acumulador vive en memoria del proceso: descartar llamadas de otros tests
+        self.metrics.drain()
+
+    def _row(self, endpoint, status='200'):
+        return self.Metric.search([('endpoint', '=', endpoint), ('status_code', '=', status)])
+
+    def test_endpoint_template(self):
+        """Test: Los identificadores de la ruta no generan endpoints distintos"""
+        base = 'https://api.zoom.us/v2'
+        self.assertEqual(endpoint_template(f'{base}/users/abc123/meetings'), '/users/{id}/meetings')
+        self.assertEqual(endpoint_template(f'{base}/users/me/meetings'), '/users/me/meetings')
+        self.assertEqual(endpoint_template(f'{base}/meetings/%252Fabc%253D%253D/recordings'),
+                         '/meetings/{id}/recordings')
+        self.assertEqual(endpoint_template(f'{base}/report/meetings/42/participants?page_size=300'),
+                         '/report/meetings/{id}/participants')
+        self.assertEqual(endpoint_template('https://zoom.us/oauth/token'), '/oauth/token')
+
+    def test_calls_recorded_per_endpoint(self):
+        """Test: Cada llamada suma al endpoint, método y estado de su hora"""
+        self.config._zoom_request('GET', '/users')
+        self.config._zoom_request('GET', '/meetings/1000000')
+        self.config._zoom_request('GET', '/meetings/1000001')
+
+        self.Metric._flush_buffer(force=True)
+
+        meetings = self._row('/meetings/{id}')
+        self.assertEqual(meetings.method, 'GET')
+        self.assertEqual(meetings.call_count, 2)
+        self.assertEqual(sum(meetings[fname] for fname in LATENCY_BUCKET_FIELDS), 2)
+        self.assertGreater(meetings.total_time, 0)
+        self.assertEqual(self._row('/users').call_count, 1)
+        self.assertEqual(self._row('/oauth/token').method, 'POST')
+
+    def test_flushes_accumulate(self):
+        """Test: Volcar dos veces la misma hora suma en la misma fila"""
+        url = f'{self.zoom_server.base_url}/users'
+        self.metrics.record('GET', url, 200, 0.2)
+        self.Metric._flush_buffer(force=True)
+        self.metrics.record('GET', url, 200, 3.0)
+        self.Metric._flush_buffer(force=True)
+
+        row = self._row('/users')
+        self.assertEqual(len(row), 1)
+        self.assertEqual(row.call_count, 2)
+        self.assertEqual((row.latency_le_250, row.latency_le_5000), (1, 1))
+        self.assertAlmostEqual(row.max_time, 3.0, places=3)
+        self.assertAlmostEqual(row.avg_time_ms, 1600.0, places=1)
+
+    def test_throttling_and_retries(self):
+        """Test: Los 429 y los reintentos se cuentan aparte"""
+        self.zoom_server.fail_next(429)
+        self.config._zoom_request('GET', '/users')
+        zoom_request('GET', f'{self.zoom_server.base_url}/users', metrics=self.metrics, retry=True,
+                     headers=self.config._get_api_headers())
+
+        self.Metric._flush_buffer(force=True)
+
+        throttled = self._row('/users', '429')
+        self.assertEqual((throttled.throttled_count, throttled.error_count), (1, 1))
+        self.assertEqual(self._row('/users').retry_count, 1)
+
+    def test_circuit_open_recorded(self):
+        """Test: Las llamadas rechazadas por el circuito se cuentan sin latencia"""
+        breaker = self.config._get_circuit_breaker()
+        for _i in range(self.config.circuit_failure_threshold):
+            breaker.record_failure()
+
+        with self.assertRaises(ZoomUnavailable):
+            self.config._zoom_request('GET', '/users')
+        self.Metric._flush_buffer(force=True)
+
+        rejected = self._row('/users', 'circuit_open')
+        self.assertEqual((rejected.call_count, rejected.error_count), (1, 1))
+        self.assertFalse(any(rejected[fname] for fname in LATENCY_BUCKET_FIELDS))
+
+    def test_prometheus_text(self):
+        """Test: Exportación en formato de texto de Prometheus"""
+        self.config._zoom_request('GET', '/meetings/1000000')
+
+        text = self.Metric._prometheus_text()
+
+        labels = 'endpoint="/meetings/{id}",method="GET"'
+        self.assertIn(f'zoom_api_requests_total{{{labels},status="200"}} 1\n', text)
+        self.assertIn(f'zoom_api_request_duration_seconds_bucket{{{labels},le="+Inf"}} 1\n', text)
+        self.assertIn(f'zoom_api_request_duration_seconds_count{{{labels}}} 1\n', text)
+        self.assertIn(f'zoom_api_throttled_total{{{labels}}} 0\n', text)
+        self.assertIn('# TYPE zoom_api_request_duration_seconds histogram\n', text)
+
+    def test_dashboard_summary(self):
+        """Test: El dashboard muestra las llamadas de las últimas 24 horas"""
+        self.zoom_server.fail_next(500)
+        self.config._zoom_request('GET', '/users')
+        self.config._zoom_request('GET', '/users')
+
+        values = self.env['zoom.dashboard'].default_get(['api_calls_24h', 'api_error_rate_24h'])
+
+        # Token + 2 llamadas a /users, una de ellas fallida
+        self.assertEqual(values['api_calls_24h'], 3)
+        self.assertEqual(values['api_error_rate_24h'], 33.3)
+
+
+class TestZoomMetricsController(HttpCase):
+    """Tests del endpoint /zoom/metrics"""
+
+    def test_local_address(self):
+        """Test: Solo se consideran locales las direcciones de loopback"""
+        self.assertTrue(is_local_address('127.0.0.1'))
+        self.assertTrue(is_local_address('::1'))
+        self.assertFalse(is_local_address('10.0.0.5'))
+        self.assertFalse(is_local_address(None))
+
+    def test_metrics_endpoint(self):
+        """Test: /zoom/metrics responde en texto de Prometheus desde la máquina local"""
+        response = self.url_open('/zoom/metrics')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.headers['Content-Type'].startswith('text/plain'))
+        self.assertIn('# TYPE zoom_api_requests_total counter', response.text)
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+
+from odoo import fields
+from odoo.tests import tagged
+from contextlib import contextmanager
+from datetime import timedelta
+import logging
+
+from odoo.addons.zoom18.tests.benchmark import BenchmarkRecorder, benchmark_sizes
+from odoo.addons.zoom18.tests.common import FakeZoomServer, ZoomFakeServerCase
+
+_logger = logging.getLogger(__name__)
+
+
+@tagged('post_install', '-at_install', '-standard', 'zoom_benchmark')
+class TestZoomBenchmark(ZoomFakeServerCase):
+    """Escenarios de rendimiento contra el servidor Zoom simulado
+
+    No se ejecutan con el resto de tests. Para lanzarlos::
+
+        ZOOM_BENCHMARK_SIZES=1000,10000 ZOOM_BENCHMARK_REPORT=/tmp/zoom.json \\
+            odoo-bin -d bench -i zoom18 --test-tags zoom_benchmark --stop-after-init
+
+    Cada escenario se mide por tamaño (tiempo, consultas SQL, llamadas HTTP y
+    pico de memoria de Python) y se deshace con un savepoint antes del
+    siguiente, así que los tamaños no se contaminan entre sí.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.recorder = BenchmarkRecorder()
+        cls.addClassCleanup(cls._write_report)
+
+    @classmethod
+    def _write_report(cls):
+        if cls.recorder.results:
+            _logger.info('Informe de rendimiento de Zoom: %s', cls.recorder.write())
+
+    def _query_count(self):
+        return self.env.cr.sql_log_count
+
+    @contextmanager
+    def _isolated(self, **server_options):
+        """Servidor Zoom propio y base de datos restaurada al terminar"""
+        savepoint = self.env.cr.savepoint(flush=False)
+        try:
+            with FakeZoomServer(**server_options) as server:
+                self._configure_fake_zoom(server)
+                yield server
+        finally:
+            self.env.flush_all()
+            savepoint.close(rollback=True)
+            self.env.invalidate_all(flush=False)
+
+    def _measure(self, scenario, size, server):
+        self.env.flush_all()
+        return self.recorder.measure(scenario, size, self._query_count, server.request_count)
+
+    def _seed_meetings(self, size, **vals):
+        Meeting = self.env['zoom.meeting'].with_context(zoom_skip_calendar_sync=True)
+        statuses = ['scheduled', 'active', 'finished', 'cancelled']
+        start = fields.Datetime.now() - timedelta(days=30)
+        meetings = Meeting.browse()
+        for offset in range(0, size, 1000):
+            meetings |= Meeting.create([dict({
+                'name': f'Reunión {index}',
+                'start_time': start + timedelta(minutes=index),
+                'duration': 30,
+                'status': statuses[index % len(statuses)],
+                'meeting_id': str(1000000 + index),
+            }, **vals) for index in range(offset, min(size, offset + 1000))])
+        return meetings
+
+    def test_benchmark_sync(self):
+        """Rendimiento: sincronización automática de reuniones desde Zoom"""
+        SyncRun = self.env['zoom.sync.run']
+        for size in benchmark_sizes():
+            with self.subTest(size=size), self._isolated(meetings_per_user=size, participants_per_meeting=0,
+                                                         recording_every=0) as server:
+                with self._measure('sync', size, server) as extra:
+                    batches = 0
+                    while batches <= size:
+                        self.env['zoom.config']._sync_meetings_automatically()
+                        batches += 1
+                        if not SyncRun.search_count([('config_id', '=', self.config.id), ('state', '=', 'running')]):
+                            break
+                    self.env.flush_all()
+                    extra['batches'] = batches
+                zoom_ids = [str(1000000 + index) for index in range(size)]
+                self.assertEqual(self.env['zoom.meeting'].search_count([('meeting_id', 'in', zoom_ids)]), size)
+
+    def test_benchmark_reminders(self):
+        """Rendimiento: envío de recordatorios automáticos"""
+        self.config.reminder_offsets = '60'
+        for size in benchmark_sizes():
+            with self.subTest(size=size), self._isolated(users=0) as server:
+                meetings = self._seed_meetings(size, status='scheduled',
+                                               start_time=fields.Datetime.now() + timedelta(minutes=40))
+                attendees = self.env['zoom.meeting.attendee'].create([{
+                    'meeting_id': meeting.id,
+                    'name': f'Asistente {meeting.id}',
+                    'email': f'asistente{meeting.id}@example.com',
+                    'status': 'confirmed',
+                } for meeting in meetings])
+                with self._measure('reminders', size, server) as extra:
+                    sent = calls = 0
+                    while calls <= size:
+                        calls += 1
+                        batch = self.env['zoom.meeting']._send_automatic_reminders()
+                        if not batch:
+                            break
+                        sent += batch
+                    self.env.flush_all()
+                    extra['sent'] = sent
+                self.assertEqual(sent, len(attendees))
+
+    def test_benchmark_dashboard(self):
+        """Rendimiento: apertura del dashboard"""
+        Dashboard = self.env['zoom.dashboard']
+        for size in benchmark_sizes():
+            with self.subTest(size=size), self._isolated(users=0) as server:
+                self._seed_meetings(size)
+                self.env.invalidate_all()
+                with self._measure('dashboard', size, server):
+                    values = Dashboard.default_get(list(Dashboard._fields))
+                self.assertEqual(values['total_meetings'], self.env['zoom.meeting'].search_count([]))
+
+    def test_benchmark_helpdesk_cron(self):
+        """Rendimiento: cron de sincronización de tickets de Helpdesk"""
+        team = self.env['helpdesk.team'].create({'name': 'Equipo Rendimiento'})
+        Ticket = self.env['helpdesk.ticket']
+        pending = [
+            ('zoom_created', '=', True),
+            ('meeting_status', 'in', ['scheduled', 'in_progress']),
+            ('last_sync', '=', False),
+        ]
+        for size in benchmark_sizes():
+            with self.subTest(size=size), self._isolated(meetings_per_user=size, participants_per_meeting=3) as server:
+                tickets = Ticket.browse()
+                for offset in range(0, size, 1000):
+                    tickets |= Ticket.create([{
+                        'name': f'Ticket {index}',
+                        'team_id': team.id,
+                    } for index in range(offset, min(size, offset + 1000))])
+                for index, ticket in enumerate(tickets):
+                    ticket.write({'zoom_meeting_id': str(1000000 + index), 'zoom_created': True})
+                with self._measure('helpdesk_cron', size, server) as extra:
+                    calls = 0
+                    while calls <= size and Ticket.search_count(pending):
+                        Ticket._cron_sync_zoom_meetings()
+                        calls += 1
+                    self.env.flush_all()
+                    extra['calls'] = calls
+                self.assertFalse(Ticket.search_count(pending))
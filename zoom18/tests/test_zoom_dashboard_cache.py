@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+
+from odoo.tests.common import TransactionCase
+from datetime import datetime, timedelta
+
+from odoo.addons.zoom18.models.zoom_dashboard import ZoomDashboardCache, dashboard_cache
+
+
+class TestZoomDashboardCacheUnit(TransactionCase):
+    """Tests para la caché del resumen del dashboard"""
+
+    def test_ttl_expires(self):
+        """Test: Pasado el TTL se vuelve a calcular"""
+        cache = ZoomDashboardCache(ttl=60)
+        cache.get(('db', 1, None, 'es_ES'), lambda: {'total_meetings': 1})
+
+        self.assertEqual(cache.get(('db', 1, None, 'es_ES'), lambda: {'total_meetings': 2}), {'total_meetings': 1})
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+        expired = ZoomDashboardCache(ttl=0)
+        expired.get(('db', 1, None, 'es_ES'), lambda: {'total_meetings': 1})
+        self.assertEqual(expired.get(('db', 1, None, 'es_ES'), lambda: {'total_meetings': 2}), {'total_meetings': 2})
+
+    def test_invalidate_database(self):
+        """Test: Invalidar una base de datos solo borra sus entradas"""
+        cache = ZoomDashboardCache()
+        cache.get(('db', 1, None, 'es_ES'), dict)
+        cache.get(('db', 2, None, 'es_ES'), dict)
+        cache.get(('otra', 1, None, 'es_ES'), dict)
+
+        cache.invalidate('db')
+
+        self.assertEqual(len(cache), 1)
+
+
+class TestZoomDashboardCache(TransactionCase):
+    """Tests para la invalidación del resumen del dashboard"""
+
+    def setUp(self):
+        super().setUp()
+        self.Dashboard = self.env['zoom.dashboard']
+        self.config = self.env['zoom.config'].get_config()
+        self.meeting = self.env['zoom.meeting'].with_context(zoom_skip_calendar_sync=True).create({
+            'name': 'Reunión del Dashboard',
+            'start_time': datetime.now() + timedelta(hours=2),
+            'duration': 30,
+            'status': 'scheduled',
+        })
+        self.addCleanup(dashboard_cache.invalidate, self.env.cr.dbname)
+
+    def _load(self):
+        return self.Dashboard.default_get(['active_meetings', 'scheduled_meetings', 'connection_status'])
+
+    def _set_status_in_database(self, status):
+        """Cambiar el estado sin pasar por el ORM (como otro worker sin invalidar)"""
+        self.env.flush_all()
+        self.env.cr.execute("UPDATE zoom_meeting SET status = %s WHERE id = %s", [status, self.meeting.id])
+        self.env.invalidate_all()
+
+    def test_second_load_from_cache(self):
+        """Test: La segunda apertura se sirve de la caché"""
+        before = self._load()
+        self._set_status_in_database('active')
+
+        self.assertEqual(self._load(), before)
+
+    def test_meeting_status_invalidates(self):
+        """Test: Cambiar el estado de una reunión se refleja en el dashboard"""
+        before = self._load()
+
+        self.meeting.status = 'active'
+
+        after = self._load()
+        self.assertEqual(after['active_meetings'], before['active_meetings'] + 1)
+        self.assertEqual(after['scheduled_meetings'], before['scheduled_meetings'] - 1)
+
+    def test_other_fields_keep_cache(self):
+        """Test: Los cambios que el dashboard no muestra no invalidan la caché"""
+        before = self._load()
+        self._set_status_in_database('active')
+
+        self.meeting.name = 'Reunión Renombrada'
+
+        self.assertEqual(self._load(), before)
+
+    def test_meeting_unlink_invalidates(self):
+        """Test: Eliminar una reunión se refleja en el dashboard"""
+        before = self._load()
+
+        self.meeting.with_context(zoom_skip_calendar_sync=True).unlink()
+
+        self.assertEqual(self._load()['scheduled_meetings'], before['scheduled_meetings'] - 1)
+
+    def test_config_write_invalidates(self):
+        """Test: Cambiar la configuración se refleja en el dashboard"""
+        self._load()
+
+        self.config.connection_status = 'error'
+
+        self.assertEqual(self._load()['connection_status'], 'error')
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+
+from odoo.tests.common import HttpCase
+
+from odoo.addons.zoom18.controllers.zoom_webhook import sign_webhook
+from odoo.addons.zoom18.models.zoom_client import ZoomUnavailable
+from odoo.addons.zoom18.models.zoom_config import ZOOM_PAGE_SIZE
+from odoo.addons.zoom18.tests.common import FakeZoomServer, ZoomFakeServerCase
+
+
+class TestZoomFakeServer(ZoomFakeServerCase):
+    """Tests contra el servidor Zoom simulado (HTTP real, sin MagicMock)"""
+
+    fake_zoom_options = {'users': 2, 'meetings_per_user': ZOOM_PAGE_SIZE + 20, 'participants_per_meeting': 3}
+
+    def test_token_from_configured_url(self):
+        """Test: El token se pide a token_url una sola vez y se reutiliza"""
+        self.config._zoom_request('GET', '/users')
+        self.config._zoom_request('GET', '/users')
+
+        self.assertTrue(self.config.access_token.startswith('fake-token-'))
+        self.assertEqual(self.zoom_server.request_count('/oauth/token'), 1)
+        self.assertEqual(self.zoom_server.request_count('/v2/users'), 2)
+
+    def test_sync_follows_pagination(self):
+        """Test: La sincronización recorre todas las páginas del servidor"""
+        stats = self.env['zoom.sync.pipeline'].run_sync(self.config, trigger='test')
+
+        self.assertEqual(stats['created'], ZOOM_PAGE_SIZE + 20)
+        self.assertEqual(self.zoom_server.request_count('/v2/users/me/meetings'), 2)
+        self.assertEqual(
+            self.env['zoom.meeting'].search_count([('meeting_id', '=', '1000000')]), 1)
+
+    def test_account_sync_all_hosts(self):
+        """Test: Con alcance de cuenta se descargan las reuniones de cada anfitrión"""
+        self.config.write({'sync_scope': 'account', 'sync_max_workers': 2})
+
+        stats = self.env['zoom.sync.pipeline'].run_sync(self.config, trigger='test')
+
+        self.assertEqual(stats['created'], 2 * (ZOOM_PAGE_SIZE + 20))
+        self.assertEqual(self.zoom_server.request_count('/v2/users/user1/meetings'), 2)
+
+    def test_rate_limit_opens_circuit(self):
+        """Test: Los 429 seguidos abren el circuito y se deja de llamar a Zoom"""
+        self.config._ensure_access_token()
+        threshold = self.config.circuit_failure_threshold
+        self.zoom_server.fail_next(429, count=threshold)
+
+        for _i in range(threshold):
+            self.assertEqual(self.config._zoom_request('GET', '/users').status_code, 429)
+        calls = self.zoom_server.request_count('/v2/')
+        with self.assertRaises(ZoomUnavailable):
+            self.config._zoom_request('GET', '/users')
+
+        self.assertEqual(self.zoom_server.request_count('/v2/'), calls)
+
+    def test_participants_and_recordings(self):
+        """Test: Informe de participantes y grabación desde el servidor simulado"""
+        meeting_id = 1000000
+        meeting = self.env['zoom.meeting'].create({
+            'name': 'Reunión Simulada',
+            'meeting_id': str(meeting_id),
+            'status': 'finished',
+        })
+
+        meeting.action_sync_participants()
+        recording = self.env['zoom.recording']._fetch(self.config, str(meeting_id))
+        url = recording.file_ids[0]._get_download_url()
+
+        self.assertEqual(len(meeting.participant_ids), 3)
+        self.assertEqual(len(recording.file_ids), 2)
+        self.assertIn(f'access_token=download-{meeting_id}-', url)
+
+
+class TestZoomWebhookController(HttpCase):
+    """Tests del endpoint /zoom/webhook con eventos firmados"""
+
+    def setUp(self):
+        super().setUp()
+        self.fake_zoom = FakeZoomServer(users=1, meetings_per_user=2)
+        self.config = self.env['zoom.config'].get_config()
+        self.config.write({
+            'client_id': 'fake_client_id',
+            'client_secret': 'fake_client_secret',
+            'account_id': 'fake_account_id',
+            'connection_status': 'connected',
+            'use_webhooks': True,
+            'webhook_secret': 'secreto',
+        })
+
+    def _post(self, body, headers):
+        return self.url_open('/zoom/webhook', data=body, headers=headers)
+
+    def test_recording_completed_event(self):
+        """Test: recording.completed guarda la grabación con todos sus archivos"""
+        body, headers = self.fake_zoom.recording_completed(1000000, 'secreto')
+
+        response = self._post(body, headers)
+
+        self.assertEqual(response.status_code, 200)
+        recording = self.env['zoom.recording'].search([('zoom_meeting_id', '=', '1000000')])
+        self.assertEqual(len(recording.file_ids), 2)
+
+    def test_invalid_signature_rejected(self):
+        """Test: Un evento con firma de otro secreto se rechaza"""
+        body, headers = self.fake_zoom.recording_completed(1000000, 'otro')
+
+        response = self._post(body, headers)
+
+        self.assertEqual(response.status_code, 401)
+        self.assertFalse(self.env['zoom.recording'].search([('zoom_meeting_id', '=', '1000000')]))
+
+    def test_url_validation(self):
+        """Test: La validación de URL devuelve el token cifrado con el secreto"""
+        body, headers = self.fake_zoom.make_webhook(
+            'endpoint.url_validation', 'secreto', payload={'plainToken': 'abc'})
+
+        response = self._post(body, headers)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {
+            'plainToken': 'abc',
+            'encryptedToken': sign_webhook('secreto', 'abc'),
+        })
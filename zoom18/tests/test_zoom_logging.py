@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+
+import logging
+
+from odoo.tests.common import TransactionCase
+
+from odoo.addons.zoom18.models.zoom_logging import LogBatch, correlation, get_correlation_id, get_logger
+from odoo.addons.zoom18.tests.common import ZoomFakeServerCase
+
+LOGGER_NAME = 'odoo.addons.zoom18.tests.test_zoom_logging'
+
+
+class TestZoomLogging(TransactionCase):
+    """Tests para el logging estructurado de la integración"""
+
+    def setUp(self):
+        super().setUp()
+        self.logger = get_logger(LOGGER_NAME)
+
+    def test_correlation_nested(self):
+        """Test: Un bloque anidado conserva el id de correlación exterior"""
+        self.assertIsNone(get_correlation_id())
+        with correlation('sync') as outer:
+            self.assertTrue(outer.startswith('sync-'))
+            with correlation('outbox') as inner:
+                self.assertEqual(inner, outer)
+            self.assertEqual(get_correlation_id(), outer)
+        self.assertIsNone(get_correlation_id())
+
+    def test_logger_prefix(self):
+        """Test: Las líneas llevan el id de correlación en el mensaje y en extra"""
+        with self.assertLogs(LOGGER_NAME, level='INFO') as logs, correlation() as cid:
+            self.logger.info('Reuniones: %d', 3)
+
+        self.assertEqual(logs.records[0].getMessage(), f'[{cid}] Reuniones: 3')
+        self.assertEqual(logs.records[0].zoom_cid, cid)
+
+    def test_batch_single_line(self):
+        """Test: Un lote escribe una sola línea con el total"""
+        with self.assertLogs(LOGGER_NAME, level='INFO') as logs:
+            with LogBatch(self.logger, 'Eventos creados') as batch:
+                for _i in range(500):
+                    batch.add()
+
+        self.assertEqual(len(logs.records), 1)
+        self.assertTrue(logs.records[0].getMessage().startswith('Eventos creados: 500 en '))
+        self.assertEqual(logs.records[0].zoom_count, 500)
+
+    def test_batch_progress(self):
+        """Test: Los lotes largos escriben progreso como mucho cada intervalo"""
+        with self.assertLogs(LOGGER_NAME, level='INFO') as logs:
+            with LogBatch(self.logger, 'Eventos creados', interval=1e-9) as batch:
+                batch.add(2)
+                batch.add(3)
+
+        messages = [record.getMessage() for record in logs.records]
+        self.assertEqual(len(messages), 3)
+        self.assertTrue(messages[0].endswith('(en curso)'))
+        self.assertTrue(messages[2].startswith('Eventos creados: 5 en '))
+
+    def test_empty_batch_silent(self):
+        """Test: Un lote vacío no escribe nada"""
+        with self.assertNoLogs(LOGGER_NAME, level='INFO'):
+            with LogBatch(self.logger, 'Eventos creados'):
+                pass
+
+    def test_disabled_level_not_formatted(self):
+        """Test: Con el nivel desactivado los argumentos no se formatean"""
+        class Exploding:
+            def __str__(self):
+                raise AssertionError('no debería formatearse')
+
+        logging.getLogger(LOGGER_NAME).setLevel(logging.WARNING)
+        self.addCleanup(logging.getLogger(LOGGER_NAME).setLevel, logging.NOTSET)
+        self.logger.debug('Valor: %s', Exploding())
+
+
+class TestZoomSyncCorrelation(ZoomFakeServerCase):
+    """Tests del id de correlación de las sincronizaciones"""
+
+    fake_zoom_options = {'users': 1, 'meetings_per_user': 3, 'participants_per_meeting': 0}
+
+    def test_sync_run_correlation(self):
+        """Test: La ejecución, sus líneas de log y sus llamadas a Zoom comparten el id"""
+        with self.assertLogs('odoo.addons.zoom18.models.zoom_sync', level='INFO') as sync_logs, \
+                self.assertLogs('odoo.addons.zoom18.models.zoom_client', level='DEBUG') as api_logs:
+            self.env['zoom.sync.pipeline'].run_sync(self.config, trigger='test')
+
+        run = self.env['zoom.sync.run'].search([('config_id', '=', self.config.id)], limit=1)
+        self.assertTrue(run.correlation_id.startswith('sync-'))
+        self.assertTrue(all(record.zoom_cid == run.correlation_id for record in sync_logs.records))
+        calls = [record.getMessage() for record in api_logs.records if 'GET /users/me/meetings' in record.getMessage()]
+        self.assertTrue(calls)
+        self.assertTrue(calls[0].startswith(f'[{run.correlation_id}] Zoom GET'))
+        self.assertIsNone(get_correlation_id())
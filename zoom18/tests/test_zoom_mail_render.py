@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+
+from odoo.tests.common import TransactionCase
+from unittest.mock import patch
+from datetime import datetime, timedelta
+
+from odoo.addons.zoom18.models.zoom_mail_render import ZoomRenderCache, render_cache
+
+
+class TestZoomRenderCache(TransactionCase):
+    """Tests para la LRU de valores de reunión"""
+
+    def test_lru_evicts_least_recently_used(self):
+        """Test: Al llenarse se descarta la entrada menos usada"""
+        cache = ZoomRenderCache(max_size=2)
+        cache.get(('db', 1, 1, None), lambda: 'a')
+        cache.get(('db', 1, 2, None), lambda: 'b')
+        cache.get(('db', 1, 1, None), lambda: 'a2')
+        cache.get(('db', 1, 3, None), lambda: 'c')
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.get(('db', 1, 1, None), lambda: 'nuevo'), 'a')
+        self.assertEqual(cache.get(('db', 1, 2, None), lambda: 'nuevo'), 'nuevo')
+
+    def test_invalidate_meeting(self):
+        """Test: Invalidar una reunión solo borra sus entradas"""
+        cache = ZoomRenderCache()
+        cache.get(('db', 1, 1, None), lambda: 'a')
+        cache.get(('db', 1, 2, None), lambda: 'b')
+
+        cache.invalidate('db', [1])
+
+        self.assertEqual(len(cache), 1)
+
+
+class TestZoomMailRender(TransactionCase):
+    """Tests para el renderizado de plantillas con valores de reunión en caché"""
+
+    def setUp(self):
+        super().setUp()
+        self.meeting = self.env['zoom.meeting'].create({
+            'name': 'Oleada de Invitaciones',
+            'start_time': datetime.now() + timedelta(days=2),
+            'duration': 45,
+            'join_url': 'https://zoom.us/j/123',
+            'meeting_id': '123',
+        })
+        self.attendees = self.env['zoom.meeting.attendee'].create([{
+            'meeting_id': self.meeting.id,
+            'name': f'Invitado {index}',
+            'email': f'invitado{index}@example.com',
+        } for index in range(20)])
+        self.template = self.env.ref('zoom18.email_template_meeting_invitation')
+
+    def test_meeting_values_computed_once_per_template(self):
+        """Test: Los datos de la reunión se calculan una vez para todos los asistentes"""
+        Meeting = type(self.meeting)
+        original = Meeting._get_mail_render_values
+        calls = []
+
+        def counting(meeting):
+            calls.append(meeting.id)
+            return original(meeting)
+
+        render_cache.invalidate(self.env.cr.dbname, self.meeting.ids)
+        with patch.object(Meeting, '_get_mail_render_values', counting):
+            subjects = self.template._render_field('subject', self.attendees.ids)
+            bodies = self.template._render_field('body_html', self.attendees.ids)
+
+        self.assertEqual(calls, [self.meeting.id])
+        self.assertEqual(set(subjects.values()), {'Invitación a Reunión: Oleada de Invitaciones'})
+        self.assertIn('Invitado 7', bodies[self.attendees[7].id])
+        self.assertIn('https://zoom.us/j/123', bodies[self.attendees[7].id])
+
+    def test_meeting_write_invalidates_values(self):
+        """Test: Un cambio en la reunión se refleja aunque el write_date no cambie"""
+        attendee = self.attendees[0]
+        self.template._render_field('subject', attendee.ids)
+
+        self.meeting.name = 'Reunión Renombrada'
+
+        subject = self.template._render_field('subject', attendee.ids)[attendee.id]
+        self.assertEqual(subject, 'Invitación a Reunión: Reunión Renombrada')
+
+    def test_invitations_sent_in_one_batch(self):
+        """Test: Crear varios asistentes envía las invitaciones en un solo lote"""
+        calls = []
+        send_mail_batch = type(self.template).send_mail_batch
+
+        def spy(template, res_ids, *args, **kwargs):
+            calls.append(list(res_ids))
+            return send_mail_batch(template, res_ids, *args, **kwargs)
+
+        with patch.object(type(self.template), 'send_mail_batch', spy):
+            new_attendees = self.env['zoom.meeting.attendee'].create([{
+                'meeting_id': self.meeting.id,
+                'email': f'nuevo{index}@example.com',
+            } for index in range(5)])
+
+        self.assertEqual(calls, [new_attendees.ids])
+        self.assertTrue(all(new_attendees.mapped('invitation_sent')))
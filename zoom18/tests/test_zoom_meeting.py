@@ -271,3 +271,49 @@ class TestZoomMeeting(TransactionCase):
     def tearDown(self):
         super().tearDown()
         # Limpiar datos de test si es necesario
+
+
+class TestZoomMeetingSummary(TransactionCase):
+    """Tests para el envío del resumen de la reunión"""
+
+    def setUp(self):
+        super().setUp()
+        project = self.env['project.project'].create({'name': 'Proyecto Resumen'})
+        task = self.env['project.task'].create({'name': 'Tarea Resumen', 'project_id': project.id})
+        self.meeting = self.env['zoom.meeting'].with_context(zoom_skip_calendar_sync=True).create({
+            'name': 'Reunión con Resumen',
+            'start_time': datetime.now() - timedelta(hours=2),
+            'duration': 60,
+            'task_id': task.id,
+            'meeting_summary': 'Acuerdos <b>clave</b>',
+        })
+        self.env['zoom.meeting.attendee'].create([{
+            'meeting_id': self.meeting.id,
+            'name': f'Asistente {index}',
+            'email': f'asistente{index}@example.com',
+        } for index in range(3)])
+        self.meeting.attendee_ids.write({'status': 'attended'})
+
+    def test_send_meeting_summary_batch(self):
+        """Test: El resumen se renderiza en bloque y se encola con un solo create"""
+        meeting = self.meeting
+        templates_before = self.env['mail.template'].search_count([])
+
+        MailMail = type(self.env['mail.mail'])
+        create_calls = []
+        original_create = MailMail.create
+
+        def create(model, vals_list):
+            create_calls.append(vals_list if isinstance(vals_list, list) else [vals_list])
+            return original_create(model, vals_list)
+
+        with patch.object(MailMail, 'create', create):
+            meeting.action_send_meeting_summary()
+
+        self.assertEqual(len(create_calls), 1)
+        self.assertEqual(
+            sorted(vals['email_to'] for vals in create_calls[0]),
+            sorted(meeting.attendee_ids.mapped('email')),
+        )
+        self.assertIn('Acuerdos &lt;b&gt;clave&lt;/b&gt;', create_calls[0][0]['body_html'])
+        self.assertEqual(self.env['mail.template'].search_count([]), templates_before)
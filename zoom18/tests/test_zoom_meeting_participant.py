@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+
+from odoo import fields
+from odoo.exceptions import UserError
+from odoo.tests.common import TransactionCase
+from unittest.mock import patch
+from datetime import datetime, timedelta
+
+from odoo.addons.zoom18.models.zoom_client import ZoomUnavailable
+
+
+class TestZoomMeetingParticipant(TransactionCase):
+    """Tests para la importación del informe de participantes"""
+
+    def setUp(self):
+        super().setUp()
+        self.config = self.env['zoom.config'].get_config()
+        self.config.write({
+            'client_id': 'test_client_id',
+            'client_secret': 'test_client_secret',
+            'account_id': 'test_account_id',
+            'access_token': 'test_token',
+            'token_expires': datetime.now() + timedelta(hours=1),
+        })
+        self.meeting = self.env['zoom.meeting'].create({
+            'name': 'Reunión con Informe',
+            'start_time': datetime(2025, 3, 1, 10, 0),
+            'duration': 60,
+            'status': 'finished',
+            'meeting_id': '987654321',
+        })
+        self.ana, self.luis, self.eva = self.env['zoom.meeting.attendee'].create([
+            {'meeting_id': self.meeting.id, 'name': 'Ana', 'email': 'Ana@Example.com'},
+            {'meeting_id': self.meeting.id, 'name': 'Luis', 'email': 'luis@example.com'},
+            {'meeting_id': self.meeting.id, 'name': 'Eva', 'email': 'eva@example.com'},
+        ])
+        (self.ana | self.luis | self.eva).write({'status': 'confirmed'})
+        self.report = [
+            {'id': 'p1', 'name': 'Ana', 'user_email': ' ana@example.COM ',
+             'join_time': '2025-03-01T10:01:00Z', 'leave_time': '2025-03-01T10:20:00Z', 'duration': 1140},
+            {'id': 'p1', 'name': 'Ana', 'user_email': 'ana@example.com',
+             'join_time': '2025-03-01T10:25:00Z', 'leave_time': '2025-03-01T11:00:00Z', 'duration': 2100},
+            {'id': 'p2', 'name': 'Luis', 'user_email': 'luis@example.com',
+             'join_time': '2025-03-01T10:00:00Z', 'leave_time': '2025-03-01T10:58:00Z', 'duration': 3480},
+            {'id': 'p3', 'name': 'Invitado Externo', 'user_email': '',
+             'join_time': '2025-03-01T10:05:00Z', 'leave_time': '2025-03-01T10:30:00Z', 'duration': 1500},
+        ]
+
+    def test_ingest_matches_attendees_by_email(self):
+        """Test: Se empareja por email normalizado y se marca la asistencia"""
+        rows = self.env['zoom.meeting.participant']._ingest(self.meeting, self.report)
+
+        self.assertEqual(len(rows), 4)
+        self.assertEqual(rows.filtered(lambda r: r.name == 'Ana').attendee_id, self.ana)
+        self.assertEqual(self.ana.status, 'attended')
+        self.assertEqual(self.luis.status, 'attended')
+        self.assertEqual(self.eva.status, 'no_show')
+        self.assertEqual(self.meeting.actual_participants, 3)
+        self.assertEqual(self.meeting.actual_start_time, datetime(2025, 3, 1, 10, 0))
+        self.assertEqual(self.meeting.actual_end_time, datetime(2025, 3, 1, 11, 0))
+
+    def test_ingest_is_idempotent(self):
+        """Test: Importar dos veces el mismo informe no duplica filas"""
+        Participant = self.env['zoom.meeting.participant']
+        Participant._ingest(self.meeting, self.report)
+        Participant._ingest(self.meeting, self.report)
+
+        self.assertEqual(len(self.meeting.participant_ids), 4)
+        self.assertEqual(self.meeting.actual_participants, 3)
+
+    def test_fetch_report_pages_and_falls_back(self):
+        """Test: Se recorren todas las páginas y, sin informe de cuenta, se usa past_meetings"""
+        paths = []
+
+        def fake_pages(config, path, items_key, params=None, page_token=None):
+            paths.append(path)
+            if path.startswith('/report/'):
+                raise UserError('Informe no disponible')
+            yield self.report[:2], 'token'
+            yield self.report[2:], None
+
+        with patch.object(type(self.config), '_zoom_get_pages', fake_pages):
+            self.meeting.action_sync_participants()
+
+        self.assertEqual(paths, [
+            '/report/meetings/987654321/participants',
+            '/past_meetings/987654321/participants',
+        ])
+        self.assertEqual(len(self.meeting.participant_ids), 4)
+
+    def test_participants_job_retries_when_zoom_down(self):
+        """Test: El trabajo del informe se reprograma si Zoom no está disponible"""
+        job = self.env['zoom.scheduled.job'].search([
+            ('meeting_id', '=', self.meeting.id),
+            ('job_type', '=', 'participants'),
+        ])
+        self.assertFalse(job, 'Las reuniones antiguas no piden informe')
+
+        self.meeting.write({
+            'start_time': fields.Datetime.now() - timedelta(hours=2),
+            'status': 'active',
+        })
+        self.meeting.status = 'finished'
+        job = self.env['zoom.scheduled.job'].search([
+            ('meeting_id', '=', self.meeting.id),
+            ('job_type', '=', 'participants'),
+        ])
+        self.assertEqual(job.state, 'pending')
+
+        def unavailable(config, path, items_key, params=None, page_token=None):
+            raise ZoomUnavailable('Zoom caído')
+
+        with patch.object(type(self.config), '_zoom_get_pages', unavailable):
+            self.env['zoom.scheduled.job']._run_due_jobs()
+
+        self.assertEqual(job.state, 'pending')
+        self.assertGreater(job.due_at, fields.Datetime.now())
+
+        with patch.object(type(self.config), '_zoom_get_pages', lambda *args, **kwargs: iter([(self.report, None)])):
+            job.due_at = fields.Datetime.now() - timedelta(minutes=1)
+            self.env['zoom.scheduled.job']._run_due_jobs()
+
+        self.assertEqual(job.state, 'done')
+        self.assertEqual(self.ana.status, 'attended')
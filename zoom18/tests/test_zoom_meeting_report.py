@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+
+from odoo.tests.common import TransactionCase
+from datetime import datetime, timedelta
+
+
+class TestZoomMeetingReport(TransactionCase):
+    """Tests para el análisis diario de reuniones"""
+
+    def setUp(self):
+        super().setUp()
+        self.Meeting = self.env['zoom.meeting'].with_context(zoom_skip_calendar_sync=True)
+        self.Daily = self.env['zoom.meeting.daily']
+        self.Report = self.env['zoom.meeting.report']
+        self.project = self.env['project.project'].create({'name': 'Proyecto Análisis'})
+        self.task = self.env['project.task'].create({'name': 'Tarea Análisis', 'project_id': self.project.id})
+        self.day = datetime(2030, 3, 4, 10, 0)
+
+    def _meeting(self, start, status='finished', attendees=(), **vals):
+        meeting = self.Meeting.create(dict({
+            'name': 'Reunión Análisis',
+            'start_time': start,
+            'duration': 60,
+            'task_id': self.task.id,
+            'status': status,
+        }, **vals))
+        created = self.env['zoom.meeting.attendee'].create([{
+            'meeting_id': meeting.id,
+            'email': f'asistente{index}@example.com',
+        } for index in range(len(attendees))])
+        # La invitación los deja como invitados
+        for attendee, attendee_status in zip(created, attendees):
+            attendee.status = attendee_status
+        return meeting
+
+    def _commit(self):
+        """Ejecutar los recálculos pendientes, como al confirmar la transacción"""
+        self.env.cr.flush()
+
+    def _rows(self, **domain):
+        return self.Daily.search([('project_id', '=', self.project.id)] + [
+            (fname, '=', value) for fname, value in domain.items()
+        ])
+
+    def test_meetings_aggregated_per_day_and_status(self):
+        """Test: Una fila por día y estado con reuniones, minutos y asistentes"""
+        self._meeting(self.day, attendees=['attended', 'no_show'],
+                      actual_start_time=self.day, actual_end_time=self.day + timedelta(minutes=45))
+        self._meeting(self.day + timedelta(hours=3), attendees=['attended'])
+        self._meeting(self.day, status='cancelled')
+        self._commit()
+
+        finished = self._rows(status='finished')
+        self.assertEqual(finished.date, self.day.date())
+        self.assertEqual(finished.meeting_count, 2)
+        self.assertEqual(finished.scheduled_minutes, 120)
+        self.assertEqual((finished.actual_minutes, finished.held_scheduled_minutes), (45, 60))
+        self.assertEqual((finished.invited_count, finished.attended_count, finished.no_show_count), (3, 2, 1))
+        self.assertEqual(self._rows(status='cancelled').meeting_count, 1)
+
+    def test_status_change_moves_meeting(self):
+        """Test: Cambiar el estado mueve la reunión de fila"""
+        meeting = self._meeting(self.day, status='scheduled')
+        self._commit()
+
+        meeting.status = 'finished'
+        self._commit()
+
+        self.assertFalse(self._rows(status='scheduled'))
+        self.assertEqual(self._rows(status='finished').meeting_count, 1)
+
+    def test_start_time_change_recomputes_both_days(self):
+        """Test: Cambiar el inicio recalcula el día de origen y el de destino"""
+        meeting = self._meeting(self.day)
+        self._commit()
+
+        meeting.start_time = self.day + timedelta(days=1)
+        self._commit()
+
+        self.assertEqual(self._rows().mapped('date'), [(self.day + timedelta(days=1)).date()])
+
+    def test_attendee_changes_recomputed(self):
+        """Test: Los cambios de los asistentes actualizan la asistencia"""
+        meeting = self._meeting(self.day, attendees=['confirmed', 'confirmed'])
+        self._commit()
+
+        meeting.attendee_ids[0].status = 'attended'
+        meeting.attendee_ids[1].unlink()
+        self._commit()
+
+        row = self._rows()
+        self.assertEqual((row.invited_count, row.confirmed_count, row.attended_count), (1, 0, 1))
+
+    def test_task_project_change(self):
+        """Test: Mover la tarea a otro proyecto mueve sus reuniones"""
+        self._meeting(self.day)
+        self._commit()
+        other = self.env['project.project'].create({'name': 'Otro Proyecto'})
+
+        self.task.project_id = other
+        self._commit()
+
+        self.assertFalse(self._rows())
+        self.assertEqual(self.Daily.search([('project_id', '=', other.id)]).meeting_count, 1)
+
+    def test_meeting_unlink(self):
+        """Test: Eliminar la reunión elimina su fila"""
+        meeting = self._meeting(self.day)
+        self._commit()
+
+        meeting.unlink()
+        self._commit()
+
+        self.assertFalse(self._rows())
+
+    def test_rebuild_matches_incremental(self):
+        """Test: Recalcular la tabla entera da el mismo resultado que el mantenimiento incremental"""
+        self._meeting(self.day, attendees=['attended', 'declined'])
+        self._meeting(self.day + timedelta(days=2), status='scheduled', attendees=['invited'])
+        self._commit()
+        fnames = ['date', 'status', 'meeting_count', 'scheduled_minutes', 'invited_count',
+                  'declined_count', 'attended_count']
+        incremental = self._rows().read(fnames, load=None)
+
+        self.Daily._refresh()
+
+        rebuilt = self._rows().read(fnames, load=None)
+        strip = lambda rows: sorted((tuple(row[fname] for fname in fnames) for row in rows), key=str)
+        self.assertEqual(strip(rebuilt), strip(incremental))
+
+    def test_report_rates_from_group_totals(self):
+        """Test: Las tasas de un grupo se calculan con sus totales, no como media de días"""
+        self._meeting(self.day, attendees=['attended'])
+        self._meeting(self.day + timedelta(days=1), attendees=['no_show', 'no_show', 'no_show'])
+        self._commit()
+
+        [(meetings, hours, attendance, no_show)] = self.Report._read_group(
+            [('project_id', '=', self.project.id)],
+            aggregates=['meeting_count:sum', 'scheduled_hours:sum', 'attendance_rate:avg', 'no_show_rate:avg'],
+        )
+
+        self.assertEqual(meetings, 2)
+        self.assertAlmostEqual(hours, 2.0)
+        self.assertAlmostEqual(attendance, 25.0)
+        self.assertAlmostEqual(no_show, 75.0)
+
+    def test_report_grouped_by_week(self):
+        """Test: El informe agrupa por semana y anfitrión"""
+        host = self.env['zoom.host'].create({
+            'config_id': self.env['zoom.config'].get_config().id,
+            'zoom_user_id': 'host-analisis',
+            'email': 'host-analisis@example.com',
+        })
+        self._meeting(self.day, host_id=host.id)
+        self._meeting(self.day + timedelta(days=1), host_id=host.id)
+        self._commit()
+
+        groups = self.Report._read_group(
+            [('host_id', '=', host.id)], groupby=['date:week', 'host_id'], aggregates=['meeting_count:sum'])
+
+        self.assertEqual([(host_group, count) for _week, host_group, count in groups], [(host, 2)])
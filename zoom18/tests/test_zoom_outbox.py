@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+
+from odoo import fields
+from odoo.exceptions import UserError
+from odoo.tests.common import TransactionCase
+from unittest.mock import patch, MagicMock
+from datetime import datetime, timedelta
+
+from odoo.addons.zoom18.models.zoom_client import ZoomCircuitBreaker, CIRCUIT_HALF_OPEN
+
+
+class TestZoomCircuitBreaker(TransactionCase):
+    """Tests para el circuit breaker del cliente de Zoom"""
+
+    def test_breaker_opens_after_consecutive_failures(self):
+        """Test: El circuito se abre tras los fallos configurados"""
+        breaker = ZoomCircuitBreaker(failure_threshold=2, reset_timeout=60)
+        breaker.record_failure()
+        self.assertTrue(breaker.allow_request())
+
+        breaker.record_failure()
+        self.assertTrue(breaker.is_open())
+        self.assertFalse(breaker.allow_request())
+
+    def test_breaker_half_open_probe(self):
+        """Test: Tras la espera solo pasa una llamada de prueba"""
+        breaker = ZoomCircuitBreaker(failure_threshold=1, reset_timeout=0)
+        breaker.record_failure()
+
+        self.assertEqual(breaker.state, CIRCUIT_HALF_OPEN)
+        self.assertTrue(breaker.allow_request())
+        self.assertFalse(breaker.allow_request())
+
+        breaker.record_success()
+        self.assertFalse(breaker.is_open())
+        self.assertTrue(breaker.allow_request())
+
+
+class TestZoomOutbox(TransactionCase):
+    """Tests para el outbox transaccional de escrituras en Zoom"""
+
+    def setUp(self):
+        super().setUp()
+        self.config = self.env['zoom.config'].get_config()
+        self.config.write({
+            'client_id': 'test_client_id',
+            'client_secret': 'test_client_secret',
+            'account_id': 'test_account_id',
+            'access_token': 'test_token',
+            'token_expires': datetime.now() + timedelta(hours=1),
+        })
+        self.breaker = self.config._get_circuit_breaker()
+        self.addCleanup(self.breaker.reset)
+        self.meeting = self.env['zoom.meeting'].create({
+            'name': 'Reunión en Cola',
+            'start_time': datetime.now() + timedelta(days=1),
+            'duration': 30,
+        })
+
+    def _open_circuit(self):
+        for _i in range(self.config.circuit_failure_threshold):
+            self.breaker.record_failure()
+
+    def test_cancel_is_queued_while_zoom_is_down(self):
+        """Test: Con el circuito abierto la cancelación no llama a Zoom y queda en cola"""
+        self.meeting.write({'meeting_id': '555', 'zoom_created': True})
+        self._open_circuit()
+
+        with patch('requests.delete') as mock_delete:
+            self.meeting.action_cancel_meeting()
+
+        mock_delete.assert_not_called()
+        self.assertEqual(self.meeting.status, 'cancelled')
+        entry = self.env['zoom.outbox'].search([('res_id', '=', self.meeting.id), ('res_model', '=', 'zoom.meeting')])
+        self.assertEqual(entry.operation, 'delete_meeting')
+        self.assertEqual(entry.state, 'pending')
+
+    def _zoom_response(self, status_code, data=None):
+        response = MagicMock()
+        response.status_code = status_code
+        response.content = b'{}' if data else b''
+        response.text = str(data)
+        response.json.return_value = data or {}
+        return response
+
+    def _outbox_entries(self, record):
+        return self.env['zoom.outbox'].search([('res_model', '=', record._name), ('res_id', '=', record.id)])
+
+    def test_create_is_sent_after_commit(self):
+        """Test: El alta no llama a Zoom en la transacción y se envía al despachar"""
+        with patch('requests.post') as mock_post:
+            self.assertEqual(self.meeting.create_zoom_meeting(), {})
+            self.meeting.create_zoom_meeting()
+        mock_post.assert_not_called()
+        self.assertFalse(self.meeting.zoom_created)
+        entry = self._outbox_entries(self.meeting)
+        self.assertEqual(len(entry), 1, 'Encolar dos veces la misma alta no debe duplicarla')
+
+        response = self._zoom_response(201, {'id': 777, 'join_url': 'https://zoom.us/j/777', 'start_url': 'https://zoom.us/s/777'})
+        with patch('requests.post', return_value=response) as mock_post:
+            self.env['zoom.outbox']._dispatch(ids=entry.ids)
+            self.env['zoom.outbox']._dispatch(ids=entry.ids)
+
+        self.assertEqual(mock_post.call_count, 1)
+        self.assertEqual(self.meeting.meeting_id, '777')
+        self.assertTrue(self.meeting.zoom_created)
+        self.assertEqual(entry.state, 'done')
+
+    def test_failed_send_is_retried_with_backoff(self):
+        """Test: Un error transitorio de Zoom programa un reintento posterior"""
+        self.meeting.create_zoom_meeting()
+        entry = self._outbox_entries(self.meeting)
+
+        with patch('requests.post', return_value=self._zoom_response(503, {'message': 'unavailable'})):
+            self.env['zoom.outbox']._dispatch(ids=entry.ids)
+
+        self.assertEqual(entry.state, 'pending')
+        self.assertEqual(entry.attempts, 1)
+        self.assertGreater(entry.next_attempt, fields.Datetime.now())
+
+    def test_token_error_is_retried_with_backoff(self):
+        """Test: Un error al obtener el token no escapa del despacho y programa un reintento"""
+        self.meeting.create_zoom_meeting()
+        entry = self._outbox_entries(self.meeting)
+
+        with patch.object(type(self.config), '_get_api_headers', side_effect=UserError('Token no válido')), \
+                patch('requests.post') as mock_post:
+            self.env['zoom.outbox']._dispatch(ids=entry.ids)
+
+        mock_post.assert_not_called()
+        self.assertEqual(entry.state, 'pending')
+        self.assertEqual(entry.attempts, 1)
+        self.assertEqual(entry.last_error, 'Token no válido')
+
+    def test_task_meeting_queues_outbox(self):
+        """Test: Crear la reunión desde la tarea encola el alta en Zoom y crea un solo evento"""
+        project = self.env['project.project'].create({'name': 'Proyecto Zoom'})
+        task = self.env['project.task'].create({'name': 'Tarea Zoom', 'project_id': project.id})
+
+        action = task.action_create_zoom_meeting()
+
+        meeting = self.env['zoom.meeting'].browse(action['res_id'])
+        self.assertEqual(meeting.task_id, task)
+        self.assertEqual(self.env['calendar.event'].search_count([('zoom_meeting_id', '=', meeting.id)]), 1)
+        self.assertEqual(self._outbox_entries(meeting).operation, 'create_meeting')
+        self.assertFalse(meeting.meeting_id)
+
+    def test_cancel_before_send_voids_create(self):
+        """Test: Cancelar una reunión cuya alta no se envió anula el alta"""
+        self.meeting.create_zoom_meeting()
+        self.meeting.action_cancel_meeting()
+
+        entries = self._outbox_entries(self.meeting)
+        self.assertEqual(entries.mapped('state'), ['cancelled'])
+
+    def test_unlink_calendar_events_batches_zoom_deletes(self):
+        """Test: Borrar eventos en bloque encola todas las bajas y elimina las reuniones"""
+        meetings = self.env['zoom.meeting'].create([{
+            'name': f'Serie {index}',
+            'start_time': datetime.now() + timedelta(days=index + 1),
+            'duration': 30,
+            'meeting_id': str(9000 + index),
+            'zoom_created': True,
+        } for index in range(3)])
+        events = meetings.calendar_event_id
+        self.assertEqual(len(events), 3)
+
+        events.unlink()
+
+        self.assertFalse(meetings.exists())
+        entries = self.env['zoom.outbox'].search([('operation', '=', 'delete_meeting'), ('res_id', 'in', meetings.ids)])
+        self.assertEqual(sorted(entries.mapped('path')), ['/meetings/9000', '/meetings/9001', '/meetings/9002'])
+
+        with patch('requests.delete', return_value=self._zoom_response(204)) as mock_delete:
+            self.env['zoom.outbox']._dispatch(ids=entries.ids)
+
+        self.assertEqual(mock_delete.call_count, 3)
+        self.assertEqual(set(entries.mapped('state')), {'done'})
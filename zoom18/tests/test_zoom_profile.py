@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+
+from odoo import fields
+from datetime import timedelta
+
+from odoo.addons.zoom18.tests.common import ZoomFakeServerCase
+
+
+class TestZoomProfile(ZoomFakeServerCase):
+    """Tests para el perfilado de las acciones de Zoom"""
+
+    fake_zoom_options = {'users': 1, 'meetings_per_user': 3, 'participants_per_meeting': 0}
+
+    def setUp(self):
+        super().setUp()
+        self.Profile = self.env['zoom.profile']
+        # La configuración de perfilado está en caché: no dejarla activa para otros tests
+        self.addCleanup(self.env.registry.clear_cache)
+
+    def _enable(self, **vals):
+        self.config.write(dict({'profiling_enabled': True}, **vals))
+
+    def test_disabled_by_default(self):
+        """Test: Sin activar el perfilado no se guarda ningún perfil"""
+        self.env['zoom.config']._sync_meetings_automatically()
+
+        self.assertFalse(self.Profile.search([]))
+
+    def test_cron_profile(self):
+        """Test: El cron de sincronización guarda tiempos SQL y llamadas a Zoom"""
+        self._enable()
+
+        self.env['zoom.config']._sync_meetings_automatically()
+
+        profile = self.Profile.search([])
+        self.assertEqual(len(profile), 1)
+        self.assertEqual(profile.name, 'zoom.config._sync_meetings_automatically')
+        self.assertEqual(profile.config_id, self.config)
+        self.assertGreater(profile.sql_count, 0)
+        self.assertTrue(profile.sql_details)
+        self.assertGreater(profile.http_count, 0)
+        self.assertIn('GET /users/me/meetings', profile.http_details)
+        self.assertGreaterEqual(profile.duration_ms, profile.sql_time_ms)
+        self.assertFalse(profile.python_stats)
+        self.assertEqual(self.config.profile_count, 1)
+
+    def test_instant_meeting_profile(self):
+        """Test: Crear una reunión instantánea guarda su llamada a Zoom"""
+        self._enable()
+        meeting = self.env['zoom.meeting'].with_context(zoom_skip_calendar_sync=True).create({
+            'name': 'Reunión Instantánea',
+            'start_time': fields.Datetime.now() + timedelta(hours=1),
+            'duration': 30,
+        })
+
+        meeting.create_instant_meeting()
+
+        profile = self.Profile.search([('name', '=', 'zoom.meeting.create_instant_meeting')])
+        self.assertIn('POST /users/me/meetings', profile.http_details)
+
+    def test_nested_actions_single_profile(self):
+        """Test: Las acciones perfiladas dentro de otra no se perfilan aparte"""
+        self._enable()
+
+        self.env['zoom.dashboard'].create({}).action_sync_meetings()
+
+        self.assertEqual(self.Profile.search([]).mapped('name'), ['zoom.dashboard.action_sync_meetings'])
+
+    def test_python_stats(self):
+        """Test: Con cProfile se guardan las funciones de Python más costosas"""
+        self._enable(profiling_python=True)
+
+        self.env['zoom.config']._sync_meetings_automatically()
+
+        self.assertIn('function calls', self.Profile.search([]).python_stats)
+
+    def test_min_duration_and_sampling(self):
+        """Test: No se guardan las acciones rápidas ni las que quedan fuera del muestreo"""
+        self._enable(profiling_min_duration=3600 * 1000)
+        self.env['zoom.config']._sync_meetings_automatically()
+        self.assertFalse(self.Profile.search([]))
+
+        self.config.write({'profiling_min_duration': 0, 'profiling_sample_rate': 0})
+        self.env['zoom.config']._sync_meetings_automatically()
+        self.assertFalse(self.Profile.search([]))
+
+    def test_error_kept(self):
+        """Test: Si la acción falla el perfil se guarda con el error"""
+        self._enable()
+
+        with self.assertRaises(ValueError):
+            with self.Profile._profile('prueba'):
+                self.env.cr.execute('SELECT 1')
+                raise ValueError('fallo')
+
+        profile = self.Profile.search([('name', '=', 'prueba')])
+        self.assertEqual(profile.error, 'ValueError: fallo')
+        self.assertEqual(profile.sql_count, 1)
@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+
+from odoo import fields
+from datetime import timedelta
+
+from odoo.addons.zoom18.tests.common import FakeZoomServer, ZoomQueryBudgetCase
+
+
+class TestZoomQueryCount(ZoomQueryBudgetCase):
+    """Presupuestos de consultas SQL de los caminos críticos
+
+    Cada camino se mide con 2 y 20 registros: las consultas deben quedar por
+    debajo del presupuesto y no crecer con el número de registros.
+    """
+
+    fake_zoom_options = {'users': 0}
+
+    def _fake_zoom(self, **options):
+        server = FakeZoomServer(**options).start()
+        self.addCleanup(server.stop)
+        self._configure_fake_zoom(server)
+        return server
+
+    def _meeting_vals(self, size, **vals):
+        start = fields.Datetime.now() + timedelta(days=1)
+        return [dict({
+            'name': f'Reunión {index}',
+            'start_time': start + timedelta(hours=index),
+            'duration': 30,
+            'status': 'scheduled',
+        }, **vals) for index in range(size)]
+
+    def _create_meetings(self, size, **vals):
+        return self.env['zoom.meeting'].create(self._meeting_vals(size, **vals))
+
+    def test_partners_by_email(self):
+        """Test: Buscar y crear partners por email no depende del número de emails"""
+        def prepare(size):
+            emails = [f'persona{index}@example.com' for index in range(size)]
+            self.env['res.partner'].create([{'name': email, 'email': email} for email in emails[::2]])
+            return emails
+
+        self.assertQueryBudget(10, prepare, self.env['zoom.meeting']._get_partners_by_email)
+
+    def test_meeting_create_with_calendar(self):
+        """Test: Crear reuniones crea sus trabajos y eventos en bloque"""
+        self.assertQueryBudget(50, lambda size: self._meeting_vals(size), self.env['zoom.meeting'].create)
+
+    def test_meeting_write_with_calendar(self):
+        """Test: Reprogramar reuniones actualiza trabajos y eventos en bloque"""
+        new_start = fields.Datetime.now() + timedelta(days=2)
+
+        def run(meetings):
+            meetings.write({'start_time': new_start, 'duration': 45})
+
+        self.assertQueryBudget(50, self._create_meetings, run)
+
+    def test_bulk_attendee_add(self):
+        """Test: Añadir asistentes en bloque envía las invitaciones en un lote"""
+        meeting = self._create_meetings(1)
+
+        def prepare(size):
+            return [{
+                'meeting_id': meeting.id,
+                'name': f'Asistente {index}',
+                'email': f'asistente{index}@example.com',
+            } for index in range(size)]
+
+        self.assertQueryBudget(60, prepare, self.env['zoom.meeting.attendee'].create)
+
+    def test_attendance_stats(self):
+        """Test: Las estadísticas de asistencia se recalculan para todas las reuniones a la vez"""
+        def prepare(size):
+            meetings = self._create_meetings(size)
+            self.env['zoom.meeting.attendee'].create([{
+                'meeting_id': meeting.id,
+                'email': f'asistente{meeting.id}-{index}@example.com',
+            } for meeting in meetings for index in range(3)])
+            return meetings
+
+        def run(meetings):
+            meetings.attendee_ids.write({'status': 'confirmed'})
+            meetings.mapped('attendance_rate')
+
+        self.assertQueryBudget(20, prepare, run)
+
+    def test_task_meeting_stats(self):
+        """Test: Las reuniones de las tareas se cuentan con una consulta para todas"""
+        project = self.env['project.project'].create({'name': 'Proyecto Kanban'})
+
+        def prepare(size):
+            tasks = self.env['project.task'].create([
+                {'name': f'Tarea {index}', 'project_id': project.id} for index in range(size)
+            ])
+            self.env['zoom.meeting'].with_context(zoom_skip_calendar_sync=True).create([
+                dict(vals, task_id=task.id) for task in tasks for vals in self._meeting_vals(2)
+            ])
+            return tasks
+
+        def run(tasks):
+            tasks.mapped('zoom_meeting_count')
+            tasks.mapped('active_zoom_meeting.start_time')
+            tasks.project_id.mapped('zoom_meeting_hours')
+
+        self.assertQueryBudget(10, prepare, run)
+
+    def test_dashboard_load(self):
+        """Test: Abrir el dashboard cuesta lo mismo con pocas o muchas reuniones"""
+        Dashboard = self.env['zoom.dashboard']
+        statuses = ['scheduled', 'active', 'finished', 'cancelled']
+
+        def prepare(size):
+            return self.env['zoom.meeting'].with_context(zoom_skip_calendar_sync=True).create([
+                dict(vals, status=statuses[index % len(statuses)])
+                for index, vals in enumerate(self._meeting_vals(size))
+            ])
+
+        self.assertQueryBudget(20, prepare, lambda meetings: Dashboard.default_get(list(Dashboard._fields)))
+
+    def test_sync_run(self):
+        """Test: Una página de Zoom se sincroniza con un número fijo de consultas"""
+        def prepare(size):
+            return self._fake_zoom(meetings_per_user=size, participants_per_meeting=0, recording_every=0)
+
+        def run(server):
+            self.env['zoom.sync.pipeline'].run_sync(self.config, trigger='test')
+
+        self.assertQueryBudget(60, prepare, run)
+
+    def test_account_sync(self):
+        """Test: La sincronización de cuenta no hace consultas por reunión"""
+        def prepare(size):
+            server = self._fake_zoom(users=2, meetings_per_user=size, participants_per_meeting=0,
+                                     recording_every=0)
+            self.config.write({'sync_scope': 'account', 'sync_max_workers': 2})
+            return server
+
+        def run(server):
+            self.env['zoom.sync.pipeline'].run_sync(self.config, trigger='test')
+
+        self.assertQueryBudget(100, prepare, run)
+
+    def test_sync_cron(self):
+        """Test: El cron de sincronización no hace consultas por reunión"""
+        def prepare(size):
+            return self._fake_zoom(meetings_per_user=size, participants_per_meeting=0, recording_every=0)
+
+        def run(server):
+            self.env['zoom.config']._sync_meetings_automatically()
+
+        self.assertQueryBudget(80, prepare, run)
+
+    def test_participants_sync(self):
+        """Test: El informe de participantes se guarda sin consultas por participante"""
+        def prepare(size):
+            self._fake_zoom(meetings_per_user=1, participants_per_meeting=size, recording_every=0)
+            meeting = self._create_meetings(1, meeting_id='1000000', status='finished')
+            self.env['zoom.meeting.attendee'].create([{
+                'meeting_id': meeting.id,
+                'email': f'asistente{index}@example.com',
+                'status': 'confirmed',
+            } for index in range(size)])
+            return meeting
+
+        self.assertQueryBudget(40, prepare, lambda meeting: meeting.action_sync_participants())
+
+    def test_helpdesk_cron(self):
+        """Test: El cron de Helpdesk tiene un coste fijo por ticket"""
+        team = self.env['helpdesk.team'].create({'name': 'Equipo Consultas'})
+        Ticket = self.env['helpdesk.ticket']
+
+        def prepare(size):
+            self._fake_zoom(meetings_per_user=size, participants_per_meeting=3, recording_every=0)
+            tickets = Ticket.create([{'name': f'Ticket {index}', 'team_id': team.id} for index in range(size)])
+            for index, ticket in enumerate(tickets):
+                ticket.write({'zoom_meeting_id': str(1000000 + index), 'zoom_created': True})
+            return tickets
+
+        # Una llamada a Zoom por ticket: se limita el coste de cada uno
+        self.assertQueryBudget(30, prepare, lambda tickets: Ticket._cron_sync_zoom_meetings(), per_record=30)
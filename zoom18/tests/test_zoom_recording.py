@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+
+from odoo import fields
+from odoo.tests.common import TransactionCase
+from unittest.mock import MagicMock, patch
+from datetime import datetime, timedelta
+
+from odoo.addons.zoom18.controllers.zoom_webhook import sign_webhook, verify_webhook_signature
+from odoo.addons.zoom18.models.zoom_recording import encode_meeting_uuid
+from odoo.addons.zoom18.models.zoom_scheduled_job import RECORDING_RETRY_MINUTES
+
+
+class TestZoomRecording(TransactionCase):
+    """Tests para las grabaciones y sus archivos"""
+
+    def setUp(self):
+        super().setUp()
+        self.config = self.env['zoom.config'].get_config()
+        self.config.write({
+            'client_id': 'test_client_id',
+            'client_secret': 'test_client_secret',
+            'account_id': 'test_account_id',
+            'access_token': 'test_token',
+            'token_expires': datetime.now() + timedelta(hours=1),
+            'connection_status': 'connected',
+        })
+        self.meeting = self.env['zoom.meeting'].create({
+            'name': 'Reunión Grabada',
+            'start_time': fields.Datetime.now() - timedelta(hours=2),
+            'duration': 30,
+            'status': 'finished',
+            'meeting_id': '424242',
+        })
+        self.event_object = {
+            'uuid': 'abc==',
+            'id': 424242,
+            'topic': 'Reunión Grabada',
+            'start_time': '2025-03-01T10:00:00Z',
+            'duration': 30,
+            'total_size': 3500000000,
+            'recording_files': [
+                {'id': 'f1', 'file_type': 'MP4', 'file_extension': 'MP4', 'file_size': 3400000000,
+                 'recording_type': 'shared_screen_with_speaker_view', 'status': 'completed',
+                 'recording_start': '2025-03-01T10:00:00Z', 'recording_end': '2025-03-01T10:30:00Z',
+                 'download_url': 'https://zoom.us/rec/download/f1'},
+                {'id': 'f2', 'file_type': 'M4A', 'file_extension': 'M4A', 'file_size': 100000000,
+                 'recording_type': 'audio_only', 'status': 'completed',
+                 'recording_start': '2025-03-01T10:00:00Z', 'recording_end': '2025-03-01T10:30:00Z',
+                 'download_url': 'https://zoom.us/rec/download/f2'},
+            ],
+        }
+
+    def _response(self, status_code, payload=None):
+        return MagicMock(status_code=status_code, text='', json=lambda: payload or {})
+
+    def _recording_job(self):
+        return self.env['zoom.scheduled.job'].search([
+            ('meeting_id', '=', self.meeting.id),
+            ('job_type', '=', 'recordings'),
+        ])
+
+    def test_ingest_stores_all_files_once(self):
+        """Test: Se guardan todos los archivos y repetir el evento no duplica"""
+        Recording = self.env['zoom.recording']
+        recording = Recording._ingest(self.event_object)
+        Recording._ingest(self.event_object)
+
+        self.assertEqual(Recording.search_count([('uuid', '=', 'abc==')]), 1)
+        self.assertEqual(recording.meeting_id, self.meeting)
+        self.assertEqual(set(recording.file_ids.mapped('file_type')), {'MP4', 'M4A'})
+        self.assertEqual(recording.file_ids.filtered(lambda f: f.file_type == 'MP4').duration, 1800)
+        self.assertEqual(recording.total_size, 3500000000)
+        self.assertEqual(self._recording_job().state, 'done')
+
+    def test_download_url_minted_on_access(self):
+        """Test: El enlace de descarga se pide a Zoom al abrirlo, no se guarda"""
+        recording = self.env['zoom.recording']._ingest(self.event_object)
+        video = recording.file_ids.filtered(lambda f: f.file_type == 'MP4')
+        calls = []
+
+        def fake_request(config, method, path, **kwargs):
+            calls.append((path, kwargs.get('params')))
+            return self._response(200, {'download_access_token': 'tok'})
+
+        with patch.object(type(self.config), '_zoom_request', fake_request):
+            url = video._get_download_url()
+
+        self.assertEqual(url, 'https://zoom.us/rec/download/f1?access_token=tok')
+        self.assertEqual(calls[0][0], '/meetings/abc%3D%3D/recordings')
+        self.assertEqual(calls[0][1]['include_fields'], 'download_access_token')
+
+    def test_recording_job_backs_off_until_available(self):
+        """Test: Mientras Zoom procesa la grabación se espera cada vez más"""
+        job = self._recording_job()
+        self.assertEqual(job.state, 'pending')
+        job.due_at = fields.Datetime.now() - timedelta(minutes=1)
+
+        with patch.object(type(self.config), '_zoom_request', lambda *args, **kwargs: self._response(404)):
+            job._execute()
+        self.assertEqual(job.state, 'pending')
+        self.assertEqual(job.attempts, 1)
+        self.assertGreater(job.due_at, fields.Datetime.now() + timedelta(minutes=RECORDING_RETRY_MINUTES[0] - 1))
+
+        with patch.object(type(self.config), '_zoom_request',
+                          lambda *args, **kwargs: self._response(200, self.event_object)):
+            job._execute()
+        self.assertEqual(job.state, 'done')
+        self.assertEqual(len(self.meeting.recording_ids.file_ids), 2)
+
+    def test_recording_job_gives_up(self):
+        """Test: Sin grabación tras todos los intentos se deja de preguntar"""
+        job = self._recording_job()
+        job.attempts = len(RECORDING_RETRY_MINUTES)
+
+        with patch.object(type(self.config), '_zoom_request', lambda *args, **kwargs: self._response(404)):
+            job._execute()
+
+        self.assertEqual(job.state, 'done')
+
+    def test_helpdesk_ticket_uses_known_recording(self):
+        """Test: Un ticket con grabación conocida no vuelve a consultarla"""
+        team = self.env['helpdesk.team'].create({'name': 'Equipo Grabaciones'})
+        ticket = self.env['helpdesk.ticket'].create({'name': 'Ticket Grabado', 'team_id': team.id})
+        ticket.write({'zoom_meeting_id': '424242', 'zoom_created': True})
+
+        recording = self.env['zoom.recording']._ingest(self.event_object)
+
+        video = recording.file_ids.filtered(lambda f: f.file_type == 'MP4')
+        self.assertTrue(ticket.recording_available)
+        self.assertEqual(ticket.recording_url, f'/zoom/recording/file/{video.id}/download')
+
+    def test_webhook_signature(self):
+        """Test: La firma del webhook se calcula sobre v0:timestamp:cuerpo"""
+        timestamp = str(int(datetime.now().timestamp()))
+        body = '{"event": "recording.completed"}'
+        signature = 'v0=' + sign_webhook('secreto', f'v0:{timestamp}:{body}')
+
+        self.assertTrue(verify_webhook_signature('secreto', timestamp, body, signature))
+        self.assertFalse(verify_webhook_signature('otro', timestamp, body, signature))
+        self.assertFalse(verify_webhook_signature('secreto', '1000', body, signature))
+
+    def test_encode_meeting_uuid(self):
+        """Test: Los UUID con barras se codifican dos veces"""
+        self.assertEqual(encode_meeting_uuid('424242'), '424242')
+        self.assertEqual(encode_meeting_uuid('/ajXp112QmuoKj4854875=='), '%252FajXp112QmuoKj4854875%253D%253D')
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+
+from odoo import fields
+from odoo.exceptions import ValidationError
+from odoo.tests.common import TransactionCase
+from datetime import timedelta
+
+
+class TestZoomReminder(TransactionCase):
+    """Tests para los recordatorios automáticos con registro por asistente"""
+
+    def setUp(self):
+        super().setUp()
+        self.config = self.env['zoom.config'].get_config()
+        self.config.write({
+            'client_id': 'test_client_id',
+            'client_secret': 'test_client_secret',
+            'account_id': 'test_account_id',
+            'connection_status': 'connected',
+            'reminder_offsets': '1440,60',
+        })
+        self.Reminder = self.env['zoom.reminder']
+        self.template = self.env.ref('zoom18.email_template_meeting_reminder')
+
+    def _create_meeting(self, minutes_ahead, attendees=2):
+        meeting = self.env['zoom.meeting'].create({
+            'name': f'Reunión en {minutes_ahead} min',
+            'start_time': fields.Datetime.now() + timedelta(minutes=minutes_ahead),
+            'duration': 30,
+            'status': 'scheduled',
+        })
+        for index in range(attendees):
+            self.env['zoom.meeting.attendee'].create({
+                'meeting_id': meeting.id,
+                'name': f'Asistente {index}',
+                'email': f'asistente{index}@example.com',
+            })
+        meeting.attendee_ids.write({'status': 'confirmed'})
+        return meeting
+
+    def _reminder_mails(self, meeting):
+        return self.env['mail.mail'].search([
+            ('model', '=', 'zoom.meeting.attendee'),
+            ('res_id', 'in', meeting.attendee_ids.ids),
+            ('subject', 'ilike', 'Recordatorio'),
+        ])
+
+    def test_reminder_offsets_parsing(self):
+        """Test: Las antelaciones se leen de mayor a menor y se validan"""
+        self.assertEqual(self.config._get_reminder_offsets(), [1440, 60])
+        with self.assertRaises(ValidationError):
+            self.config.reminder_offsets = '60,una hora'
+
+    def test_reminders_outside_old_window_are_sent(self):
+        """Test: Una reunión a 40 minutos recibe su recordatorio de 1 hora"""
+        meeting = self._create_meeting(40)
+
+        self.env['zoom.meeting']._send_automatic_reminders()
+
+        reminders = self.Reminder.search([('meeting_id', '=', meeting.id)])
+        sent = reminders.filtered(lambda r: r.state == 'sent')
+        self.assertEqual(sent.mapped('offset_minutes'), [60, 60])
+        self.assertEqual(len(self._reminder_mails(meeting)), 2)
+        self.assertTrue(all(meeting.attendee_ids.mapped('reminder_sent')))
+
+    def test_only_nearest_due_reminder_is_sent(self):
+        """Test: Con varios recordatorios vencidos solo sale el más próximo"""
+        meeting = self._create_meeting(30, attendees=1)
+
+        self.env['zoom.meeting']._send_automatic_reminders()
+
+        reminders = self.Reminder.search([('meeting_id', '=', meeting.id)])
+        self.assertEqual(reminders.filtered(lambda r: r.offset_minutes == 60).state, 'sent')
+        self.assertEqual(reminders.filtered(lambda r: r.offset_minutes == 1440).state, 'skipped')
+        self.assertEqual(len(self._reminder_mails(meeting)), 1)
+
+    def test_rerun_does_not_send_twice(self):
+        """Test: Volver a ejecutar el cron no duplica recordatorios"""
+        meeting = self._create_meeting(40)
+
+        self.env['zoom.meeting']._send_automatic_reminders()
+        self.env['zoom.meeting']._send_automatic_reminders()
+
+        self.assertEqual(len(self.Reminder.search([('meeting_id', '=', meeting.id)])), 4)
+        self.assertEqual(len(self._reminder_mails(meeting)), 2)
+
+    def test_future_reminders_wait(self):
+        """Test: Los recordatorios no vencidos quedan pendientes"""
+        meeting = self._create_meeting(180)
+
+        self.env['zoom.meeting']._send_automatic_reminders()
+
+        reminders = self.Reminder.search([('meeting_id', '=', meeting.id)])
+        self.assertEqual(reminders.filtered(lambda r: r.offset_minutes == 1440).mapped('state'), ['sent', 'sent'])
+        self.assertEqual(reminders.filtered(lambda r: r.offset_minutes == 60).mapped('state'), ['pending', 'pending'])
+        self.assertEqual(len(self._reminder_mails(meeting)), 2)
+
+        # Si la reunión se adelanta, el recordatorio se reprograma
+        meeting.start_time = fields.Datetime.now() + timedelta(minutes=20)
+        self.env['zoom.meeting']._send_automatic_reminders()
+        self.assertEqual(reminders.filtered(lambda r: r.offset_minutes == 60).mapped('state'), ['sent', 'sent'])
+        self.assertEqual(len(self._reminder_mails(meeting)), 4)
+
+    def test_reminders_rendered_in_one_batch(self):
+        """Test: Los correos del lote se generan con una sola llamada y sin envío inmediato"""
+        meeting = self._create_meeting(40, attendees=5)
+        calls = []
+        send_mail_batch = type(self.template).send_mail_batch
+
+        def spy(template, res_ids, *args, **kwargs):
+            calls.append((list(res_ids), kwargs.get('force_send')))
+            return send_mail_batch(template, res_ids, *args, **kwargs)
+
+        with self.patch(type(self.template), 'send_mail_batch', spy):
+            self.env['zoom.meeting']._send_automatic_reminders()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(sorted(calls[0][0]), sorted(meeting.attendee_ids.ids))
+        self.assertFalse(calls[0][1])
+
+    def test_cancelled_meeting_reminders_skipped(self):
+        """Test: Los recordatorios pendientes de reuniones canceladas no se envían"""
+        meeting = self._create_meeting(180)
+        self.env['zoom.meeting']._send_automatic_reminders()
+
+        meeting.write({'status': 'cancelled', 'start_time': fields.Datetime.now() + timedelta(minutes=20)})
+        self.env['zoom.meeting']._send_automatic_reminders()
+
+        reminders = self.Reminder.search([('meeting_id', '=', meeting.id), ('offset_minutes', '=', 60)])
+        self.assertEqual(reminders.mapped('state'), ['skipped', 'skipped'])
+        self.assertEqual(len(self._reminder_mails(meeting)), 2)
@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+
+from odoo import fields
+from odoo.tests.common import TransactionCase, new_test_user
+from datetime import timedelta
+
+from odoo.addons.zoom18.models.zoom_scheduled_job import STATUS_GRACE_MINUTES
+
+
+class TestZoomScheduledJob(TransactionCase):
+    """Tests para los trabajos programados por hora de vencimiento"""
+
+    def setUp(self):
+        super().setUp()
+        self.config = self.env['zoom.config'].get_config()
+        self.config.write({
+            'client_id': 'test_client_id',
+            'client_secret': 'test_client_secret',
+            'account_id': 'test_account_id',
+            'connection_status': 'connected',
+            'reminder_offsets': '60',
+        })
+        self.Job = self.env['zoom.scheduled.job']
+
+    def _create_meeting(self, minutes_ahead, duration=30):
+        return self.env['zoom.meeting'].create({
+            'name': f'Reunión en {minutes_ahead} min',
+            'start_time': fields.Datetime.now() + timedelta(minutes=minutes_ahead),
+            'duration': duration,
+            'status': 'scheduled',
+        })
+
+    def _jobs(self, meeting, job_type=None):
+        domain = [('meeting_id', '=', meeting.id)]
+        if job_type:
+            domain.append(('job_type', '=', job_type))
+        return self.Job.search(domain)
+
+    def _add_confirmed_attendee(self, meeting, email='asistente@example.com'):
+        attendee = self.env['zoom.meeting.attendee'].create({
+            'meeting_id': meeting.id,
+            'name': 'Asistente',
+            'email': email,
+        })
+        attendee.status = 'confirmed'
+        return attendee
+
+    def test_jobs_created_with_meeting(self):
+        """Test: Al crear la reunión se programan recordatorio y cierre"""
+        meeting = self._create_meeting(180)
+
+        reminder = self._jobs(meeting, 'reminder')
+        finish = self._jobs(meeting, 'finish')
+        self.assertEqual(reminder.due_at, meeting.start_time - timedelta(minutes=60))
+        self.assertEqual(finish.due_at, meeting.start_time + timedelta(minutes=30 + STATUS_GRACE_MINUTES))
+        self.assertEqual(set((reminder | finish).mapped('state')), {'pending'})
+
+    def test_jobs_follow_meeting_changes(self):
+        """Test: Mover o cancelar la reunión reprograma o anula sus trabajos"""
+        meeting = self._create_meeting(180)
+
+        meeting.start_time = meeting.start_time + timedelta(hours=2)
+        self.assertEqual(self._jobs(meeting, 'reminder').due_at, meeting.start_time - timedelta(minutes=60))
+        self.assertEqual(len(self._jobs(meeting)), 2)
+
+        meeting.status = 'cancelled'
+        self.assertEqual(set(self._jobs(meeting).mapped('state')), {'cancelled'})
+
+    def test_offsets_change_reschedules(self):
+        """Test: Cambiar las antelaciones reprograma las reuniones futuras"""
+        meeting = self._create_meeting(180)
+
+        self.config.reminder_offsets = '1440,30'
+
+        reminders = self._jobs(meeting, 'reminder')
+        self.assertEqual(
+            {job.offset_minutes: job.state for job in reminders},
+            {1440: 'pending', 30: 'pending', 60: 'cancelled'},
+        )
+
+    def test_internal_user_schedules_jobs(self):
+        """Test: Un usuario interno crea, mueve y confirma reuniones aunque solo lea los trabajos"""
+        user = new_test_user(self.env, login='zoom_job_user', groups='base.group_user')
+        meeting = self.env['zoom.meeting'].with_user(user).create({
+            'name': 'Reunión de Usuario',
+            'start_time': fields.Datetime.now() + timedelta(minutes=180),
+            'duration': 30,
+            'status': 'scheduled',
+        })
+        self.assertEqual(len(self._jobs(meeting)), 2)
+
+        meeting.start_time = meeting.start_time - timedelta(minutes=150)
+        self.assertEqual(self._jobs(meeting, 'reminder').due_at, meeting.start_time - timedelta(minutes=60))
+        self.Job._run_due_jobs()
+        self.assertEqual(self._jobs(meeting, 'reminder').state, 'done')
+
+        attendee = self.env['zoom.meeting.attendee'].with_user(user).create({
+            'meeting_id': meeting.id,
+            'name': 'Asistente',
+            'email': 'asistente@example.com',
+        })
+        attendee.status = 'confirmed'
+        self.assertEqual(self._jobs(meeting, 'reminder').state, 'pending')
+
+    def test_due_reminder_job_sends_reminders(self):
+        """Test: El cron ejecuta solo los trabajos vencidos y no repite envíos"""
+        soon = self._create_meeting(40)
+        later = self._create_meeting(180)
+        self._add_confirmed_attendee(soon)
+        self._add_confirmed_attendee(later)
+
+        self.Job._run_due_jobs()
+
+        self.assertEqual(self._jobs(soon, 'reminder').state, 'done')
+        self.assertEqual(self._jobs(later, 'reminder').state, 'pending')
+        reminders = self.env['zoom.reminder'].search([('meeting_id', 'in', (soon | later).ids)])
+        self.assertEqual(reminders.filtered(lambda r: r.state == 'sent').meeting_id, soon)
+
+        self.Job._run_due_jobs()
+        self.assertEqual(len(reminders.filtered(lambda r: r.state == 'sent')), 1)
+
+    def test_late_confirmation_gets_reminder(self):
+        """Test: Un asistente confirmado después del recordatorio también lo recibe"""
+        meeting = self._create_meeting(40)
+        self._add_confirmed_attendee(meeting, 'primero@example.com')
+        self.Job._run_due_jobs()
+
+        late = self._add_confirmed_attendee(meeting, 'tarde@example.com')
+        self.assertEqual(self._jobs(meeting, 'reminder').state, 'pending')
+        self.Job._run_due_jobs()
+
+        reminders = self.env['zoom.reminder'].search([('meeting_id', '=', meeting.id)])
+        self.assertEqual(reminders.filtered(lambda r: r.attendee_id == late).state, 'sent')
+        self.assertEqual(len(reminders.filtered(lambda r: r.state == 'sent')), 2)
+
+    def test_finish_job_closes_active_meeting(self):
+        """Test: Una reunión en curso pasada su hora de fin se finaliza"""
+        meeting = self._create_meeting(-60, duration=30)
+        meeting.status = 'active'
+
+        self.Job._run_due_jobs()
+
+        self.assertEqual(meeting.status, 'finished')
+        self.assertEqual(self._jobs(meeting, 'finish').state, 'done')
+
+    def test_claim_only_due_jobs(self):
+        """Test: Solo se bloquean trabajos pendientes ya vencidos"""
+        soon = self._create_meeting(40)
+        later = self._create_meeting(180)
+
+        claimed = self.Job._claim_due(100)
+
+        self.assertIn(self._jobs(soon, 'reminder'), claimed)
+        self.assertFalse(claimed & self._jobs(later))
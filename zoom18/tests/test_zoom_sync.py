@@ -0,0 +1,267 @@
+# -*- coding: utf-8 -*-
+
+from odoo.tests.common import TransactionCase, new_test_user
+from odoo.tools import mute_logger
+from unittest.mock import patch, MagicMock
+from datetime import datetime
+
+
+class TestZoomSyncPipeline(TransactionCase):
+    """Tests para el pipeline de sincronización zoom.sync.pipeline"""
+
+    def setUp(self):
+        super().setUp()
+        self.pipeline = self.env['zoom.sync.pipeline']
+        self.zoom_meeting = self.env['zoom.meeting']
+        self.config = self.env['zoom.config'].create({
+            'client_id': 'test_client_id',
+            'client_secret': 'test_client_secret',
+            'account_id': 'test_account_id',
+            'access_token': 'test_token',
+        })
+        self.zoom_pages = [
+            {
+                'meetings': [
+                    {
+                        'id': 111,
+                        'topic': 'Reunión Uno',
+                        'start_time': '2030-01-15T10:00:00Z',
+                        'duration': 30,
+                        'join_url': 'https://zoom.us/j/111',
+                        'status': 'waiting',
+                    },
+                ],
+                'next_page_token': 'page2',
+            },
+            {
+                'meetings': [
+                    {
+                        'id': 222,
+                        'topic': 'Reunión Dos',
+                        'start_time': '2030-01-15T12:00:00-05:00',
+                        'duration': 45,
+                        'join_url': 'https://zoom.us/j/222',
+                        'status': 'started',
+                    },
+                ],
+                'next_page_token': '',
+            },
+        ]
+
+    def _mock_responses(self, pages):
+        responses = []
+        for page in pages:
+            response = MagicMock()
+            response.status_code = 200
+            response.json.return_value = page
+            responses.append(response)
+        return responses
+
+    def _run_sync(self, pages):
+        with patch('requests.get', side_effect=self._mock_responses(pages)) as mock_get, \
+                patch.object(type(self.config), '_ensure_access_token', return_value=None):
+            stats = self.pipeline.run_sync(self.config, trigger='test')
+        return stats, mock_get
+
+    def test_normalize_zoom_meeting(self):
+        """Test: Normalización de fechas y estados de Zoom"""
+        vals = self.pipeline._normalize_zoom_meeting(self.zoom_pages[1]['meetings'][0])
+
+        self.assertEqual(vals['meeting_id'], '222')
+        self.assertEqual(vals['start_time'], datetime(2030, 1, 15, 17, 0))
+        self.assertEqual(vals['status'], 'active')
+        self.assertIsNone(self.pipeline._normalize_zoom_meeting({'topic': 'Sin ID'}))
+
+    def test_sync_creates_meetings_from_all_pages(self):
+        """Test: La sincronización recorre todas las páginas y crea las reuniones"""
+        stats, mock_get = self._run_sync(self.zoom_pages)
+
+        self.assertEqual(mock_get.call_count, 2)
+        self.assertEqual(stats['fetched'], 2)
+        self.assertEqual(stats['created'], 2)
+        meetings = self.zoom_meeting.search([('meeting_id', 'in', ['111', '222'])])
+        self.assertEqual(len(meetings), 2)
+        self.assertTrue(all(meetings.mapped('calendar_event_id')))
+        self.assertEqual(meetings.filtered(lambda m: m.meeting_id == '111').status, 'scheduled')
+
+    def test_sync_is_idempotent(self):
+        """Test: Una segunda sincronización sin cambios no escribe nada"""
+        self._run_sync(self.zoom_pages)
+        stats, _mock_get = self._run_sync(self.zoom_pages)
+
+        self.assertEqual(stats['created'], 0)
+        self.assertEqual(stats['updated'], 0)
+        self.assertEqual(stats['unchanged'], 2)
+
+    def test_sync_updates_changed_meetings(self):
+        """Test: Los cambios en Zoom se aplican y se propagan al calendario"""
+        self._run_sync(self.zoom_pages)
+        self.zoom_pages[0]['meetings'][0]['topic'] = 'Reunión Renombrada'
+        stats, _mock_get = self._run_sync(self.zoom_pages)
+
+        self.assertEqual(stats['updated'], 1)
+        meeting = self.zoom_meeting.search([('meeting_id', '=', '111')])
+        self.assertEqual(meeting.name, 'Reunión Renombrada')
+        self.assertEqual(meeting.calendar_event_id.name, 'Reunión Renombrada')
+
+    def test_sync_records_run(self):
+        """Test: Cada sincronización queda registrada con sus contadores"""
+        self._run_sync(self.zoom_pages)
+
+        run = self.env['zoom.sync.run'].search([('config_id', '=', self.config.id)])
+        self.assertEqual(len(run), 1)
+        self.assertEqual(run.state, 'done')
+        self.assertEqual(run.pages_done, 2)
+        self.assertEqual(run.created_count, 2)
+        self.assertFalse(run.page_token)
+
+    def test_sync_resumes_interrupted_run(self):
+        """Test: Una ejecución interrumpida continúa desde su último token de página"""
+        run = self.env['zoom.sync.run'].create({
+            'config_id': self.config.id,
+            'trigger': 'cron',
+            'page_token': 'page2',
+            'pages_done': 1,
+            'fetched_count': 1,
+        })
+        stats, mock_get = self._run_sync(self.zoom_pages[1:])
+
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertEqual(mock_get.call_args.kwargs['params']['next_page_token'], 'page2')
+        self.assertEqual(stats['fetched'], 2)
+        self.assertEqual(run.state, 'done')
+        self.assertEqual(run.resume_count, 1)
+        self.assertFalse(self.zoom_meeting.search([('meeting_id', '=', '111')]))
+
+    def test_manual_sync_as_internal_user(self):
+        """Test: Un usuario interno sin permisos de administración puede sincronizar"""
+        user = new_test_user(self.env, login='zoom_sync_user', groups='base.group_user')
+        self.pipeline = self.pipeline.with_user(user)
+        self.config = self.config.with_user(user)
+
+        stats, _mock_get = self._run_sync(self.zoom_pages)
+
+        self.assertEqual(stats['created'], 2)
+        run = self.env['zoom.sync.run'].search([('config_id', '=', self.config.id)])
+        self.assertEqual(run.state, 'done')
+        self.assertEqual(run.pages_done, 2)
+
+    def test_sync_limit_processes_in_batches(self):
+        """Test: Con límite, la ejecución se detiene tras el lote y la siguiente llamada continúa"""
+        with patch('requests.get', side_effect=self._mock_responses(self.zoom_pages)) as mock_get, \
+                patch.object(type(self.config), '_ensure_access_token', return_value=None):
+            first = self.pipeline.run_sync(self.config, trigger='cron', limit=1)
+            second = self.pipeline.run_sync(self.config, trigger='cron', limit=1)
+
+        self.assertEqual(mock_get.call_count, 2)
+        self.assertEqual((first['processed'], first['remaining']), (1, 1))
+        self.assertEqual((second['processed'], second['remaining']), (1, 0))
+        run = self.env['zoom.sync.run'].search([('config_id', '=', self.config.id)])
+        self.assertEqual(len(run), 1)
+        self.assertEqual(run.state, 'done')
+        self.assertEqual(run.created_count, 2)
+
+
+class TestZoomAccountSync(TransactionCase):
+    """Tests para la sincronización de todos los anfitriones de la cuenta"""
+
+    def setUp(self):
+        super().setUp()
+        self.pipeline = self.env['zoom.sync.pipeline']
+        self.config = self.env['zoom.config'].create({
+            'client_id': 'test_client_id',
+            'client_secret': 'test_client_secret',
+            'account_id': 'test_account_id',
+            'access_token': 'test_token',
+            'sync_scope': 'account',
+            'sync_max_workers': 2,
+        })
+        users_response = MagicMock()
+        users_response.status_code = 200
+        users_response.json.return_value = {
+            'users': [
+                {'id': 'u1', 'email': 'host1@example.com', 'first_name': 'Host', 'last_name': 'Uno', 'status': 'active'},
+                {'id': 'u2', 'email': 'host2@example.com', 'first_name': 'Host', 'last_name': 'Dos', 'status': 'active'},
+            ],
+            'next_page_token': '',
+        }
+        self.users_response = users_response
+        self.host_meetings = {
+            'u1': [[{'id': 901, 'topic': 'Reunión Host 1', 'start_time': '2030-02-01T09:00:00Z', 'duration': 30}]],
+            'u2': [[{'id': 902, 'topic': 'Reunión Host 2', 'start_time': '2030-02-01T10:00:00Z', 'duration': 30}]],
+        }
+
+    def _run_sync(self):
+        fetched = []
+
+        def fake_fetch(base_url, headers, zoom_user_id, breaker=None, metrics=None):
+            fetched.append(zoom_user_id)
+            return self.host_meetings[zoom_user_id]
+
+        with patch('requests.get', return_value=self.users_response), \
+                patch('odoo.addons.zoom18.models.zoom_sync.fetch_host_meetings', side_effect=fake_fetch), \
+                patch.object(type(self.config), '_ensure_access_token', return_value=None):
+            stats = self.pipeline.run_sync(self.config, trigger='test')
+        return stats, fetched
+
+    def test_account_sync_records_hosts(self):
+        """Test: Se sincronizan las reuniones de todos los anfitriones"""
+        stats, fetched = self._run_sync()
+
+        self.assertEqual(sorted(fetched), ['u1', 'u2'])
+        self.assertEqual(stats['created'], 2)
+        meeting = self.env['zoom.meeting'].search([('meeting_id', '=', '901')])
+        self.assertEqual(meeting.host_id.email, 'host1@example.com')
+        self.assertEqual(set(self.config.host_ids.mapped('last_sync_cycle')), {self.config.sync_cycle})
+
+    def test_account_sync_as_internal_user(self):
+        """Test: Un usuario interno puede sincronizar la cuenta y sus anfitriones"""
+        user = new_test_user(self.env, login='zoom_account_sync_user', groups='base.group_user')
+        self.pipeline = self.pipeline.with_user(user)
+        self.config = self.config.with_user(user)
+
+        stats, _fetched = self._run_sync()
+
+        self.assertEqual(stats['created'], 2)
+        self.assertEqual(set(self.config.host_ids.mapped('last_sync_cycle')), {self.config.sync_cycle})
+
+    def test_account_sync_host_database_error(self):
+        """Test: Un error de base de datos en un anfitrión no aborta a los demás"""
+        Pipeline = type(self.pipeline)
+        original = Pipeline._sync_process_page
+
+        def failing(pipeline, config, trigger, page, stats, host=None):
+            if host.zoom_user_id == 'u1':
+                pipeline.env.cr.execute("SELECT 1 / 0")
+            return original(pipeline, config, trigger, page, stats, host=host)
+
+        with mute_logger('odoo.sql_db'), patch.object(Pipeline, '_sync_process_page', failing):
+            stats, _fetched = self._run_sync()
+
+        self.assertEqual(stats['created'], 1)
+        self.assertTrue(self.env['zoom.meeting'].search([('meeting_id', '=', '902')]))
+        hosts = {host.zoom_user_id: host for host in self.config.host_ids}
+        self.assertIn('division by zero', hosts['u1'].sync_error)
+        self.assertFalse(hosts['u2'].sync_error)
+
+    def test_account_sync_resumes_pending_hosts(self):
+        """Test: Una ejecución interrumpida continúa con los anfitriones pendientes"""
+        self._run_sync()
+        # Simular un nuevo ciclo interrumpido después del primer anfitrión
+        self.config.sync_cycle += 1
+        self.config.host_ids.filtered(lambda h: h.zoom_user_id == 'u1').last_sync_cycle = self.config.sync_cycle
+
+        _stats, fetched = self._run_sync()
+
+        self.assertEqual(fetched, ['u2'])
+
+    def test_account_sync_partitions(self):
+        """Test: Cada partición de cron solo procesa sus anfitriones"""
+        self._run_sync()
+        self.config.sync_partitions = 2
+        hosts = self.config.host_ids
+        partition_0 = hosts._in_partition(0, 2)
+        partition_1 = hosts._in_partition(1, 2)
+
+        self.assertEqual(partition_0 | partition_1, hosts)
+        self.assertFalse(partition_0 & partition_1)
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+
+from odoo.addons.zoom18.models.zoom_config import ZOOM_PAGE_SIZE
+from odoo.addons.zoom18.tests.common import ZoomFakeServerCase
+
+
+class TestZoomSyncTelemetry(ZoomFakeServerCase):
+    """Tests para los tiempos por etapa de las sincronizaciones"""
+
+    fake_zoom_options = {'users': 2, 'meetings_per_user': ZOOM_PAGE_SIZE + 20, 'participants_per_meeting': 0}
+
+    def _last_run(self):
+        return self.env['zoom.sync.run'].search([('config_id', '=', self.config.id)], limit=1)
+
+    def _alert_mails(self):
+        return self.env['mail.mail'].search([('email_to', '=', 'alertas@example.com')])
+
+    def test_spans_per_page(self):
+        """Test: Cada página guarda el tiempo de sus etapas"""
+        self.env['zoom.sync.pipeline'].run_sync(self.config, trigger='test')
+
+        run = self._last_run()
+        self.assertEqual(set(run.span_ids.mapped('page')), {0, 1})
+        first_page = run.span_ids.filtered(lambda span: span.page == 0)
+        self.assertTrue({'fetch', 'normalize', 'diff', 'write', 'calendar'} <= set(first_page.mapped('stage')))
+        self.assertEqual(first_page.filtered(lambda span: span.stage == 'write').item_count, ZOOM_PAGE_SIZE)
+        self.assertTrue(run.stage_summary.startswith('fetch '))
+        self.assertFalse(run.is_slow)
+
+    def test_account_spans_per_host(self):
+        """Test: Con alcance de cuenta los tiempos se guardan por anfitrión"""
+        self.config.write({'sync_scope': 'account', 'sync_max_workers': 2})
+
+        self.env['zoom.sync.pipeline'].run_sync(self.config, trigger='test')
+
+        fetch_spans = self._last_run().span_ids.filtered(lambda span: span.stage == 'fetch')
+        self.assertEqual(len(fetch_spans.host_id), 2)
+        self.assertEqual(fetch_spans.mapped('item_count'), [ZOOM_PAGE_SIZE + 20] * 2)
+
+    def test_slow_run_alert(self):
+        """Test: Superar el umbral marca la ejecución y avisa por email"""
+        self.config.write({'sync_slow_threshold': 60, 'sync_alert_email': 'alertas@example.com'})
+        run = self.env['zoom.sync.run']._start(self.config, 'test')
+        spans = [{'page': 0, 'stage': 'fetch', 'duration': 50.0, 'item_count': 10},
+                 {'page': 0, 'stage': 'write', 'duration': 25.0, 'item_count': 10}]
+
+        with self.assertLogs('odoo.addons.zoom18.models.zoom_sync_run', level='WARNING') as logs:
+            run._finish(run._get_stats(), 75.0, spans=spans)
+
+        self.assertTrue(run.is_slow)
+        self.assertIn('etapa más lenta: fetch', logs.output[0])
+        self.assertEqual(len(self._alert_mails()), 1)
+
+    def test_slow_threshold_disabled(self):
+        """Test: Con umbral 0 no se marca ninguna ejecución como lenta"""
+        self.config.write({'sync_slow_threshold': 0, 'sync_alert_email': 'alertas@example.com'})
+        run = self.env['zoom.sync.run']._start(self.config, 'test')
+
+        run._finish(run._get_stats(), 5000.0)
+
+        self.assertFalse(run.is_slow)
+        self.assertFalse(self._alert_mails())
+
+    def test_dashboard_timeline(self):
+        """Test: El dashboard dibuja las últimas ejecuciones por etapa"""
+        self.config.write({'sync_slow_threshold': 1})
+        run = self.env['zoom.sync.run']._start(self.config, 'test')
+        run._finish(run._get_stats(), 2.0, spans=[{'page': 0, 'stage': 'fetch', 'duration': 2.0, 'item_count': 1}])
+
+        values = self.env['zoom.dashboard'].default_get(['sync_timeline_html', 'slow_runs_7d'])
+
+        self.assertIn('fetch: 2.00 s', values['sync_timeline_html'])
+        self.assertIn('lenta', values['sync_timeline_html'])
+        self.assertEqual(values['slow_runs_7d'], 1)